@@ -7,23 +7,42 @@ Use this if the multi-file structure causes problems.
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from contextlib import asynccontextmanager
 from pydantic import BaseModel
 from typing import List, Optional, Dict
 from datetime import datetime
 import os
 import sys
-import json
-import subprocess
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Get project root (parent of backend) and make execution scripts importable
+backend_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(backend_dir)
+sys.path.insert(0, os.path.join(project_root, 'execution'))
+
+from env import load_env
+
+# Load environment variables (before any module reads its configuration)
+load_env()
+
+from research_pool import ResearchWorkerPool
+
+# Pre-warmed workers that run the research pipeline in-process
+research_pool = ResearchWorkerPool()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    research_pool.start()  # Pay worker startup before the first request
+    yield
+    research_pool.shutdown()
+
 
 # Initialize FastAPI app
 app = FastAPI(
     title='Fisher Research API',
     description='API for Fisher research using Scuttlebutt methodology',
-    version='1.0.0'
+    version='1.0.0',
+    lifespan=lifespan
 )
 
 # CORS configuration
@@ -63,29 +82,12 @@ class FisherResearchResponse(BaseModel):
 
 # Helper function to run research
 def run_research(company_name: str, ticker: Optional[str] = None, max_results: int = 5) -> Dict:
-    """Run Scuttlebutt research using subprocess (simplest, most reliable)."""
-    # Get project root (parent of backend)
-    backend_dir = os.path.dirname(__file__)
-    project_root = os.path.dirname(backend_dir)
-    script_path = os.path.join(project_root, 'execution', 'run_scuttlebutt_company.py')
-    
-    cmd = [sys.executable, script_path, company_name]
-    if ticker:
-        cmd.extend(['--ticker', ticker])
-    cmd.extend(['--max-results', str(max_results)])
-    
-    process = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        timeout=300,
-        cwd=project_root  # Run from project root
+    """Run Scuttlebutt research in a pooled worker process."""
+    return research_pool.run(
+        company_name=company_name,
+        ticker=ticker,
+        max_results_per_bucket=max_results
     )
-    
-    if process.returncode != 0:
-        raise Exception(f'Research failed: {process.stderr}')
-    
-    return json.loads(process.stdout)
 
 
 # Routes
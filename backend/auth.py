@@ -0,0 +1,23 @@
+"""
+Admin Token
+
+Routes that write to the backend's stores (screener index, Fisher score
+index, price history) require an X-Admin-Token header matching ADMIN_TOKEN.
+While ADMIN_TOKEN is unset those routes are disabled.
+"""
+
+import os
+import hmac
+from typing import Optional
+
+from fastapi import Header, HTTPException
+
+ADMIN_TOKEN = os.getenv('ADMIN_TOKEN', '')
+
+
+def require_admin_token(x_admin_token: Optional[str] = Header(None)) -> None:
+    """Reject a write without a valid X-Admin-Token (use as a route dependency)."""
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail='Updates are disabled (ADMIN_TOKEN is not set)')
+    if not x_admin_token or not hmac.compare_digest(x_admin_token.encode(), ADMIN_TOKEN.encode()):
+        raise HTTPException(status_code=401, detail='Invalid or missing X-Admin-Token')
@@ -0,0 +1,27 @@
+"""
+Gunicorn configuration for multi-worker deployments.
+
+    gunicorn -c backend/gunicorn.conf.py backend.main:app
+
+The app is imported once in the master with PRELOAD_APP=true, which loads
+the indexes and research pipeline before the workers are forked, so workers
+start serving immediately and share those pages copy-on-write. Nothing
+started at import (threads, research pool processes) crosses the fork: the
+research pool and background refreshes start lazily inside each worker.
+
+Workers keep their own in-memory copies of the persisted state and share the
+files: the research store re-reads an entry whose file another worker has
+rewritten, and the screener and Fisher score indexes merge newer rows from
+disk under a file lock before saving. Updates posted to one worker's index
+reach the others' memory on their next save or restart.
+"""
+
+import os
+
+os.environ.setdefault('PRELOAD_APP', 'true')
+
+bind = f"{os.getenv('HOST', '0.0.0.0')}:{os.getenv('PORT', 8000)}"
+workers = int(os.getenv('WEB_CONCURRENCY', 2))
+worker_class = 'uvicorn.workers.UvicornWorker'
+preload_app = True
+timeout = int(os.getenv('GUNICORN_TIMEOUT', 300))  # Uncached research can take minutes
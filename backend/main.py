@@ -2,23 +2,111 @@
 FastAPI Backend for Fisher Research
 
 Main application entry point.
+
+Importing the app is kept cheap: the research pipeline and the persisted
+indexes are loaded on first use. With PRELOAD_APP=true (set by
+backend/gunicorn.conf.py) they are loaded at import instead, so a preloading
+server loads them once before forking and workers share the pages.
 """
 
+import os
+import asyncio
+from contextlib import asynccontextmanager
+
+from execution.env import load_env
+
+# Load environment variables before any module reads its configuration
+load_env()
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-import os
-from dotenv import load_dotenv
 
-from backend.routes import fisher
+from backend.middleware.admission import (
+    ADMISSION_RESEARCH_CONCURRENCY,
+    ADMISSION_RESEARCH_QUEUE,
+    ADMISSION_SEC_CONCURRENCY,
+    ADMISSION_SEC_QUEUE,
+    AdmissionMiddleware,
+    RouteClass,
+)
+from backend.middleware.http_cache import HTTPCacheMiddleware
+from backend.middleware.metrics import EVENT_LOOP_LAG_INTERVAL, MetricsMiddleware, monitor_event_loop_lag
+from backend.routes import fisher, fisher_scores, fundamentals, metrics, prices, quotes, screener, valuation
+from backend.services.fisher_scores import get_fisher_score_index
+from backend.services.fmp import close_client as close_fmp_client
+from backend.services.fundamentals import FUNDAMENTALS_CACHE_TTL_SECONDS
+from backend.services.quotes import QUOTE_CACHE_TTL_SECONDS
+from backend.services.screener import SCREENER_SAVE_INTERVAL, get_screener_index, save_screener_index_periodically
+from backend.services.scuttlebutt import get_research_runner
+
+PRELOAD_APP = os.getenv('PRELOAD_APP', 'false').lower() == 'true'
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Run the event-loop lag monitor (event_loop_lag_seconds on /metrics) and the
+    periodic screener index save while serving.
+    """
+    monitor = asyncio.create_task(monitor_event_loop_lag()) if EVENT_LOOP_LAG_INTERVAL > 0 else None
+    screener_saver = asyncio.create_task(save_screener_index_periodically()) if SCREENER_SAVE_INTERVAL > 0 else None
+    yield
+    if monitor:
+        monitor.cancel()
+    if screener_saver:
+        screener_saver.cancel()
+        await asyncio.get_running_loop().run_in_executor(None, get_screener_index().save_if_changed)
+    await close_fmp_client()
 
-# Load environment variables
-load_dotenv()
 
 # Initialize FastAPI app
 app = FastAPI(
     title='Fisher Research API',
     description='API for Fisher research using Scuttlebutt methodology',
-    version='1.0.0'
+    version='1.0.0',
+    lifespan=lifespan
+)
+
+# ETags, 304s, per-route Cache-Control and gzip/brotli compression.
+# Research GETs set their own max-age from the stored result's age.
+app.add_middleware(
+    HTTPCacheMiddleware,
+    policies=[
+        ('/fisher-research/roe/sources/', 'no-store'),
+        ('/fisher-research/roe/', 'public, max-age=86400'),  # Financials change quarterly
+        ('/fisher-research/store/', 'no-store'),
+        ('/fisher-scores/stats', 'no-store'),
+        ('/fisher-scores', 'public, max-age=300'),
+        ('/screener/stats', 'no-store'),
+        ('/screener', 'public, max-age=60'),
+        ('/prices', 'public, max-age=60'),
+        ('/quotes/stats', 'no-store'),
+        ('/quotes', f'public, max-age={int(QUOTE_CACHE_TTL_SECONDS)}'),
+        ('/fundamentals/stats', 'no-store'),
+        ('/fundamentals', f'public, max-age={int(FUNDAMENTALS_CACHE_TTL_SECONDS)}'),
+        ('/health', 'no-store'),
+        ('/metrics', 'no-store'),
+    ]
+)
+
+# Concurrency limits with fair per-client queues for routes that fan out to
+# Tavily/LLM or SEC; overload is answered with 429/503 and Retry-After
+research_admission = RouteClass(
+    'research', ADMISSION_RESEARCH_CONCURRENCY, ADMISSION_RESEARCH_QUEUE,
+    exempt=fisher.answered_from_store  # Stored results and their 304s skip the queue
+)
+sec_admission = RouteClass('sec', ADMISSION_SEC_CONCURRENCY, ADMISSION_SEC_QUEUE)
+app.add_middleware(
+    AdmissionMiddleware,
+    routes=[
+        ('GET', '/fisher-research/roe/sources/', None),
+        ('GET', '/fisher-research/roe/', sec_admission),
+        ('GET', '/fisher-research/store/', None),
+        ('*', '/fisher-research', research_admission),
+        ('POST', '/fisher-scores/sec/', sec_admission),
+        ('GET', '/fundamentals/stats', None),
+        ('GET', '/fundamentals/', sec_admission),  # Resolves ROE alongside the FMP calls
+    ]
 )
 
 # CORS configuration
@@ -33,8 +121,18 @@ app.add_middleware(
     allow_headers=['*'],
 )
 
+# Added last so request timings include the other middleware
+app.add_middleware(MetricsMiddleware)
+
 # Include routers
 app.include_router(fisher.router)
+app.include_router(fisher_scores.router)
+app.include_router(valuation.router)
+app.include_router(screener.router)
+app.include_router(prices.router)
+app.include_router(quotes.router)
+app.include_router(fundamentals.router)
+app.include_router(metrics.router)
 
 
 @app.get('/')
@@ -53,6 +151,18 @@ async def health():
     return {'status': 'healthy'}
 
 
+def warm_up() -> None:
+    """Do the deferred startup work now: load the indexes and the research pipeline."""
+    get_screener_index()
+    get_fisher_score_index()
+    get_research_runner()
+    app.openapi()  # Schema is otherwise built on the first /docs request
+
+
+if PRELOAD_APP:
+    warm_up()
+
+
 if __name__ == '__main__':
     import uvicorn
     
@@ -0,0 +1,240 @@
+"""
+Admission Control Middleware
+
+Limits how many requests of an expensive route class (research runs, SEC
+lookups) execute at once. Requests over the limit wait in a bounded queue;
+when a slot frees up the next waiter is taken round-robin across clients, so
+one client sending a burst cannot starve everyone else. Requests are turned
+away quickly instead of piling up:
+
+- 429 when the client already has ADMISSION_MAX_QUEUED_PER_CLIENT waiting
+- 503 when the queue is full, when the expected wait (queue position times the
+  recent mean service time) exceeds the deadline, or when the deadline passes
+
+Rejections carry Retry-After, estimated from the queue length and the mean
+service time. A route class can exempt requests that will be answered without
+the expensive work (e.g. from a stored result), so cache hits neither wait
+behind long runs nor pull the mean service time down. Everything runs on the event loop, so no locks are needed;
+limits are per worker process.
+"""
+
+import os
+import math
+import time
+import asyncio
+from collections import OrderedDict, deque
+from typing import Callable, Deque, List, Optional, Tuple
+
+from backend.responses import dumps
+from execution import telemetry
+
+ADMISSION_RESEARCH_CONCURRENCY = int(os.getenv('ADMISSION_RESEARCH_CONCURRENCY', 4))
+ADMISSION_RESEARCH_QUEUE = int(os.getenv('ADMISSION_RESEARCH_QUEUE', 16))
+ADMISSION_SEC_CONCURRENCY = int(os.getenv('ADMISSION_SEC_CONCURRENCY', 8))
+ADMISSION_SEC_QUEUE = int(os.getenv('ADMISSION_SEC_QUEUE', 32))
+ADMISSION_QUEUE_TIMEOUT = float(os.getenv('ADMISSION_QUEUE_TIMEOUT', 30))  # Seconds a request may wait for a slot
+ADMISSION_MAX_QUEUED_PER_CLIENT = int(os.getenv('ADMISSION_MAX_QUEUED_PER_CLIENT', 4))
+# Header identifying the client behind a reverse proxy (e.g. x-forwarded-for); unset = socket peer address
+ADMISSION_CLIENT_HEADER = os.getenv('ADMISSION_CLIENT_HEADER', '').lower()
+# Trusted proxies that append to ADMISSION_CLIENT_HEADER; the client is that many entries from the right
+ADMISSION_PROXY_HOPS = int(os.getenv('ADMISSION_PROXY_HOPS', 1))
+
+ACTIVE = telemetry.REGISTRY.gauge('admission_active', 'Requests executing per route class', ['route_class'])
+QUEUED = telemetry.REGISTRY.gauge('admission_queued', 'Requests waiting for a slot per route class', ['route_class'])
+WAIT = telemetry.REGISTRY.histogram('admission_wait_seconds', 'Time admitted requests waited for a slot', ['route_class'])
+REJECTED = telemetry.REGISTRY.counter('admission_rejected_total', 'Requests turned away by admission control', ['route_class', 'reason'])
+
+
+class Rejected(Exception):
+    def __init__(self, status: int, reason: str, retry_after: int):
+        super().__init__(reason)
+        self.status = status
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class RouteClass:
+    """
+    Concurrency limit and fair wait queue for one class of routes.
+
+    Args:
+        name: Label in metrics and rejection messages
+        max_concurrency: Requests executing at once
+        max_queued: Requests waiting at once (0 = reject as soon as all slots are busy)
+        queue_timeout: Seconds a request may wait for a slot
+        max_queued_per_client: Requests one client may have waiting
+        exempt: Optional exempt(scope) -> bool; True lets a request through
+            without a slot (it is not counted in the mean service time either)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrency: int,
+        max_queued: int,
+        queue_timeout: float = ADMISSION_QUEUE_TIMEOUT,
+        max_queued_per_client: int = ADMISSION_MAX_QUEUED_PER_CLIENT,
+        exempt: Optional[Callable[[dict], bool]] = None
+    ):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_queued = max_queued
+        self.queue_timeout = queue_timeout
+        self.max_queued_per_client = max_queued_per_client
+        self.exempt = exempt
+        self.active = 0
+        self.queued = 0
+        # Client -> its waiters, in round-robin order (the next client to serve is first)
+        self._waiters: 'OrderedDict[str, Deque[asyncio.Future]]' = OrderedDict()
+        self._mean_service_seconds: Optional[float] = None
+
+    def _retry_after(self) -> int:
+        """Seconds until a slot is likely free: work ahead of a new request divided by the slots."""
+        service = self._mean_service_seconds or 1.0
+        return max(1, math.ceil(service * (self.queued + 1) / self.max_concurrency))
+
+    def _reject(self, status: int, reason: str) -> Rejected:
+        REJECTED.inc(route_class=self.name, reason=reason)
+        return Rejected(status, reason, self._retry_after())
+
+    async def acquire(self, client: str) -> None:
+        """Wait for a slot (raises Rejected when the request should be turned away)."""
+        if self.active < self.max_concurrency and not self.queued:
+            self._set_active(self.active + 1)
+            return
+
+        if len(self._waiters.get(client, ())) >= self.max_queued_per_client:
+            raise self._reject(429, 'client_queue_full')
+        if self.queued >= self.max_queued:
+            raise self._reject(503, 'queue_full')
+        if self._mean_service_seconds is not None and self._retry_after() > self.queue_timeout:
+            raise self._reject(503, 'overloaded')  # Would time out anyway; fail now
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(client, deque()).append(waiter)
+        self._set_queued(self.queued + 1)
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), self.queue_timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                self.release(0.0, count_service=False)  # The slot was handed over as we gave up
+            else:
+                waiter.cancel()
+                self._remove(client, waiter)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            raise self._reject(503, 'timeout')
+        WAIT.observe(time.perf_counter() - start, route_class=self.name)
+
+    def release(self, service_seconds: float, count_service: bool = True) -> None:
+        """Free a slot, handing it to the next client's oldest waiter if anyone is queued."""
+        if count_service:
+            # Exponentially weighted, so Retry-After follows changes in upstream latency
+            previous = self._mean_service_seconds
+            self._mean_service_seconds = service_seconds if previous is None else 0.8 * previous + 0.2 * service_seconds
+        while self._waiters:
+            client, waiters = next(iter(self._waiters.items()))
+            waiter = waiters.popleft()
+            if waiters:
+                self._waiters.move_to_end(client)
+            else:
+                del self._waiters[client]
+            self._set_queued(self.queued - 1)
+            if not waiter.done():
+                waiter.set_result(None)  # Slot passes to the waiter; active is unchanged
+                return
+        self._set_active(self.active - 1)
+
+    def _remove(self, client: str, waiter: asyncio.Future) -> None:
+        waiters = self._waiters.get(client)
+        if waiters is not None and waiter in waiters:
+            waiters.remove(waiter)
+            if not waiters:
+                del self._waiters[client]
+            self._set_queued(self.queued - 1)
+
+    def _set_active(self, value: int) -> None:
+        self.active = value
+        ACTIVE.set(value, route_class=self.name)
+
+    def _set_queued(self, value: int) -> None:
+        self.queued = value
+        QUEUED.set(value, route_class=self.name)
+
+
+def _client_id(scope) -> str:
+    """
+    Client address for per-client queues.
+
+    Entries left of the ones our proxies appended are whatever the client sent,
+    so the client is taken ADMISSION_PROXY_HOPS entries from the right. With
+    fewer entries the request did not come through the proxies; the socket
+    peer address is used.
+    """
+    if ADMISSION_CLIENT_HEADER:
+        header = ADMISSION_CLIENT_HEADER.encode()
+        entries = [
+            entry.strip()
+            for name, value in scope['headers'] if name == header
+            for entry in value.decode('latin-1').split(',')
+        ]
+        if ADMISSION_PROXY_HOPS > 0 and len(entries) >= ADMISSION_PROXY_HOPS and entries[-ADMISSION_PROXY_HOPS]:
+            return entries[-ADMISSION_PROXY_HOPS]
+    client = scope.get('client')
+    return client[0] if client else 'unknown'
+
+
+class AdmissionMiddleware:
+    """
+    Pure ASGI middleware. Add it inside CORSMiddleware so rejections carry CORS headers.
+
+    Args:
+        app: ASGI app
+        routes: (method or '*', path prefix, RouteClass or None) tuples; the
+            first match wins and None means not admission-controlled
+    """
+
+    def __init__(self, app, routes: List[Tuple[str, str, Optional[RouteClass]]] = ()):
+        self.app = app
+        self.routes = list(routes)
+
+    def _route_class(self, method: str, path: str) -> Optional[RouteClass]:
+        for route_method, prefix, route_class in self.routes:
+            if route_method in ('*', method) and path.startswith(prefix):
+                return route_class
+        return None
+
+    async def __call__(self, scope, receive, send):
+        route_class = self._route_class(scope['method'], scope['path']) if scope['type'] == 'http' else None
+        if route_class is None or (route_class.exempt is not None and route_class.exempt(scope)):
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await route_class.acquire(_client_id(scope))
+        except Rejected as e:
+            await self._send_rejection(send, route_class, e)
+            return
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            route_class.release(time.perf_counter() - start)
+
+    @staticmethod
+    async def _send_rejection(send, route_class: RouteClass, rejection: Rejected) -> None:
+        detail = 'Too many requests from this client' if rejection.status == 429 else f'Server busy ({route_class.name})'
+        body = dumps({'detail': f'{detail}, retry in {rejection.retry_after} s', 'reason': rejection.reason})
+        await send({
+            'type': 'http.response.start',
+            'status': rejection.status,
+            'headers': [
+                (b'content-type', b'application/json'),
+                (b'content-length', str(len(body)).encode()),
+                (b'retry-after', str(rejection.retry_after).encode()),
+                (b'cache-control', b'no-store'),
+            ],
+        })
+        await send({'type': 'http.response.body', 'body': body})
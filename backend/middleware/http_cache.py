@@ -0,0 +1,196 @@
+"""
+HTTP Caching and Compression Middleware
+
+For every buffered (non-streaming) response:
+- adds a strong ETag derived from the body (or keeps one the route set from
+  a data version) and answers a matching If-None-Match on GET/HEAD with 304
+- sets Cache-Control from the first matching route policy, unless the route
+  already set one (e.g. from the age of a research result)
+- compresses bodies above COMPRESSION_MIN_BYTES with brotli (when installed)
+  or gzip, depending on Accept-Encoding
+
+Streaming responses (more than one body chunk) are passed through untouched.
+"""
+
+import os
+import gzip
+import hashlib
+from typing import List, Optional, Tuple
+
+from execution import telemetry
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSION_MIN_BYTES = int(os.getenv('COMPRESSION_MIN_BYTES', 1024))
+GZIP_LEVEL = int(os.getenv('GZIP_LEVEL', 6))
+BROTLI_QUALITY = int(os.getenv('BROTLI_QUALITY', 5))  # 4-6 keeps brotli faster than gzip -9 with smaller output
+
+COMPRESSIBLE_TYPES = ('application/json', 'text/')
+DEFAULT_CACHE_CONTROL = 'no-cache'  # Always revalidate, but 304s still save the body
+
+
+ENCODING_SUFFIXES = {'br': '-br', 'gzip': '-gzip'}
+
+
+def make_etag(*parts) -> str:
+    """
+    Strong ETag from content bytes or version parts.
+
+    Routes whose bodies change without the underlying data changing (e.g. an
+    age field) set an ETag from a version instead; the middleware keeps it.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else str(part).encode('utf-8'))
+        digest.update(b'\x00')
+    return f'"{digest.hexdigest()}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Compare If-None-Match against the base ETag, ignoring W/ and content-coding suffixes."""
+    if if_none_match.strip() == '*':
+        return True
+    base = etag.strip('"')
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate.startswith('W/'):
+            candidate = candidate[2:]
+        candidate = candidate.strip('"')
+        for suffix in ENCODING_SUFFIXES.values():
+            if candidate.endswith(suffix):
+                candidate = candidate[:-len(suffix)]
+        if candidate == base:
+            return True
+    return False
+
+
+def _accepted_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick 'br' or 'gzip' from an Accept-Encoding header (q=0 excluded)."""
+    accepted = set()
+    for part in accept_encoding.lower().split(','):
+        name, _, params = part.strip().partition(';')
+        if params.strip().replace(' ', '') in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000'):
+            continue
+        accepted.add(name.strip())
+    if brotli is not None and 'br' in accepted:
+        return 'br'
+    if 'gzip' in accepted:
+        return 'gzip'
+    return None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == 'br':
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL)
+
+
+class HTTPCacheMiddleware:
+    """
+    Pure ASGI middleware (no BaseHTTPMiddleware task overhead).
+
+    Args:
+        app: ASGI app
+        policies: (path prefix, Cache-Control) pairs; the first match wins
+    """
+
+    def __init__(self, app, policies: List[Tuple[str, str]] = ()):
+        self.app = app
+        self.policies = list(policies)
+
+    def _cache_control(self, path: str) -> str:
+        for prefix, policy in self.policies:
+            if path.startswith(prefix):
+                return policy
+        return DEFAULT_CACHE_CONTROL
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = {k.decode('latin-1').lower(): v.decode('latin-1') for k, v in scope['headers']}
+        method = scope['method']
+        start_message = None
+        streaming = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, streaming
+            if streaming:
+                await send(message)
+                return
+            if message['type'] == 'http.response.start':
+                if any(k.lower() == b'content-type' and v.startswith(b'text/event-stream') for k, v in message.get('headers', [])):
+                    streaming = True  # Don't hold event-stream headers back until the first event
+                    await send(message)
+                    return
+                start_message = message
+                return
+            if message['type'] != 'http.response.body':
+                await send(message)
+                return
+            if message.get('more_body', False):
+                # Streaming response (e.g. server-sent events): pass through as-is
+                streaming = True
+                await send(start_message)
+                await send(message)
+                return
+            await self._send_buffered(scope, request_headers, method, start_message, message.get('body', b''), send)
+
+        await self.app(scope, receive, send_wrapper)
+
+    async def _send_buffered(self, scope, request_headers, method, start_message, body, send):
+        status = start_message['status']
+        headers = [(k, v) for k, v in start_message.get('headers', [])]
+        names = {k.lower() for k, _ in headers}
+
+        if status != 200 or b'content-encoding' in names:
+            await send(start_message)
+            await send({'type': 'http.response.body', 'body': body})
+            return
+
+        existing_etag = next((v for k, v in headers if k.lower() == b'etag'), None)
+        etag = existing_etag.decode('latin-1') if existing_etag else make_etag(body)
+        headers = [(k, v) for k, v in headers if k.lower() != b'etag']
+        if b'cache-control' not in names and method in ('GET', 'HEAD'):
+            headers.append((b'cache-control', self._cache_control(scope['path']).encode('latin-1')))
+        content_type = dict((k.lower(), v) for k, v in headers).get(b'content-type', b'').decode('latin-1')
+        if content_type.startswith(COMPRESSIBLE_TYPES):
+            headers.append((b'vary', b'Accept-Encoding'))
+
+        if_none_match = request_headers.get('if-none-match')
+        if method in ('GET', 'HEAD') and if_none_match:
+            not_modified = _etag_matches(if_none_match, etag)
+            telemetry.cache_result('http_etag', 'hit' if not_modified else 'miss')
+        else:
+            not_modified = False
+
+        if not_modified:
+            kept = [(k, v) for k, v in headers if k.lower() in (b'cache-control', b'vary')]
+            await send({
+                'type': 'http.response.start',
+                'status': 304,
+                'headers': kept + [(b'etag', etag.encode('latin-1'))],
+            })
+            await send({'type': 'http.response.body', 'body': b''})
+            return
+
+        encoding = None
+        if len(body) >= COMPRESSION_MIN_BYTES and content_type.startswith(COMPRESSIBLE_TYPES):
+            encoding = _accepted_encoding(request_headers.get('accept-encoding', ''))
+
+        if encoding:
+            body = compress(body, encoding)
+            etag = etag[:-1] + ENCODING_SUFFIXES[encoding] + '"'
+            headers = [(k, v) for k, v in headers if k.lower() != b'content-length']
+            headers += [
+                (b'content-encoding', encoding.encode('latin-1')),
+                (b'content-length', str(len(body)).encode('latin-1')),
+            ]
+        headers.append((b'etag', etag.encode('latin-1')))
+
+        await send({**start_message, 'headers': headers})
+        await send({'type': 'http.response.body', 'body': b'' if method == 'HEAD' else body})
@@ -0,0 +1,75 @@
+"""
+Request Metrics Middleware
+
+Counts requests and errors and times them per route template (e.g.
+/prices/{symbol}/indicators rather than the concrete path, which keeps label
+cardinality bounded), and tracks requests in flight. Exposed on /metrics
+together with the pipeline stage metrics from execution/telemetry.py.
+
+Also samples event-loop lag: blocking calls inside async handlers stall every
+request on the worker, and show up here before they show up as timeouts.
+"""
+
+import os
+import time
+import asyncio
+
+from execution import telemetry
+
+REQUESTS = telemetry.REGISTRY.counter('http_requests_total', 'HTTP requests by route, method and status', ['route', 'method', 'status'])
+REQUEST_DURATION = telemetry.REGISTRY.histogram(
+    'http_request_duration_seconds',
+    'HTTP request latency by route and method, up to the end of the response body',
+    ['route', 'method']
+)
+IN_FLIGHT = telemetry.REGISTRY.gauge('http_requests_in_flight', 'HTTP requests currently being served')
+EVENT_LOOP_LAG = telemetry.REGISTRY.histogram(
+    'event_loop_lag_seconds',
+    'How late the event loop woke up a timer scheduled every EVENT_LOOP_LAG_INTERVAL seconds',
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+)
+
+EVENT_LOOP_LAG_INTERVAL = float(os.getenv('EVENT_LOOP_LAG_INTERVAL', 0.25))  # 0 disables
+
+UNMATCHED_ROUTE = 'unmatched'
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware; add it last so it wraps every other middleware."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        status = 500  # Reported when the app raises before starting a response
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message['type'] == 'http.response.start':
+                status = message['status']
+            await send(message)
+
+        IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            IN_FLIGHT.dec()
+            # The router records the matched route in scope
+            route = getattr(scope.get('route'), 'path', None) or UNMATCHED_ROUTE
+            method = scope['method']
+            REQUESTS.inc(route=route, method=method, status=status)
+            REQUEST_DURATION.observe(time.perf_counter() - start, route=route, method=method)
+
+
+async def monitor_event_loop_lag(interval: float = EVENT_LOOP_LAG_INTERVAL) -> None:
+    """Sleep for interval, forever, recording how much later than requested each wake-up is."""
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(interval)
+        EVENT_LOOP_LAG.observe(max(loop.time() - start - interval, 0.0))
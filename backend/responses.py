@@ -0,0 +1,75 @@
+"""
+Fast JSON Responses
+
+Routes that return data the backend produced itself (valuations, stored
+research, index queries) skip FastAPI's per-field response validation and
+jsonable_encoder pass, and are serialized once with orjson (falling back to
+the standard library when orjson is not installed).
+
+Set STRICT_RESPONSE_VALIDATION=true, or pass strict=True, to validate payloads
+against their response model first, e.g. while changing a route.
+"""
+
+import os
+import json
+import math
+from functools import lru_cache
+from typing import Any, Optional
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+STRICT_RESPONSE_VALIDATION = os.getenv('STRICT_RESPONSE_VALIDATION', 'false').lower() == 'true'
+
+
+def _replace_non_finite(value: Any) -> Any:
+    """NaN/Infinity -> None, as orjson does, so both encoders produce valid JSON."""
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    if isinstance(value, dict):
+        return {k: _replace_non_finite(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_replace_non_finite(v) for v in value]
+    return value
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize to compact JSON bytes (numpy arrays and scalars allowed with orjson)."""
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(_replace_non_finite(content), separators=(',', ':'), allow_nan=False, default=str).encode('utf-8')
+
+
+class FastJSONResponse(Response):
+    media_type = 'application/json'
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+@lru_cache(maxsize=None)
+def _adapter(model) -> TypeAdapter:
+    return TypeAdapter(model)
+
+
+def respond(content: Any, model=None, strict: Optional[bool] = None, **kwargs) -> Response:
+    """
+    Return trusted content without re-validation.
+
+    Args:
+        content: JSON-compatible data (dicts, lists, numbers, numpy values)
+        model: Response model (e.g. FisherResearchResponse) used in strict mode
+        strict: Validate against model (default: STRICT_RESPONSE_VALIDATION)
+        **kwargs: Passed to the response (status_code, headers)
+    """
+    if model is not None and (STRICT_RESPONSE_VALIDATION if strict is None else strict):
+        adapter = _adapter(model)
+        # pydantic-core writes the validated object straight to JSON bytes
+        body = adapter.dump_json(adapter.validate_python(content))
+        return Response(body, media_type=FastJSONResponse.media_type, **kwargs)
+    return FastJSONResponse(content, **kwargs)
@@ -4,22 +4,36 @@ Fisher Research Routes
 API routes for Fisher research using Scuttlebutt methodology.
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 from datetime import datetime
-import requests
+from urllib.parse import parse_qs
+import os
+import re
+import asyncio
 
-from backend.services.scuttlebutt import research_company
-from backend.services.sec_edgar import get_sec_roe
+from backend.middleware.http_cache import make_etag
+from backend.responses import dumps, respond
+from backend.services.roe_resolver import ROE_CONSENSUS, roe_resolver
+from backend.services.scuttlebutt import has_stored_result, research_company, research_store
+from execution import progress, telemetry
+from execution.fisher_criteria import qualitative_criteria
 
 router = APIRouter(prefix='/fisher-research', tags=['fisher'])
 
+TRACE_ID_PATTERN = re.compile(r'^[0-9a-fA-F]{16,64}$')
+
+# Comment lines sent on quiet research streams so proxies don't close them as idle
+SSE_KEEPALIVE_SECONDS = float(os.getenv('SSE_KEEPALIVE_SECONDS', 15))
+
 
 class FisherResearchRequest(BaseModel):
     symbol: str
     companyName: str
-    criteriaToResearch: List[int]  # IDs of criteria to research (for compatibility, but we research all)
+    criteriaToResearch: List[int]  # IDs of criteria to research (empty = all qualitative criteria)
+    debug: bool = False  # Attach per-stage timings to the response
 
 
 class CriterionRating(BaseModel):
@@ -36,65 +50,249 @@ class FisherResearchResponse(BaseModel):
     ratings: List[CriterionRating]
     researchDate: str
     modelUsed: str
+    cacheStatus: Optional[str] = None  # 'fresh' | 'stale' | 'miss'
+    resultAgeSeconds: Optional[float] = None
+    timings: Optional[Dict[str, Any]] = None  # Trace spans, only with debug
+
+
+def _trace_id(header: Optional[str]) -> str:
+    """Caller's X-Trace-Id if it looks like a trace id, else a new one."""
+    if header and TRACE_ID_PATTERN.match(header):
+        return header.lower()
+    return telemetry.new_trace_id()
+
+
+def _research_response(symbol: str, company_name: str, criteria: List[int], trace_id: str, debug: bool = False) -> Dict:
+    """
+    Run (or serve stored) research and keep only the requested criteria.
+    
+    Ratings come from an LLM, so unlike the backend's own payloads they are always
+    validated against FisherResearchResponse (malformed ratings fail the request).
+    The request is traced under trace_id; with debug the spans are attached as 'timings'.
+    """
+    with telemetry.span('http.fisher_research', trace_id=trace_id, symbol=symbol) as root:
+        result = research_company(
+            company_name=company_name,
+            ticker=symbol,
+            max_results_per_bucket=5,
+            criteria=criteria
+        )
+    
+    # Stored results may cover more criteria than were requested
+    ratings = result.get('ratings', [])
+    if criteria:
+        requested_ids = set(criteria)
+        ratings = [r for r in ratings if r.get('criterionId') in requested_ids]
+    
+    response = {
+        'symbol': result.get('symbol', symbol),
+        'ratings': ratings,
+        'researchDate': result.get('researchDate', datetime.now().isoformat()),
+        'modelUsed': result.get('modelUsed', 'openrouter-gpt-4o-mini'),
+        'cacheStatus': result.get('cacheStatus'),
+        'resultAgeSeconds': result.get('resultAgeSeconds'),
+    }
+    if debug:
+        response['timings'] = telemetry.timing_summary(root)
+    return validate_research_response(response)
+
+
+def validate_research_response(response: Dict) -> Dict:
+    """
+    Validate a research response against FisherResearchResponse (unknown rating
+    fields are dropped). Routes then respond with strict=False, as it is checked.
+    """
+    return FisherResearchResponse.model_validate(response).model_dump()
+
+
+def _scope_criteria(criteria: List[int]) -> List[int]:
+    """Requested criteria restricted to the qualitative ones the LLM rates (empty = all of them)."""
+    try:
+        return qualitative_criteria(criteria) or []
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def _parse_criteria(criteria: Optional[str]) -> List[int]:
+    """Comma-separated criterion IDs (empty = all qualitative criteria)."""
+    try:
+        criteria_ids = [int(c) for c in criteria.split(',') if c.strip()] if criteria else []
+    except ValueError:
+        raise HTTPException(status_code=400, detail='criteria must be comma-separated criterion IDs')
+    return _scope_criteria(criteria_ids)
+
+
+def answered_from_store(scope) -> bool:
+    """
+    Whether a GET /fisher-research/{symbol}[/stream] request will be served from
+    the research store (admission control lets these through without a slot).
+    """
+    parts = scope['path'][len(router.prefix):].strip('/').split('/')
+    if scope['method'] != 'GET' or not parts[0] or parts[1:] not in ([], ['stream']):
+        return False
+    query = parse_qs(scope.get('query_string', b'').decode('latin-1'))
+    try:
+        criteria = [int(c) for value in query.get('criteria', []) for c in value.split(',') if c.strip()]
+        return has_stored_result(parts[0].upper(), criteria)
+    except ValueError:
+        return False  # Let the route reject it
+
+
+def _sse(event: str, data: Any) -> bytes:
+    return b'event: ' + event.encode() + b'\ndata: ' + dumps(data) + b'\n\n'
+
+
+async def _research_events(symbol: str, company_name: str, criteria: List[int], trace_id: str) -> AsyncIterator[bytes]:
+    """
+    Run research on a worker thread and stream its progress events as SSE.
+    
+    Ends with a 'result' event (the GET /fisher-research/{symbol} payload) or an
+    'error' event. If the client disconnects the run still completes and is stored.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    
+    def post(item) -> None:
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, item)
+        except RuntimeError:
+            pass  # Event loop closed (server shutting down)
+    
+    def run() -> None:
+        try:
+            with progress.listen(lambda event, data: post((event, data))):
+                post(('result', _research_response(symbol, company_name, criteria, trace_id)))
+        except Exception as e:
+            post(('error', {'detail': str(e)}))
+        finally:
+            post(None)
+    
+    loop.run_in_executor(None, run)
+    yield _sse('started', {'symbol': symbol, 'criteria': criteria, 'traceId': trace_id})
+    while True:
+        try:
+            item = await asyncio.wait_for(queue.get(), SSE_KEEPALIVE_SECONDS)
+        except asyncio.TimeoutError:
+            yield b': keepalive\n\n'
+            continue
+        if item is None:
+            return
+        yield _sse(*item)
+
+
+def _research_cache_control(result: Dict) -> str:
+    """Let clients reuse a result until it goes stale in the research store."""
+    if result['cacheStatus'] == 'stale':
+        return 'no-cache'  # A refresh is already running in the background
+    remaining = research_store.ttl_seconds - (result['resultAgeSeconds'] or 0)
+    return f'public, max-age={max(int(remaining), 0)}'
+
+
+# Static paths first, or /{symbol}/stream would also match /roe/stream
+@router.get('/store/stats')
+async def get_store_stats():
+    """Research store hit rate, result ages and background refresh counters."""
+    return research_store.stats()
+
+
+@router.get('/roe/sources/stats')
+def get_roe_source_stats():
+    """Per-source call count, success rate, mean latency and current rank of the ROE resolver."""
+    return roe_resolver.stats_dict()
+
+
+@router.get('/roe/{symbol}')
+def get_roe(symbol: str, consensus: Optional[bool] = None):
+    """
+    Get ROE from the fastest reliable source (SEC EDGAR, FMP, Yahoo Finance).
+    
+    Sources are raced in learned order (see backend.services.roe_resolver);
+    with consensus=true all are queried and the median is returned.
+    """
+    result = roe_resolver.resolve(symbol.upper(), consensus=ROE_CONSENSUS if consensus is None else consensus)
+    if result['roe'] is None:
+        failures = '; '.join(f'{name}: {outcome.get("error")}' for name, outcome in result['sources'].items())
+        raise HTTPException(status_code=404, detail=f'ROE not available for {symbol} ({failures})')
+    print(f"ROE for {symbol}: {result['roe']:.2f}% from {result['source']}")
+    return {'symbol': symbol, 'roe': result['roe'], 'source': result['source'], 'sources': result['sources']}
 
 
 @router.post('', response_model=FisherResearchResponse)
-async def research_fisher_criteria(request: FisherResearchRequest):
+def research_fisher_criteria(request: FisherResearchRequest, x_trace_id: Optional[str] = Header(None)):
     """
     Research Fisher criteria for a company using Scuttlebutt methodology.
     
-    Note: criteriaToResearch is accepted for compatibility but we research all 15 criteria.
+    Only the stakeholder buckets and LLM ratings needed for criteriaToResearch
+    are produced, unless a stored result already covers them.
     """
+    criteria_ids = _scope_criteria(request.criteriaToResearch)
+    trace_id = _trace_id(x_trace_id)
     try:
-        # Run Scuttlebutt research
-        result = research_company(
-            company_name=request.companyName,
-            ticker=request.symbol,
-            max_results_per_bucket=5
-        )
-        
-        # Filter ratings if specific criteria requested (for compatibility)
-        ratings = result.get('ratings', [])
-        if request.criteriaToResearch:
-            requested_ids = set(request.criteriaToResearch)
-            ratings = [r for r in ratings if r.get('criterionId') in requested_ids]
-        
-        return FisherResearchResponse(
-            symbol=result.get('symbol', request.symbol),
-            ratings=[CriterionRating(**r) for r in ratings],
-            researchDate=result.get('researchDate', datetime.now().isoformat()),
-            modelUsed=result.get('modelUsed', 'openrouter-gpt-4o-mini'),
+        return respond(
+            _research_response(request.symbol, request.companyName, criteria_ids, trace_id, request.debug),
+            FisherResearchResponse,
+            strict=False,  # Validated in _research_response
+            headers={'X-Trace-Id': trace_id}
         )
-        
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=500, detail=str(e), headers={'X-Trace-Id': trace_id})
 
 
-@router.get('/roe/{symbol}')
-async def get_roe(symbol: str):
+@router.get('/{symbol}', response_model=FisherResearchResponse)
+def get_fisher_research(
+    symbol: str,
+    companyName: Optional[str] = None,
+    criteria: Optional[str] = None,
+    debug: bool = False,
+    x_trace_id: Optional[str] = Header(None)
+):
     """
-    Get ROE from SEC EDGAR API.
+    Cacheable form of POST /fisher-research for repeat views.
     
-    SEC EDGAR is the official, free, and reliable source for financial data.
+    criteria is a comma-separated list of criterion IDs (empty = all qualitative criteria).
+    Responses carry an ETag and a max-age matching the stored result's
+    remaining freshness, so browsers and the CDN revalidate with 304s.
+    Debug responses (with timings) are not cacheable.
     """
+    criteria_ids = _parse_criteria(criteria)
+    trace_id = _trace_id(x_trace_id)
     try:
-        print(f"Attempting to fetch ROE from SEC EDGAR for {symbol}...")
-        roe = get_sec_roe(symbol)
-        if roe is not None:
-            print(f"✅ SEC EDGAR ROE: {roe:.2f}%")
-            return {'symbol': symbol, 'roe': roe, 'source': 'sec'}
-        else:
-            raise HTTPException(
-                status_code=404,
-                detail=f'ROE not available from SEC EDGAR for {symbol}. The company may not have filed the required financial statements.'
-            )
-    except HTTPException:
-        raise
+        result = _research_response(symbol.upper(), companyName or symbol.upper(), criteria_ids, trace_id, debug)
     except Exception as e:
-        print(f"SEC EDGAR failed: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f'Failed to fetch ROE from SEC EDGAR for {symbol}: {str(e)}'
-        )
+        raise HTTPException(status_code=500, detail=str(e), headers={'X-Trace-Id': trace_id})
+    if debug:
+        return respond(result, FisherResearchResponse, strict=False, headers={'Cache-Control': 'no-store', 'X-Trace-Id': trace_id})
+    return respond(result, FisherResearchResponse, strict=False, headers={
+        'Cache-Control': _research_cache_control(result),
+        # Versioned by the stored result, not the body, whose resultAgeSeconds changes every request
+        'ETag': make_etag(result['symbol'], result['researchDate'], result['modelUsed'], criteria_ids),
+        'X-Trace-Id': trace_id,
+    })
 
 
+@router.get('/{symbol}/stream')
+async def stream_fisher_research(
+    symbol: str,
+    companyName: Optional[str] = None,
+    criteria: Optional[str] = None,
+    x_trace_id: Optional[str] = Header(None)
+):
+    """
+    GET /fisher-research/{symbol} as a server-sent event stream.
+    
+    Events: started, bucket_started, bucket_completed, analysis_started,
+    rating (one per criterion), analysis_completed, then result or error.
+    Stored results go straight to result. Quiet periods send a keepalive
+    comment every SSE_KEEPALIVE_SECONDS.
+    """
+    criteria_ids = _parse_criteria(criteria)
+    trace_id = _trace_id(x_trace_id)
+    return StreamingResponse(
+        _research_events(symbol.upper(), companyName or symbol.upper(), criteria_ids, trace_id),
+        media_type='text/event-stream',
+        headers={
+            'Cache-Control': 'no-store',
+            'X-Accel-Buffering': 'no',  # Stop nginx from buffering the stream
+            'X-Trace-Id': trace_id,
+        }
+    )
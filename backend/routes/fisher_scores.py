@@ -0,0 +1,73 @@
+"""
+Fisher Score Routes
+
+Batch quantitative Fisher ratings (criteria 1, 5 and 13) with universe percentiles.
+Updates require an admin token (see backend.auth).
+"""
+
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel
+from typing import List, Optional
+
+from backend.auth import require_admin_token
+from backend.responses import respond
+from backend.services.fisher_scores import facts_from_companyfacts, get_fisher_score_index
+from backend.services.sec_edgar import get_company_facts
+
+router = APIRouter(prefix='/fisher-scores', tags=['fisher'])
+
+
+class FisherFacts(BaseModel):
+    symbol: str
+    epsGrowth: Optional[float] = None  # Percentage
+    salesGrowth: Optional[float] = None  # Percentage
+    roe: Optional[float] = None  # Percentage
+    shareGrowth: Optional[float] = None  # Annual % change in diluted shares
+
+
+class FactsUpdate(BaseModel):
+    records: List[FisherFacts]
+
+
+@router.get('')
+async def get_scores(symbols: str):
+    """Ratings and universe percentiles for a comma-separated list of symbols."""
+    requested = [s.strip() for s in symbols.split(',') if s.strip()]
+    return respond({'results': get_fisher_score_index().get(requested)})
+
+
+@router.get('/universe')
+async def get_universe():
+    """Distribution of facts and ratings across every scored ticker."""
+    return respond(get_fisher_score_index().universe())
+
+
+@router.get('/stats')
+async def get_fisher_score_stats():
+    """Index size and incremental rescoring counters."""
+    return get_fisher_score_index().stats()
+
+
+@router.post('/facts', dependencies=[Depends(require_admin_token)])
+def update_facts(update: FactsUpdate):
+    """Insert or update facts; only tickers whose facts changed are rescored."""
+    index = get_fisher_score_index()
+    changed = index.upsert(r.model_dump(exclude_none=True) for r in update.records)
+    if changed:
+        index.save()
+    return {'changed': changed, 'tickers': len(index)}
+
+
+@router.post('/sec/{symbol}', dependencies=[Depends(require_admin_token)])
+def refresh_from_sec(symbol: str):
+    """Derive facts for a ticker from its SEC filings and rescore it."""
+    companyfacts = get_company_facts(symbol)
+    if companyfacts is None:
+        raise HTTPException(status_code=404, detail=f'No SEC company facts for {symbol}')
+
+    facts = facts_from_companyfacts(companyfacts)
+    index = get_fisher_score_index()
+    changed = index.upsert([{'symbol': symbol, **facts}])
+    if changed:
+        index.save()
+    return index.get([symbol])[0]
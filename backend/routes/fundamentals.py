@@ -0,0 +1,41 @@
+"""
+Fundamentals Routes
+
+Normalized fundamentals per symbol, fetched from FMP server-side in parallel
+and cached, so the browser makes one call and never sees the API key.
+"""
+
+from fastapi import APIRouter, HTTPException
+
+from backend.responses import respond
+from backend.services.fmp import FMPError
+from backend.services.fundamentals import fundamentals_cache
+
+router = APIRouter(prefix='/fundamentals', tags=['fundamentals'])
+
+FIELDS = ('eps', 'peRatio', 'roe', 'debtToEquity', 'currentRatio', 'epsGrowth', 'salesGrowth', 'companyName')
+
+
+@router.get('/stats')
+async def get_fundamentals_stats():
+    """Cache size, in-flight symbols and TTL."""
+    return fundamentals_cache.stats()
+
+
+@router.get('/{symbol}')
+async def get_fundamentals(symbol: str):
+    """
+    Fundamentals for symbol: eps, peRatio, roe, debtToEquity, currentRatio,
+    epsGrowth, salesGrowth (percent), bookValueGrowth, companyName (None where
+    unknown), plus roeSource and unavailable (upstream calls that failed).
+    Records with unavailable parts are not cached by clients either.
+    """
+    try:
+        record = await fundamentals_cache.get(symbol)
+    except FMPError as e:
+        raise HTTPException(status_code=e.http_status(), detail=str(e))
+    if all(record.get(field) is None for field in FIELDS):
+        raise HTTPException(status_code=404, detail=f'Stock symbol "{symbol}" not found')
+    if record['unavailable']:
+        return respond(record, headers={'Cache-Control': 'no-store'})
+    return respond(record)
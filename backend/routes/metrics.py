@@ -0,0 +1,19 @@
+"""
+Metrics Routes
+
+Prometheus scrape endpoint.
+"""
+
+from fastapi import APIRouter, Response
+
+from execution import telemetry
+
+router = APIRouter(tags=['metrics'])
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+@router.get('/metrics', include_in_schema=False)
+async def metrics():
+    """Request, pipeline stage and cache metrics in Prometheus text format."""
+    return Response(telemetry.render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
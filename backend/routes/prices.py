@@ -0,0 +1,83 @@
+"""
+Price History Routes
+
+Streaming bar ingest and the Rule #1 tools (MACD 8/17/9, slow stochastic 14/5,
+10-day moving average) for stored tickers. Writes require an admin token (see
+backend.auth).
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from starlette.concurrency import run_in_threadpool
+from pydantic import BaseModel
+from typing import List, Optional
+import codecs
+
+from backend.auth import require_admin_token
+from backend.responses import respond
+from backend.services.price_history import PriceHistoryStore
+
+router = APIRouter(prefix='/prices', tags=['prices'])
+
+# Shared store, series are loaded from disk on first use
+price_store = PriceHistoryStore()
+
+
+class PriceBar(BaseModel):
+    date: str  # YYYY-MM-DD
+    close: float
+    high: Optional[float] = None
+    low: Optional[float] = None
+
+
+class BarsUpdate(BaseModel):
+    bars: List[PriceBar]
+
+
+@router.post('/ingest', dependencies=[Depends(require_admin_token)])
+async def ingest_prices(request: Request, format: str = 'csv', symbol: Optional[str] = None):
+    """
+    Stream bars in the request body into the store.
+
+    CSV needs a header with date and close (optional symbol, high, low);
+    format=jsonl takes one bar object per line. Without a symbol column,
+    pass ?symbol=.
+
+    The body is read on the event loop; parsing, merging, indicator
+    recomputation and saving run in the threadpool.
+    """
+    try:
+        ingestor = price_store.ingestor(format, symbol)
+        # Incremental, so a character split across two chunks is decoded whole
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        async for chunk in request.stream():
+            await run_in_threadpool(ingestor.feed, decoder.decode(chunk))
+        await run_in_threadpool(ingestor.feed, decoder.decode(b'', final=True))
+        return await run_in_threadpool(ingestor.close)
+    except (ValueError, KeyError) as e:
+        raise HTTPException(status_code=400, detail=f'Invalid price data: {e}')
+
+
+@router.get('/indicators')
+async def get_latest_indicators(symbols: str):
+    """Latest bar, tools and combined signal for a comma-separated list of symbols."""
+    requested = [s.strip() for s in symbols.split(',') if s.strip()]
+    return respond({'results': price_store.latest(requested)})
+
+
+@router.post('/{symbol}/bars', dependencies=[Depends(require_admin_token)])
+def append_bars(symbol: str, update: BarsUpdate):
+    """Append (or correct) bars; only rows from the earliest changed date are recomputed."""
+    try:
+        rows = price_store.append(symbol, [bar.model_dump(exclude_none=True) for bar in update.bars])
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {'symbol': symbol.upper(), 'rowsComputed': rows, 'latest': price_store.get(symbol).latest()}
+
+
+@router.get('/{symbol}/indicators')
+async def get_indicators(symbol: str, limit: int = 60):
+    """Indicator history for one ticker, most recent `limit` bars."""
+    series = price_store.get(symbol)
+    if series is None:
+        raise HTTPException(status_code=404, detail=f'No price history for {symbol}')
+    return respond({'symbol': symbol.upper(), 'bars': series.tail(max(min(limit, 5000), 1))})
@@ -0,0 +1,50 @@
+"""
+Quote Routes
+
+Stock quotes proxied from FMP through the shared micro-batching cache, so the
+API key stays on the server and concurrent visitors share upstream calls.
+"""
+
+from fastapi import APIRouter, HTTPException
+
+from backend.responses import respond
+from backend.services.fmp import FMPError
+from backend.services.quotes import quote_batcher
+
+router = APIRouter(prefix='/quotes', tags=['quotes'])
+
+MAX_SYMBOLS = 200
+
+
+@router.get('')
+async def get_quotes(symbols: str):
+    """Quotes for comma-separated symbols: {'quotes': [...], 'missing': [unknown symbols]}."""
+    requested = [s for s in symbols.split(',') if s.strip()]
+    if len(requested) > MAX_SYMBOLS:
+        raise HTTPException(status_code=400, detail=f'At most {MAX_SYMBOLS} symbols per request')
+    try:
+        quotes = await quote_batcher.get_many(requested)
+    except FMPError as e:
+        raise HTTPException(status_code=e.http_status(), detail=str(e))
+    return respond({
+        'quotes': [quote for quote in quotes.values() if quote is not None],
+        'missing': [symbol for symbol, quote in quotes.items() if quote is None],
+    })
+
+
+@router.get('/stats')
+async def get_quote_stats():
+    """Cache size, in-flight symbols and batching settings."""
+    return quote_batcher.stats()
+
+
+@router.get('/{symbol}')
+async def get_quote(symbol: str):
+    """Quote for one symbol (batched with concurrent requests for other symbols)."""
+    try:
+        quote = await quote_batcher.get(symbol)
+    except FMPError as e:
+        raise HTTPException(status_code=e.http_status(), detail=str(e))
+    if quote is None:
+        raise HTTPException(status_code=404, detail=f'Stock symbol "{symbol}" not found')
+    return respond(quote)
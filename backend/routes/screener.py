@@ -0,0 +1,87 @@
+"""
+Screener Routes
+
+Filtered, ranked Rule #1 queries over the precomputed screener index.
+Updates require an admin token (see backend.auth).
+"""
+
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel
+from typing import Dict, List, Optional
+
+from backend.auth import require_admin_token
+from backend.responses import respond
+from backend.services.screener import get_screener_index
+
+router = APIRouter(prefix='/screener', tags=['screener'])
+
+
+class ScreenerFundamentals(BaseModel):
+    symbol: str
+    eps: Optional[float] = None
+    growthRate: Optional[float] = None  # Percentage, e.g. 12 for 12%
+    currentPrice: Optional[float] = None
+    roe: Optional[float] = None  # Percentage
+
+
+class FundamentalsUpdate(BaseModel):
+    records: List[ScreenerFundamentals]
+
+
+class PricesUpdate(BaseModel):
+    prices: Dict[str, float]
+
+
+@router.get('')
+async def screen(
+    belowMos: bool = False,
+    minRoe: Optional[float] = None,
+    minGrowth: Optional[float] = None,
+    minDiscount: Optional[float] = None,
+    maxPrice: Optional[float] = None,
+    sortBy: str = 'discountToMos',
+    order: str = 'desc',
+    limit: int = 50
+):
+    """
+    Screen the universe, e.g. every stock below its MOS price with ROE > 15%:
+    `/screener?belowMos=true&minRoe=15&sortBy=discountToMos`
+    """
+    try:
+        results = get_screener_index().query(
+            below_mos=belowMos,
+            min_roe=minRoe,
+            min_growth=minGrowth,
+            min_discount=minDiscount,
+            max_price=maxPrice,
+            sort_by=sortBy,
+            descending=order != 'asc',
+            limit=max(min(limit, 1000), 1),
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return respond(results)
+
+
+@router.post('/fundamentals', dependencies=[Depends(require_admin_token)])
+def update_fundamentals(update: FundamentalsUpdate):
+    """Insert or update tickers; only the given rows are revalued (saving runs in the threadpool)."""
+    index = get_screener_index()
+    updated = index.upsert(r.model_dump(exclude_none=True) for r in update.records)
+    index.save()
+    return {'updated': updated, 'tickers': len(index)}
+
+
+@router.post('/prices', dependencies=[Depends(require_admin_token)])
+def update_prices(update: PricesUpdate):
+    """Update current prices for tickers already in the index (saving runs in the threadpool)."""
+    index = get_screener_index()
+    updated = index.update_prices(update.prices)
+    index.save()
+    return {'updated': updated, 'tickers': len(index)}
+
+
+@router.get('/stats')
+async def get_screener_stats():
+    """Index size and coverage."""
+    return get_screener_index().stats()
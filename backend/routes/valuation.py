@@ -0,0 +1,157 @@
+"""
+Valuation Routes
+
+Bulk Rule #1 valuation (Sticker Price, MOS price, signal) for many stocks and scenarios.
+"""
+
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel
+from typing import List, Optional
+import math
+import numpy as np
+
+from backend.responses import respond
+from backend.services.valuation import DEFAULT_MARR, DEFAULT_YEARS, evaluate_universe
+from backend.services.monte_carlo import simulate
+
+router = APIRouter(prefix='/valuation', tags=['valuation'])
+
+MAX_VALUATIONS_PER_REQUEST = 1_000_000  # stocks x scenarios
+MAX_MONTE_CARLO_SAMPLES = 200_000
+
+
+class ValuationStock(BaseModel):
+    symbol: str
+    eps: float
+    growthRate: float  # Percentage, e.g. 12 for 12%
+    currentPrice: Optional[float] = None
+
+
+class ValuationScenario(BaseModel):
+    growthRate: Optional[float] = None  # Overrides each stock's growth rate when set
+    marr: float = DEFAULT_MARR
+    years: float = DEFAULT_YEARS
+
+
+class ValuationRequest(BaseModel):
+    stocks: List[ValuationStock]
+    scenarios: List[ValuationScenario] = [ValuationScenario()]
+
+
+class ValuationResult(BaseModel):
+    symbol: str
+    scenario: int  # Index into request.scenarios
+    growthRate: float
+    marr: float
+    years: float
+    stickerPrice: Optional[float]
+    mosPrice: Optional[float]
+    signal: Optional[str]  # 'BUY' | 'WAIT', None without a current price
+
+
+class ValuationResponse(BaseModel):
+    results: List[ValuationResult]
+    count: int
+
+
+class Distribution(BaseModel):
+    kind: str = 'fixed'  # 'fixed' | 'normal' | 'uniform' | 'triangular' | 'lognormal'
+    value: Optional[float] = None  # fixed
+    mean: Optional[float] = None  # normal, lognormal
+    std: Optional[float] = None  # normal, lognormal
+    low: Optional[float] = None  # uniform, triangular
+    high: Optional[float] = None  # uniform, triangular
+    mode: Optional[float] = None  # triangular
+
+
+class MonteCarloRequest(BaseModel):
+    symbol: Optional[str] = None
+    eps: float
+    currentPrice: Optional[float] = None
+    growthRate: Distribution  # Percent
+    marr: Distribution = Distribution(value=DEFAULT_MARR)
+    futurePE: Optional[Distribution] = None  # Default: 2 x growth rate, clamped to [8, 25]
+    years: float = DEFAULT_YEARS
+    samples: int = 20000
+    gridSize: int = 5
+    seed: Optional[int] = None
+
+
+def _finite_or_none(value: float) -> Optional[float]:
+    return value if math.isfinite(value) else None
+
+
+@router.post('', response_model=ValuationResponse)
+def value_stocks(request: ValuationRequest):
+    """
+    Value every stock under every scenario in one vectorized pass.
+
+    Matches calculateStickerPrice / calculateMOSPrice / determineSignal in the frontend.
+    """
+    scenarios = request.scenarios or [ValuationScenario()]
+    if len(request.stocks) * len(scenarios) > MAX_VALUATIONS_PER_REQUEST:
+        raise HTTPException(
+            status_code=413,
+            detail=f'Too many valuations requested (max {MAX_VALUATIONS_PER_REQUEST} stocks x scenarios)'
+        )
+
+    stocks = request.stocks
+    values = evaluate_universe(
+        eps=[s.eps for s in stocks],
+        growth_rate=[s.growthRate for s in stocks],
+        current_price=[np.nan if s.currentPrice is None else s.currentPrice for s in stocks],
+        scenario_growth_rate=[np.nan if s.growthRate is None else s.growthRate for s in scenarios],
+        scenario_marr=[s.marr for s in scenarios],
+        scenario_years=[s.years for s in scenarios],
+    )
+
+    growth = values['growthRate'].tolist()
+    sticker = values['stickerPrice'].tolist()
+    mos = values['mosPrice'].tolist()
+    signal = values['signal'].tolist()
+
+    # Built as plain dicts: one ValuationResult per row dominated the response time
+    results = [
+        {
+            'symbol': stock.symbol,
+            'scenario': j,
+            'growthRate': growth[i][j],
+            'marr': scenario.marr,
+            'years': scenario.years,
+            'stickerPrice': _finite_or_none(sticker[i][j]),
+            'mosPrice': _finite_or_none(mos[i][j]),
+            'signal': signal[i][j] if stock.currentPrice is not None else None,
+        }
+        for i, stock in enumerate(stocks)
+        for j, scenario in enumerate(scenarios)
+    ]
+    return respond({'results': results, 'count': len(results)}, ValuationResponse)
+
+
+@router.post('/monte-carlo')
+def monte_carlo(request: MonteCarloRequest):
+    """
+    Sticker Price distribution from sampled growth rate, future PE and MARR.
+
+    Returns percentiles of Sticker and MOS prices, the probability that the
+    current price is below the MOS price, and a growth x MARR sensitivity grid.
+    """
+    if not 1 <= request.samples <= MAX_MONTE_CARLO_SAMPLES:
+        raise HTTPException(status_code=400, detail=f'samples must be between 1 and {MAX_MONTE_CARLO_SAMPLES}')
+
+    try:
+        result = simulate(
+            eps=request.eps,
+            growth_rate=request.growthRate.model_dump(exclude_none=True),
+            marr=request.marr.model_dump(exclude_none=True),
+            future_pe=request.futurePE.model_dump(exclude_none=True) if request.futurePE else None,
+            current_price=request.currentPrice,
+            years=request.years,
+            samples=request.samples,
+            grid_size=max(min(request.gridSize, 25), 1),
+            seed=request.seed,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return respond({'symbol': request.symbol, **result})
@@ -0,0 +1,266 @@
+"""
+Rule #1 Backtest Service
+
+Replays determineSignal through history: for every ticker and trading day,
+computes the Sticker Price and MOS price from the fundamentals known on that
+day, buys at or below the MOS price and sells at the Sticker Price.
+
+Everything is computed as (days x tickers) arrays, so a 500-ticker x 15-year
+run takes well under a second once the data is loaded.
+
+Usage: python -m backend.services.backtest [--data-dir .tmp/backtest] [--symbols AAPL,MSFT]
+
+Data layout (BACKTEST_DATA_DIR):
+    prices/{SYMBOL}.csv        date,close
+    fundamentals/{SYMBOL}.csv  filed,eps,growthRate
+
+Fundamentals rows are keyed by the date they became public (the filing date),
+so each row only affects signals from that day on.
+"""
+
+import os
+import json
+import argparse
+import numpy as np
+from typing import Dict, List, Optional, Sequence
+
+from backend.services.valuation import DEFAULT_MARR, DEFAULT_YEARS, mos_price, sticker_price
+
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+BACKTEST_DATA_DIR = os.getenv('BACKTEST_DATA_DIR', os.path.join(project_root, '.tmp', 'backtest'))
+
+TRADING_DAYS_PER_YEAR = 252
+DEFAULT_HORIZONS = [63, 252]  # Forward-return horizons for BUY signals (3 and 12 months)
+
+
+def _read_csv(path: str, date_field: str, fields: List[str]) -> Dict[str, np.ndarray]:
+    """Read a CSV into a date array plus one float array per field, sorted by date."""
+    with open(path, 'r') as f:
+        header = f.readline().strip().split(',')
+        text = f.read().strip()
+    # One split over the whole file and per-column conversion is far faster than csv.DictReader
+    cells = text.replace('\n', ',').split(',') if text else []
+    width = len(header)
+    dates = np.array(cells[header.index(date_field)::width], dtype='datetime64[D]')
+    order = np.argsort(dates, kind='stable')
+    columns = {'date': dates[order]}
+    for field in fields:
+        column = cells[header.index(field)::width]
+        values = np.fromiter((float(v) if v.strip() else np.nan for v in column), np.float64, len(column))
+        columns[field] = values[order]
+    return columns
+
+
+def as_of(dates: np.ndarray, known_dates: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Latest value known on each date (NaN before the first known date)."""
+    idx = np.searchsorted(known_dates, dates, side='right') - 1
+    out = values[np.maximum(idx, 0)].astype(np.float64)
+    out[idx < 0] = np.nan
+    return out
+
+
+def load_universe(data_dir: str = BACKTEST_DATA_DIR, symbols: Optional[Sequence[str]] = None) -> Dict:
+    """
+    Load prices and point-in-time fundamentals onto a shared trading-day axis.
+
+    Returns:
+        Dictionary with 'symbols', 'dates' and (days x tickers) arrays
+        'price', 'eps' and 'growthRate'
+    """
+    prices_dir = os.path.join(data_dir, 'prices')
+    fundamentals_dir = os.path.join(data_dir, 'fundamentals')
+    if symbols is None:
+        symbols = sorted(name[:-len('.csv')] for name in os.listdir(prices_dir) if name.endswith('.csv'))
+
+    prices = {}
+    fundamentals = {}
+    for symbol in symbols:
+        prices[symbol] = _read_csv(os.path.join(prices_dir, f'{symbol}.csv'), 'date', ['close'])
+        fundamentals_path = os.path.join(fundamentals_dir, f'{symbol}.csv')
+        if os.path.exists(fundamentals_path):
+            fundamentals[symbol] = _read_csv(fundamentals_path, 'filed', ['eps', 'growthRate'])
+
+    dates = np.unique(np.concatenate([p['date'] for p in prices.values()])) if prices else np.array([], dtype='datetime64[D]')
+    shape = (len(dates), len(symbols))
+    universe = {
+        'symbols': list(symbols),
+        'dates': dates,
+        'price': np.full(shape, np.nan),
+        'eps': np.full(shape, np.nan),
+        'growthRate': np.full(shape, np.nan),
+    }
+    for i, symbol in enumerate(symbols):
+        p = prices[symbol]
+        universe['price'][:, i] = as_of(dates, p['date'], p['close'])
+        universe['price'][dates > p['date'][-1], i] = np.nan  # Delisted: stop carrying the last price
+        f = fundamentals.get(symbol)
+        if f is not None:
+            universe['eps'][:, i] = as_of(dates, f['date'], f['eps'])
+            universe['growthRate'][:, i] = as_of(dates, f['date'], f['growthRate'])
+    return universe
+
+
+def positions(price: np.ndarray, sticker: np.ndarray, mos: np.ndarray, exit_ratio: float = 1.0) -> np.ndarray:
+    """
+    Whether each ticker is held at each day's close.
+
+    Enters at or below the MOS price and exits at or above exit_ratio x Sticker
+    Price (or when the price series ends). Position state is the most recent
+    entry or exit event, carried forward without a Python loop over days.
+    """
+    with np.errstate(invalid='ignore'):
+        entry = price <= mos
+        exit_ = (price >= sticker * exit_ratio) | np.isnan(price)
+    event = np.where(entry, 1, np.where(exit_, -1, 0)).astype(np.int8)
+
+    days = np.arange(len(price))[:, None]
+    last_event_day = np.maximum.accumulate(np.where(event != 0, days, 0), axis=0)
+    return np.take_along_axis(event, last_event_day, axis=0) == 1
+
+
+def _performance(daily_returns: np.ndarray) -> Dict:
+    """Total return, CAGR and max drawdown of a daily return series."""
+    equity = np.cumprod(1 + daily_returns)
+    if len(equity) == 0:
+        return {'totalReturn': 0.0, 'cagr': 0.0, 'maxDrawdown': 0.0}
+    drawdown = 1 - equity / np.maximum.accumulate(equity)
+    years = len(daily_returns) / TRADING_DAYS_PER_YEAR
+    return {
+        'totalReturn': float(equity[-1] - 1),
+        'cagr': float(equity[-1] ** (1 / years) - 1) if years > 0 and equity[-1] > 0 else None,
+        'maxDrawdown': float(drawdown.max()),
+    }
+
+
+def _trades(held: np.ndarray, price: np.ndarray) -> Dict[str, np.ndarray]:
+    """Entry/exit rows and returns for every round trip, ticker by ticker."""
+    padded = np.zeros((len(held) + 2, held.shape[1]), dtype=np.int8)
+    padded[1:-1] = held
+    change = np.diff(padded, axis=0).T  # Tickers first so trades group by ticker
+    ticker, entry_day = np.nonzero(change == 1)
+    _, exit_day = np.nonzero(change == -1)
+
+    is_open = exit_day == len(held)
+    exit_day = np.where(is_open, len(held) - 1, exit_day)
+    # Exits caused by the price series ending are marked at the last known price
+    entry_price = price[entry_day, ticker]
+    exit_price = price[exit_day, ticker]
+    missing = np.isnan(exit_price)
+    if missing.any():
+        last_valid = np.maximum.accumulate(np.where(np.isnan(price), 0, np.arange(len(price))[:, None]), axis=0)
+        exit_day = np.where(missing, last_valid[exit_day, ticker], exit_day)
+        exit_price = price[exit_day, ticker]
+
+    return {
+        'ticker': ticker,
+        'entryDay': entry_day,
+        'exitDay': exit_day,
+        'open': is_open,
+        'return': exit_price / entry_price - 1,
+    }
+
+
+def run_backtest(
+    universe: Dict,
+    marr: float = DEFAULT_MARR,
+    years: float = DEFAULT_YEARS,
+    exit_ratio: float = 1.0,
+    horizons: Sequence[int] = DEFAULT_HORIZONS
+) -> Dict:
+    """
+    Backtest buying at the MOS price and selling at the Sticker Price.
+
+    Args:
+        universe: Output of load_universe (or the same arrays built in memory)
+        marr, years: Valuation assumptions
+        exit_ratio: Sell at or above exit_ratio x Sticker Price
+        horizons: Forward-return horizons (trading days) for BUY signal statistics
+
+    Returns:
+        Dictionary with portfolio vs equal-weight benchmark performance, trade
+        statistics, BUY signal forward returns and per-ticker results
+    """
+    price = universe['price']
+    sticker = sticker_price(universe['eps'], universe['growthRate'], years, marr)
+    mos = mos_price(sticker)
+    held = positions(price, sticker, mos, exit_ratio)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        daily = price[1:] / price[:-1] - 1
+    daily = np.where(np.isfinite(daily), daily, 0.0)
+    held_prev = held[:-1]
+
+    # Equal weight across open positions, uninvested cash earns nothing
+    open_positions = held_prev.sum(axis=1)
+    portfolio = np.where(open_positions > 0, (daily * held_prev).sum(axis=1) / np.maximum(open_positions, 1), 0.0)
+    listed = ~np.isnan(price[:-1]) & ~np.isnan(price[1:])
+    benchmark = np.where(listed.any(axis=1), (daily * listed).sum(axis=1) / np.maximum(listed.sum(axis=1), 1), 0.0)
+
+    trades = _trades(held, price)
+    closed = ~trades['open']
+    trade_returns = trades['return']
+
+    entries = held & ~np.vstack([np.zeros((1, held.shape[1]), dtype=bool), held[:-1]])
+    signal_stats = []
+    for horizon in horizons:
+        if horizon >= len(price):
+            continue
+        with np.errstate(invalid='ignore', divide='ignore'):
+            forward = price[horizon:] / price[:-horizon] - 1
+        valid = np.isfinite(forward)
+        on_buy = valid & entries[:-horizon]
+        signal_stats.append({
+            'horizonDays': horizon,
+            'buySignals': int(on_buy.sum()),
+            'meanReturn': float(forward[on_buy].mean()) if on_buy.any() else None,
+            'hitRate': float((forward[on_buy] > 0).mean()) if on_buy.any() else None,
+            'universeMeanReturn': float(forward[valid].mean()) if valid.any() else None,
+        })
+
+    strategy_by_ticker = np.cumprod(1 + daily * held_prev, axis=0)[-1] - 1 if len(daily) else np.zeros(price.shape[1])
+    trades_by_ticker = np.bincount(trades['ticker'], minlength=price.shape[1])
+
+    return {
+        'tickers': price.shape[1],
+        'days': len(price),
+        'start': str(universe['dates'][0]) if len(price) else None,
+        'end': str(universe['dates'][-1]) if len(price) else None,
+        'portfolio': {**_performance(portfolio), 'exposure': float((open_positions > 0).mean()) if len(daily) else 0.0},
+        'benchmark': _performance(benchmark),
+        'trades': {
+            'count': int(len(trade_returns)),
+            'open': int(trades['open'].sum()),
+            'hitRate': float((trade_returns[closed] > 0).mean()) if closed.any() else None,
+            'meanReturn': float(trade_returns.mean()) if len(trade_returns) else None,
+            'medianReturn': float(np.median(trade_returns)) if len(trade_returns) else None,
+            'meanHoldingDays': float((trades['exitDay'] - trades['entryDay']).mean()) if len(trade_returns) else None,
+        },
+        'signals': signal_stats,
+        'perTicker': [
+            {'symbol': symbol, 'trades': int(count), 'strategyReturn': float(ret)}
+            for symbol, count, ret in zip(universe['symbols'], trades_by_ticker.tolist(), strategy_by_ticker.tolist())
+        ],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Backtest Rule #1 MOS buy signals on local price/fundamentals files')
+    parser.add_argument('--data-dir', default=BACKTEST_DATA_DIR, help='Directory with prices/ and fundamentals/')
+    parser.add_argument('--symbols', help='Comma-separated tickers (default: every prices/*.csv)')
+    parser.add_argument('--marr', type=float, default=DEFAULT_MARR)
+    parser.add_argument('--years', type=float, default=DEFAULT_YEARS)
+    parser.add_argument('--exit-ratio', type=float, default=1.0, help='Sell at this multiple of the Sticker Price')
+    parser.add_argument('--per-ticker', action='store_true', help='Include per-ticker results')
+    args = parser.parse_args()
+
+    symbols = [s.strip().upper() for s in args.symbols.split(',')] if args.symbols else None
+    universe = load_universe(args.data_dir, symbols)
+    result = run_backtest(universe, marr=args.marr, years=args.years, exit_ratio=args.exit_ratio)
+    if not args.per_ticker:
+        result.pop('perTicker')
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == '__main__':
+    main()
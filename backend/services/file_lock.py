@@ -0,0 +1,32 @@
+"""
+Inter-process file lock
+
+Serializes read-modify-write cycles on files shared by several worker
+processes (see backend/gunicorn.conf.py). Uses flock on a `<path>.lock`
+sidecar file; on platforms without fcntl it only locks within the process.
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: single-process development only
+    fcntl = None
+
+_thread_lock = threading.Lock()
+
+
+@contextmanager
+def file_lock(path: str):
+    """Hold an exclusive lock for `path` across processes (and threads of this process)."""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with _thread_lock, open(f'{path}.lock', 'a') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
@@ -0,0 +1,331 @@
+"""
+Quantitative Fisher Scoring Service
+
+Scores the Fisher criteria that can be derived from fundamentals for the whole
+universe in one vectorized pass:
+
+    1  Market Potential         average of EPS and revenue growth (rateMarketPotential)
+    5  Profit Margin            ROE (rateProfitMargin)
+    13 Future Equity Financing  annual change in diluted share count
+
+Thresholds for 1 and 5 match src/utils/fisherCalculations.ts. Facts are
+upserted as they change; only rows whose facts actually changed are rescored,
+and the sorted columns behind universe percentiles are rebuilt lazily on the
+next query. The index is persisted to FISHER_SCORES_PATH.
+"""
+
+import os
+import json
+import time
+import threading
+from datetime import date
+import numpy as np
+from typing import Dict, Iterable, List, Optional
+
+from backend.services.file_lock import file_lock
+from backend.services.point_in_time import PointInTimeIndex
+
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+FISHER_SCORES_PATH = os.getenv('FISHER_SCORES_PATH', os.path.join(project_root, '.tmp', 'fisher_scores.json'))
+
+# Facts that can be upserted (all percentages)
+FACT_FIELDS = ['epsGrowth', 'salesGrowth', 'roe', 'shareGrowth']
+# Criterion id -> rating column
+RATING_FIELDS = {1: 'marketPotential', 5: 'profitMargin', 13: 'equityFinancing'}
+SCORE_FIELDS = list(RATING_FIELDS.values()) + ['overallScore']
+PERCENTILE_FIELDS = FACT_FIELDS + SCORE_FIELDS
+SUMMARY_PERCENTILES = [10, 25, 50, 75, 90]
+
+# Rating = 1 + number of thresholds reached
+MARKET_POTENTIAL_THRESHOLDS = [5, 10, 15, 20]  # Average growth %
+PROFIT_MARGIN_THRESHOLDS = [5, 10, 15, 20]  # ROE %
+# Annual share count growth %: buybacks or flat earn a 5, over 5% dilution a 1
+EQUITY_FINANCING_THRESHOLDS = [5, 3, 1, 0]
+
+# Years of annual filings used for growth rates
+GROWTH_YEARS = 5
+REVENUE_CONCEPTS = ['Revenues', 'RevenueFromContractWithCustomerExcludingAssessedTax', 'SalesRevenueNet']
+EPS_CONCEPTS = ['EarningsPerShareDiluted', 'EarningsPerShareBasic']
+SHARE_CONCEPTS = ['WeightedAverageNumberOfDilutedSharesOutstanding', 'WeightedAverageNumberOfSharesOutstandingBasic']
+
+
+def _rate(values: np.ndarray, thresholds: List[float]) -> np.ndarray:
+    """1-5 rating from ascending thresholds; NaN stays unrated."""
+    with np.errstate(invalid='ignore'):
+        rating = 1 + sum((values >= t).astype(np.float64) for t in thresholds)
+    return np.where(np.isnan(values), np.nan, rating)
+
+
+def score(facts: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Rate every row of a fact table.
+
+    Args:
+        facts: Arrays for each of FACT_FIELDS (NaN = unknown)
+
+    Returns:
+        Arrays for each of SCORE_FIELDS; overallScore averages the available
+        ratings like calculateOverallFisherScore
+    """
+    avg_growth = (facts['epsGrowth'] + facts['salesGrowth']) / 2
+    # Lower dilution is better, so rate the negated share growth
+    ratings = {
+        'marketPotential': _rate(avg_growth, MARKET_POTENTIAL_THRESHOLDS),
+        'profitMargin': _rate(facts['roe'], PROFIT_MARGIN_THRESHOLDS),
+        'equityFinancing': _rate(-facts['shareGrowth'], [-t for t in EQUITY_FINANCING_THRESHOLDS]),
+    }
+    stacked = np.vstack(list(ratings.values()))
+    rated = np.count_nonzero(~np.isnan(stacked), axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        ratings['overallScore'] = np.where(rated > 0, np.nansum(stacked, axis=0) / rated, np.nan)
+    return ratings
+
+
+def _cagr(series: List[tuple], years: int = GROWTH_YEARS) -> Optional[float]:
+    """Compound annual growth % over up to `years` of annual values."""
+    series = series[-(years + 1):]
+    if len(series) < 2:
+        return None
+    (start_end, first), (last_end, last) = series[0], series[-1]
+    span = (date.fromisoformat(last_end) - date.fromisoformat(start_end)).days / 365.25
+    if first <= 0 or last <= 0 or span <= 0:
+        return None
+    return ((last / first) ** (1 / span) - 1) * 100
+
+
+def facts_from_companyfacts(companyfacts: Dict, as_of: Optional[str] = None) -> Dict[str, Optional[float]]:
+    """
+    Derive FACT_FIELDS from SEC companyfacts JSON (see sec_edgar.get_company_facts).
+
+    Growth rates are CAGRs over the last GROWTH_YEARS annual filings; ROE uses
+    the latest annual net income and year-end equity. With as_of (ISO date),
+    only facts filed by then are used.
+    """
+    index = PointInTimeIndex(companyfacts)
+    revenue = index.history(REVENUE_CONCEPTS, as_of)
+    eps = index.history(EPS_CONCEPTS, as_of, unit='USD/shares')
+    shares = index.history(SHARE_CONCEPTS, as_of, unit='shares')
+    net_income = index.value(['NetIncomeLoss'], as_of, annual=True)
+    equity = index.value(['StockholdersEquity'], as_of, annual=True)
+
+    return {
+        'epsGrowth': _cagr(eps),
+        'salesGrowth': _cagr(revenue),
+        'roe': net_income / equity * 100 if net_income is not None and equity else None,
+        'shareGrowth': _cagr(shares),
+    }
+
+
+class FisherScoreIndex:
+    """Fact and rating columns indexed by row, with cached sorted columns for percentiles."""
+
+    def __init__(self, capacity: int = 1024):
+        self._lock = threading.Lock()
+        self._rows: Dict[str, int] = {}
+        self._symbols: List[str] = []
+        self._columns = {field: np.full(capacity, np.nan) for field in PERCENTILE_FIELDS + ['updatedAt']}
+        self._sorted: Dict[str, np.ndarray] = {}  # Field -> ascending non-NaN values, dropped when dirty
+        self.rescored_rows = 0
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def _grow(self) -> None:
+        for field, column in self._columns.items():
+            grown = np.full(len(column) * 2, np.nan)
+            grown[:len(column)] = column
+            self._columns[field] = grown
+
+    def _row(self, symbol: str) -> int:
+        row = self._rows.get(symbol)
+        if row is None:
+            if len(self._symbols) == len(self._columns['roe']):
+                self._grow()
+            row = len(self._symbols)
+            self._rows[symbol] = row
+            self._symbols.append(symbol)
+        return row
+
+    def _rescore(self, rows: np.ndarray) -> None:
+        """Recompute ratings for the given rows only."""
+        c = self._columns
+        ratings = score({field: c[field][rows] for field in FACT_FIELDS})
+        for field, values in ratings.items():
+            c[field][rows] = values
+        self.rescored_rows += len(rows)
+
+    def upsert(self, records: Iterable[Dict]) -> int:
+        """
+        Insert or update facts. Each record has a 'symbol' and any of FACT_FIELDS;
+        absent fields keep their current value. Rows whose facts are unchanged are
+        not rescored.
+
+        Returns:
+            Number of rows whose facts changed
+        """
+        with self._lock:
+            changed = []
+            now = time.time()
+            for record in records:
+                symbol = record['symbol'].upper()
+                is_new = symbol not in self._rows
+                row = self._row(symbol)
+                dirty = is_new
+                for field in FACT_FIELDS:
+                    value = record.get(field)
+                    if value is None:
+                        continue
+                    current = self._columns[field][row]
+                    if not current == value:  # NaN never equals
+                        self._columns[field][row] = value
+                        dirty = True
+                if dirty:
+                    self._columns['updatedAt'][row] = now
+                    changed.append(row)
+
+            if changed:
+                self._rescore(np.array(changed))
+                self._sorted.clear()
+            return len(changed)
+
+    def _sorted_values(self, field: str) -> np.ndarray:
+        """Non-NaN values of a field, ascending (built on demand, cached until the next change)."""
+        values = self._sorted.get(field)
+        if values is None:
+            column = self._columns[field][:len(self._symbols)]
+            values = np.sort(column[~np.isnan(column)])
+            self._sorted[field] = values
+        return values
+
+    def _percentile(self, field: str, value: float) -> Optional[float]:
+        """Share of the universe (%) at or below value."""
+        values = self._sorted_values(field)
+        if np.isnan(value) or len(values) == 0:
+            return None
+        return float(np.searchsorted(values, value, side='right') / len(values) * 100)
+
+    def get(self, symbols: Iterable[str]) -> List[Dict]:
+        """Facts, ratings and universe percentiles for known symbols (unknown ones are skipped)."""
+        with self._lock:
+            results = []
+            for symbol in symbols:
+                row = self._rows.get(symbol.upper())
+                if row is None:
+                    continue
+                values = {field: float(self._columns[field][row]) for field in PERCENTILE_FIELDS}
+                results.append({
+                    'symbol': self._symbols[row],
+                    **{field: value if np.isfinite(value) else None for field, value in values.items()},
+                    'ratings': {
+                        str(criterion): int(values[field]) if np.isfinite(values[field]) else None
+                        for criterion, field in RATING_FIELDS.items()
+                    },
+                    'percentiles': {field: self._percentile(field, value) for field, value in values.items()},
+                    'updatedAt': float(self._columns['updatedAt'][row]),
+                })
+            return results
+
+    def universe(self) -> Dict:
+        """Distribution of every fact and rating across the universe."""
+        with self._lock:
+            summary = {}
+            for field in PERCENTILE_FIELDS:
+                values = self._sorted_values(field)
+                summary[field] = {
+                    'count': int(len(values)),
+                    'mean': float(values.mean()) if len(values) else None,
+                    'percentiles': {
+                        str(p): float(v) for p, v in zip(SUMMARY_PERCENTILES, np.percentile(values, SUMMARY_PERCENTILES))
+                    } if len(values) else {},
+                }
+            return {'tickers': len(self._symbols), 'fields': summary}
+
+    def stats(self) -> Dict:
+        with self._lock:
+            n = len(self._symbols)
+            return {
+                'tickers': n,
+                'scored': int(np.count_nonzero(~np.isnan(self._columns['overallScore'][:n]))),
+                'rescoredRows': self.rescored_rows,
+                'cachedPercentileFields': sorted(self._sorted),
+            }
+
+    def merge(self, data: Dict) -> int:
+        """
+        Apply rows from persisted data that are newer (by updatedAt) than ours,
+        keeping their updatedAt. Returns the number of rows applied.
+        """
+        columns = data.get('columns', {})
+        symbols = data.get('symbols', [])
+        updated_at = columns.get('updatedAt') or [None] * len(symbols)
+        with self._lock:
+            newer = []
+            for i, symbol in enumerate(symbols):
+                row = self._rows.get(symbol)
+                theirs = updated_at[i]
+                if row is None or (theirs is not None and not self._columns['updatedAt'][row] >= theirs):
+                    newer.append(i)
+        self.upsert([
+            {'symbol': symbols[i], **{field: columns.get(field, [])[i] for field in FACT_FIELDS}}
+            for i in newer
+        ])
+        with self._lock:
+            for i in newer:
+                self._columns['updatedAt'][self._rows[symbols[i]]] = np.nan if updated_at[i] is None else updated_at[i]
+        return len(newer)
+
+    @staticmethod
+    def _read(path: str) -> Dict:
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, json.JSONDecodeError) as e:
+            print(f'Warning: Could not load Fisher scores: {e}')
+            return {}
+
+    def save(self, path: str = FISHER_SCORES_PATH) -> None:
+        """
+        Persist facts to JSON (ratings are recomputed on load).
+
+        Worker processes share the file: under a file lock, rows another
+        worker saved more recently are merged in first so its updates are kept.
+        """
+        with file_lock(path):
+            self.merge(self._read(path))
+            with self._lock:
+                n = len(self._symbols)
+                data = {
+                    'symbols': list(self._symbols),
+                    'columns': {
+                        field: [None if np.isnan(v) else v for v in self._columns[field][:n].tolist()]
+                        for field in FACT_FIELDS + ['updatedAt']
+                    },
+                }
+            tmp_path = f'{path}.{os.getpid()}.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str = FISHER_SCORES_PATH) -> 'FisherScoreIndex':
+        """Load a persisted index, or return an empty one."""
+        index = cls()
+        index.merge(index._read(path))
+        return index
+
+
+_fisher_score_index: Optional[FisherScoreIndex] = None
+_fisher_score_index_lock = threading.Lock()
+
+
+def get_fisher_score_index() -> FisherScoreIndex:
+    """Shared index, restored from disk on first use (or during warm_up)."""
+    global _fisher_score_index
+    if _fisher_score_index is None:
+        with _fisher_score_index_lock:
+            if _fisher_score_index is None:
+                _fisher_score_index = FisherScoreIndex.load()
+    return _fisher_score_index
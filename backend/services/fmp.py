@@ -0,0 +1,69 @@
+"""
+Financial Modeling Prep Client
+
+Shared configuration and a pooled async HTTP client for FMP's /stable API.
+The client keeps connections alive across requests and is created on first
+use, so importing the app does not import httpx.
+"""
+
+import os
+from typing import Any, Optional
+
+from execution import telemetry
+
+FMP_API_KEY = os.getenv('FMP_API_KEY')
+FMP_BASE_URL = os.getenv('FMP_BASE_URL', 'https://financialmodelingprep.com/stable')
+FMP_TIMEOUT = float(os.getenv('FMP_TIMEOUT', 5))
+FMP_MAX_CONNECTIONS = int(os.getenv('FMP_MAX_CONNECTIONS', 20))
+
+_client = None
+
+
+class FMPError(Exception):
+    """An FMP request failed (not configured, connection, HTTP status or invalid JSON)."""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+    def http_status(self) -> int:
+        """Status to answer with: 503 when FMP is unavailable or rate limited, else 502."""
+        return 503 if self.status in (None, 429, 503) or self.status >= 500 else 502
+
+
+def get_client():
+    """The process-wide httpx.AsyncClient (created on first use, on the running event loop)."""
+    global _client
+    if _client is None:
+        import httpx
+        _client = httpx.AsyncClient(
+            base_url=FMP_BASE_URL,
+            timeout=FMP_TIMEOUT,
+            limits=httpx.Limits(max_connections=FMP_MAX_CONNECTIONS, max_keepalive_connections=FMP_MAX_CONNECTIONS),
+            headers={'Accept': 'application/json'}
+        )
+    return _client
+
+
+async def close_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+async def get_json(path: str, stage: str, **params) -> Any:
+    """GET an FMP endpoint (e.g. '/quote'), timed as telemetry stage `stage`."""
+    if not FMP_API_KEY:
+        raise FMPError('FMP_API_KEY is not configured', status=503)
+    import httpx
+
+    with telemetry.span(stage):
+        try:
+            response = await get_client().get(path, params=dict(params, apikey=FMP_API_KEY))
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            raise FMPError(f'FMP {path} returned {e.response.status_code}', status=e.response.status_code) from e
+        except (httpx.HTTPError, ValueError) as e:
+            raise FMPError(f'FMP {path} failed: {e}') from e
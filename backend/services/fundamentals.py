@@ -0,0 +1,260 @@
+"""
+Fundamentals Service
+
+One normalized fundamentals record per symbol (EPS, P/E, ROE, debt/equity,
+current ratio, EPS/sales/book value growth, company name), built server-side
+from FMP's key-metrics-ttm, ratios-ttm, income-statement and profile endpoints.
+
+The four FMP calls run concurrently over the pooled client in
+backend/services/fmp.py, alongside the ROE resolver, so a lookup costs the
+slowest call instead of the sum of them. Records are cached per symbol for
+FUNDAMENTALS_CACHE_TTL_SECONDS and concurrent lookups of the same symbol share
+one fetch. A record with an endpoint missing because of an upstream error is
+returned but not cached, so a transient failure is not served for the TTL.
+
+The field mapping follows what the frontend used to do in fmpService.ts:
+the /stable endpoints' TTM field names first, older names as fallbacks.
+
+Every fetched record also updates its ticker in the screener index (EPS, ROE
+and the default Rule #1 growth rate).
+"""
+
+import os
+import math
+import time
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from backend.services import fmp
+from backend.services.roe_resolver import roe_resolver
+from backend.services.screener import get_screener_index
+from backend.services.valuation import default_growth_rate
+from execution import telemetry
+
+FUNDAMENTALS_CACHE_TTL_SECONDS = float(os.getenv('FUNDAMENTALS_CACHE_TTL_SECONDS', 3600))
+FUNDAMENTALS_CACHE_MAX = int(os.getenv('FUNDAMENTALS_CACHE_MAX', 2000))  # Symbols kept before expired entries are dropped
+
+FUNDAMENTALS_LOOKUPS = telemetry.REGISTRY.counter(
+    'fundamentals_lookups_total',
+    'Fundamentals lookups by how they were served (cache, joined an in-flight fetch, fetched)',
+    ['result']
+)
+
+ENDPOINTS = {
+    'metrics': ('/key-metrics-ttm', {}),
+    'ratios': ('/ratios-ttm', {}),
+    'income': ('/income-statement', {'limit': 5}),
+    'profile': ('/profile', {}),
+}
+
+
+def _number(value: Any) -> Optional[float]:
+    try:
+        num = float(value)
+    except (TypeError, ValueError):
+        return None
+    return num if math.isfinite(num) else None
+
+
+def _first(*values: Any) -> Any:
+    return next((v for v in values if v is not None), None)
+
+
+def normalize_eps(value: Any) -> Optional[float]:
+    """EPS (negative for losses); values beyond +-1000 are treated as bad data."""
+    num = _number(value)
+    return num if num is not None and abs(num) <= 1000 else None
+
+
+def _first_row(data: Any) -> Dict:
+    if isinstance(data, list):
+        return data[0] if data and isinstance(data[0], dict) else {}
+    return data if isinstance(data, dict) else {}
+
+
+def growth_from_income_statements(statements: Any) -> Dict[str, float]:
+    """
+    Year-over-year EPS and revenue growth (%) from the two most recent annual
+    income statements (FMP's growth endpoint needs a paid plan).
+    """
+    if not isinstance(statements, list) or len(statements) < 2:
+        return {}
+    annual = [
+        s for s in statements
+        if s.get('period') == 'FY' or any(part in s.get('date', '') for part in ('12-31', '01-31', '-12-', '-01-'))
+    ]
+    current, previous = annual[:2] if len(annual) >= 2 else statements[:2]
+
+    def eps(statement):
+        value = statement.get('eps') or statement.get('earningsPerShare') or statement.get('netIncomePerShare')
+        if not value and statement.get('netIncome') and statement.get('weightedAverageShsOut'):
+            value = statement['netIncome'] / statement['weightedAverageShsOut']
+        return _number(value)
+
+    def revenue(statement):
+        return _number(statement.get('revenue') or statement.get('totalRevenue') or statement.get('revenues'))
+
+    growth = {}
+    for key, value_of in (('epsGrowth', eps), ('salesGrowth', revenue)):
+        now, before = value_of(current), value_of(previous)
+        if now and before:
+            growth[key] = (now - before) / abs(before) * 100
+    return growth
+
+
+def build_fundamentals(
+    metrics: Optional[Dict] = None,
+    ratios: Optional[Dict] = None,
+    income: Optional[List[Dict]] = None,
+    profile: Optional[Dict] = None
+) -> Dict:
+    """Merge the FMP responses into one FMPFundamentals-shaped record (None where unknown)."""
+    metrics = metrics or profile or {}
+    ratios = ratios or {}
+    profile = profile or {}
+    growth = growth_from_income_statements(income)
+
+    eps = _first(
+        ratios.get('netIncomePerShareTTM'), ratios.get('netIncomePerShare'),
+        metrics.get('eps'), metrics.get('earningsPerShare'), metrics.get('earningsPerShareTTM'),
+        metrics.get('trailingEps'), ratios.get('earningsPerShare'), ratios.get('eps')
+    )
+    pe_ratio = _first(
+        ratios.get('priceToEarningsRatioTTM'), ratios.get('priceToEarningsRatio'),
+        metrics.get('peRatio'), metrics.get('priceToEarningsRatio'), metrics.get('priceEarningsRatio'),
+        metrics.get('pe'), ratios.get('peRatio'), ratios.get('priceEarningsRatio')
+    )
+    debt_to_equity = _first(
+        ratios.get('debtToEquityRatioTTM'), ratios.get('debtToEquityRatio'),
+        metrics.get('debtEquityRatio'), metrics.get('debtToEquity'), metrics.get('debtToEquityRatio'),
+        ratios.get('debtEquityRatio'), ratios.get('debtToEquity')
+    )
+    current_ratio = _first(
+        ratios.get('currentRatioTTM'), metrics.get('currentRatioTTM'),
+        ratios.get('currentRatio'), metrics.get('currentRatio')
+    )
+    company_name = next(
+        (v for v in (profile.get('companyName'), profile.get('name'), profile.get('symbol'),
+                     metrics.get('companyName'), metrics.get('name')) if v),
+        None
+    )
+    return {
+        'eps': normalize_eps(eps),
+        'peRatio': _number(pe_ratio),
+        'roe': None,
+        'debtToEquity': _number(debt_to_equity),
+        'currentRatio': _number(current_ratio),
+        'epsGrowth': growth.get('epsGrowth'),
+        'salesGrowth': growth.get('salesGrowth'),
+        'bookValueGrowth': None,  # Only in FMP's paid growth endpoint
+        'companyName': str(company_name) if company_name else None,
+    }
+
+
+async def fetch_fundamentals(symbol: str) -> Dict:
+    """
+    Fundamentals for symbol from FMP plus the ROE resolver, fetched concurrently.
+
+    Returns:
+        The record, with 'roeSource' and 'unavailable' (endpoints that failed)
+
+    Raises:
+        fmp.FMPError if every FMP endpoint failed
+    """
+    loop = asyncio.get_running_loop()
+    names = list(ENDPOINTS)
+    results = await asyncio.gather(
+        *(fmp.get_json(path, f'fmp.{name}', symbol=symbol, **params) for name, (path, params) in ENDPOINTS.items()),
+        loop.run_in_executor(None, roe_resolver.resolve, symbol),
+        return_exceptions=True
+    )
+    responses, roe = dict(zip(names, results[:-1])), results[-1]
+
+    errors = {name: r for name, r in responses.items() if isinstance(r, Exception)}
+    if len(errors) == len(responses):
+        raise next(iter(errors.values()))
+    data = {name: None if name in errors else r for name, r in responses.items()}
+
+    record = build_fundamentals(
+        metrics=_first_row(data['metrics']) or None,
+        ratios=_first_row(data['ratios']) or None,
+        income=data['income'] if isinstance(data['income'], list) else None,
+        profile=_first_row(data['profile']) or None
+    )
+    if isinstance(roe, dict):
+        record['roe'], record['roeSource'] = roe['roe'], roe['source']
+        # No ROE because sources failed or timed out (rather than having no value) is transient
+        roe_failed = roe['roe'] is None and any('error' in outcome for outcome in roe['sources'].values())
+    else:
+        record['roeSource'] = None
+        roe_failed = True
+    record['unavailable'] = sorted(errors) + (['roe'] if roe_failed else [])
+    update_screener(symbol, record)
+    return record
+
+
+def update_screener(symbol: str, record: Dict) -> None:
+    """Upsert the screener inputs in record; fields that are None keep their indexed value."""
+    row = {
+        'eps': record['eps'],
+        'growthRate': default_growth_rate(record['epsGrowth'], record['salesGrowth'], record['bookValueGrowth']),
+        'roe': record['roe'],
+    }
+    if any(value is not None for value in row.values()):
+        get_screener_index().upsert([{'symbol': symbol, **row}])
+
+
+class FundamentalsCache:
+    """
+    Args:
+        fetch: async fetch(symbol) -> record
+        ttl_seconds: How long complete records are served from cache
+        max_entries: Cache size at which expired entries are dropped
+    """
+
+    def __init__(self, fetch=fetch_fundamentals, ttl_seconds: float = FUNDAMENTALS_CACHE_TTL_SECONDS,
+                 max_entries: int = FUNDAMENTALS_CACHE_MAX):
+        self.fetch = fetch
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._cache: Dict[str, tuple] = {}  # symbol -> (record, fetched_at)
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+    async def get(self, symbol: str) -> Dict:
+        """Record for symbol; raises fmp.FMPError if upstream fails."""
+        symbol = symbol.strip().upper()
+        entry = self._cache.get(symbol)
+        if entry is not None and time.monotonic() - entry[1] < self.ttl_seconds:
+            FUNDAMENTALS_LOOKUPS.inc(result='cache')
+            return entry[0]
+
+        future = self._in_flight.get(symbol)
+        if future is not None:
+            FUNDAMENTALS_LOOKUPS.inc(result='joined')
+        else:
+            FUNDAMENTALS_LOOKUPS.inc(result='fetched')
+            future = self._in_flight[symbol] = asyncio.ensure_future(self._fetch(symbol))
+        # Shielded: a caller that disconnects must not cancel others' shared result
+        return await asyncio.shield(future)
+
+    async def _fetch(self, symbol: str) -> Dict:
+        try:
+            record = await self.fetch(symbol)
+        finally:
+            del self._in_flight[symbol]
+        if not record.get('unavailable'):
+            now = time.monotonic()
+            self._cache[symbol] = (record, now)
+            if len(self._cache) > self.max_entries:
+                self._cache = {s: e for s, e in self._cache.items() if now - e[1] < self.ttl_seconds}
+        return record
+
+    def stats(self) -> Dict:
+        return {
+            'cachedSymbols': len(self._cache),
+            'inFlight': len(self._in_flight),
+            'ttlSeconds': self.ttl_seconds,
+        }
+
+
+fundamentals_cache = FundamentalsCache()
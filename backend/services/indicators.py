@@ -0,0 +1,134 @@
+"""
+Rule #1 Tools
+
+Vectorized MACD (8/17/9), slow stochastic (14/5) and 10-day moving average,
+the three timing tools Phil Town uses alongside the Sticker and MOS prices.
+
+Every function works along axis 0 (time), so a 1-D series and a
+(days x tickers) matrix are handled by the same code. compute_indicators can
+be seeded with the EMA state of the previous bar, which is how the price
+history store updates a series incrementally when new bars arrive.
+"""
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import Dict, Optional
+
+MACD_FAST = 8
+MACD_SLOW = 17
+MACD_SIGNAL = 9
+STOCH_PERIOD = 14  # %K lookback
+STOCH_SIGNAL = 5  # %D = moving average of %K
+SMA_PERIOD = 10
+
+# Rows before an update that rolling windows need: %D over %K over highs/lows
+LOOKBACK = max(STOCH_PERIOD + STOCH_SIGNAL - 2, SMA_PERIOD - 1)
+
+# EMA states needed to continue a series from its last bar
+EMA_FIELDS = ['emaFast', 'emaSlow', 'macdSignal']
+INDICATOR_FIELDS = ['emaFast', 'emaSlow', 'macd', 'macdSignal', 'macdHist', 'stochK', 'stochD', 'sma10']
+
+TOOL_BUY = 'BUY'
+TOOL_SELL = 'SELL'
+TOOL_WAIT = 'WAIT'
+
+
+def ema(values: np.ndarray, span: int, seed: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Exponential moving average along axis 0 (alpha = 2 / (span + 1)).
+
+    Starts from seed (the previous bar's EMA) or, where that is NaN, from the
+    first value. Loops over time but is vectorized across tickers.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    alpha = 2 / (span + 1)
+    if values.ndim == 1:
+        # Plain floats are far cheaper than 0-d array operations for a single series
+        prev = np.nan if seed is None else float(seed)
+        out = []
+        for x in values.tolist():
+            if prev != prev:
+                prev = x
+            elif x == x:
+                prev += alpha * (x - prev)
+            out.append(prev)
+        return np.array(out)
+
+    out = np.empty_like(values)
+    prev = np.full(values.shape[1:], np.nan) if seed is None else np.asarray(seed, dtype=np.float64)
+    for t in range(len(values)):
+        x = values[t]
+        prev = np.where(np.isnan(prev), x, np.where(np.isnan(x), prev, prev + alpha * (x - prev)))
+        out[t] = prev
+    return out
+
+
+def _rolling(values: np.ndarray, window: int, reduce) -> np.ndarray:
+    """Rolling reduction along axis 0; the first window - 1 rows are NaN."""
+    out = np.full(values.shape, np.nan)
+    if len(values) >= window:
+        out[window - 1:] = reduce(sliding_window_view(values, window, axis=0), axis=-1)
+    return out
+
+
+def sma(values: np.ndarray, period: int) -> np.ndarray:
+    """Simple moving average along axis 0."""
+    return _rolling(np.asarray(values, dtype=np.float64), period, np.mean)
+
+
+def stochastic(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> Dict[str, np.ndarray]:
+    """Slow stochastic: %K over STOCH_PERIOD bars and %D, its STOCH_SIGNAL-bar average."""
+    highest = _rolling(high, STOCH_PERIOD, np.max)
+    lowest = _rolling(low, STOCH_PERIOD, np.min)
+    span = highest - lowest
+    with np.errstate(invalid='ignore', divide='ignore'):
+        k = np.where(span > 0, (close - lowest) / span * 100, np.where(np.isnan(span), np.nan, 50.0))
+    return {'stochK': k, 'stochD': sma(k, STOCH_SIGNAL)}
+
+
+def compute_indicators(
+    close: np.ndarray,
+    high: Optional[np.ndarray] = None,
+    low: Optional[np.ndarray] = None,
+    seed: Optional[Dict[str, np.ndarray]] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Compute every tool for a series or a (days x tickers) matrix.
+
+    Args:
+        close, high, low: Prices along axis 0 (high/low default to close)
+        seed: EMA_FIELDS values of the bar before close[0], to continue a series
+
+    Returns:
+        Arrays for each of INDICATOR_FIELDS, shaped like close
+    """
+    close = np.asarray(close, dtype=np.float64)
+    high = close if high is None else np.asarray(high, dtype=np.float64)
+    low = close if low is None else np.asarray(low, dtype=np.float64)
+    seed = seed or {}
+
+    fast = ema(close, MACD_FAST, seed.get('emaFast'))
+    slow = ema(close, MACD_SLOW, seed.get('emaSlow'))
+    macd = fast - slow
+    signal = ema(macd, MACD_SIGNAL, seed.get('macdSignal'))
+
+    return {
+        'emaFast': fast,
+        'emaSlow': slow,
+        'macd': macd,
+        'macdSignal': signal,
+        'macdHist': macd - signal,
+        **stochastic(high, low, close),
+        'sma10': sma(close, SMA_PERIOD),
+    }
+
+
+def tools_signal(close, macd_hist, stoch_k, stoch_d, sma10) -> np.ndarray:
+    """
+    'BUY' when all three tools are bullish (MACD above its signal, %K above %D,
+    price above the 10-day MA), 'SELL' when all three are bearish, else 'WAIT'.
+    """
+    with np.errstate(invalid='ignore'):
+        bullish = [np.asarray(macd_hist) > 0, np.asarray(stoch_k) > np.asarray(stoch_d), np.asarray(close) > np.asarray(sma10)]
+        bearish = [np.asarray(macd_hist) < 0, np.asarray(stoch_k) < np.asarray(stoch_d), np.asarray(close) < np.asarray(sma10)]
+    return np.where(np.all(bullish, axis=0), TOOL_BUY, np.where(np.all(bearish, axis=0), TOOL_SELL, TOOL_WAIT))
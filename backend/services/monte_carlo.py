@@ -0,0 +1,127 @@
+"""
+Monte Carlo Valuation Service
+
+Samples growth rate, future PE and MARR from configurable distributions and
+computes the resulting Sticker Price / MOS price distribution for a stock in a
+single vectorized pass.
+"""
+
+import numpy as np
+from typing import Dict, List, Optional
+
+from backend.services.valuation import DEFAULT_YEARS, mos_price, sticker_price
+
+DISTRIBUTIONS = ['fixed', 'normal', 'uniform', 'triangular', 'lognormal']
+PERCENTILES = [5, 10, 25, 50, 75, 90, 95]
+
+
+def sample(rng: np.random.Generator, spec: Dict, size: int) -> np.ndarray:
+    """
+    Draw samples from a distribution spec.
+
+    Specs:
+        {'kind': 'fixed', 'value': v}
+        {'kind': 'normal', 'mean': m, 'std': s}
+        {'kind': 'uniform', 'low': a, 'high': b}
+        {'kind': 'triangular', 'low': a, 'mode': c, 'high': b}
+        {'kind': 'lognormal', 'mean': m, 'std': s}  (mean/std of the underlying normal)
+    """
+    kind = spec.get('kind', 'fixed')
+    try:
+        if kind == 'fixed':
+            return np.full(size, float(spec['value']))
+        if kind == 'normal':
+            return rng.normal(spec['mean'], spec['std'], size)
+        if kind == 'uniform':
+            return rng.uniform(spec['low'], spec['high'], size)
+        if kind == 'triangular':
+            return rng.triangular(spec['low'], spec['mode'], spec['high'], size)
+        if kind == 'lognormal':
+            return rng.lognormal(spec['mean'], spec['std'], size)
+    except KeyError as e:
+        raise ValueError(f'{kind} distribution is missing parameter {e}')
+    except (TypeError, ValueError) as e:
+        raise ValueError(f'Invalid {kind} distribution: {e}')
+    raise ValueError(f'Unknown distribution {kind!r}; choose one of {", ".join(DISTRIBUTIONS)}')
+
+
+def _summary(values: np.ndarray) -> Dict:
+    finite = values[np.isfinite(values)]
+    if finite.size == 0:
+        return {'mean': None, 'std': None, 'percentiles': {str(p): None for p in PERCENTILES}}
+    return {
+        'mean': float(finite.mean()),
+        'std': float(finite.std()),
+        'percentiles': dict(zip((str(p) for p in PERCENTILES), np.percentile(finite, PERCENTILES).tolist())),
+    }
+
+
+def simulate(
+    eps: float,
+    growth_rate: Dict,
+    marr: Dict,
+    future_pe: Optional[Dict] = None,
+    current_price: Optional[float] = None,
+    years: float = DEFAULT_YEARS,
+    samples: int = 20000,
+    grid_size: int = 5,
+    seed: Optional[int] = None
+) -> Dict:
+    """
+    Simulate the Sticker Price distribution for one stock.
+
+    Args:
+        eps: Current EPS
+        growth_rate: Distribution spec for the growth rate (percent)
+        marr: Distribution spec for MARR (decimal)
+        future_pe: Optional distribution spec for future PE (default: 2 x growth, clamped to [8, 25])
+        current_price: Optional current price for probability estimates
+        years: Projection horizon
+        samples: Number of draws
+        grid_size: Points per axis of the growth x MARR sensitivity grid
+        seed: Optional RNG seed for reproducible results
+
+    Returns:
+        Sticker/MOS summaries, price probabilities and a sensitivity grid
+    """
+    rng = np.random.default_rng(seed)
+    growth = sample(rng, growth_rate, samples)
+    marr_samples = sample(rng, marr, samples)
+    pe = sample(rng, future_pe, samples) if future_pe else None
+
+    sticker = sticker_price(eps, growth, years, marr_samples, pe)
+    mos = mos_price(sticker)
+
+    result = {
+        'samples': samples,
+        'stickerPrice': _summary(sticker),
+        'mosPrice': _summary(mos),
+        'probPriceBelowMos': None,
+        'probPriceBelowSticker': None,
+    }
+    if current_price is not None:
+        result['probPriceBelowMos'] = float(np.mean(current_price <= mos))
+        result['probPriceBelowSticker'] = float(np.mean(current_price <= sticker))
+
+    # Sensitivity grid: sticker price across the central 90% of growth and MARR draws,
+    # holding future PE at its rule (or its sampled median when PE is sampled)
+    growth_axis = _grid_axis(growth, grid_size)
+    marr_axis = _grid_axis(marr_samples, grid_size)
+    grid_pe = float(np.median(pe)) if pe is not None else None
+    grid = sticker_price(eps, growth_axis[:, None], years, marr_axis[None, :], grid_pe)
+    result['sensitivity'] = {
+        'growthRate': growth_axis.tolist(),
+        'marr': marr_axis.tolist(),
+        'stickerPrice': _finite_rows(grid),
+    }
+    return result
+
+
+def _grid_axis(draws: np.ndarray, grid_size: int) -> np.ndarray:
+    """Evenly spaced points over the 5th-95th percentile of draws (one point if they are constant)."""
+    low, high = np.percentile(draws, [5, 95])
+    return np.array([low]) if low == high else np.linspace(low, high, grid_size)
+
+
+def _finite_rows(grid: np.ndarray) -> List[List[Optional[float]]]:
+    return [[v if np.isfinite(v) else None for v in row] for row in grid.tolist()]
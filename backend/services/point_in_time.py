@@ -0,0 +1,263 @@
+"""
+Point-in-Time Fundamentals Index
+
+Answers "what was the latest value of this concept that was public on date D"
+from SEC companyfacts without look-ahead bias.
+
+Each concept/unit is kept sorted by filing date (`filed`) with a running
+"best fact so far" (latest period end, then latest filing) so an as-of lookup
+is one binary search. Series are stored as compact numpy columns; cached
+indexes convert every concept up front and drop the raw companyfacts JSON.
+"""
+
+import sys
+import threading
+from datetime import date, timedelta
+from operator import itemgetter
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from backend.services.sec_edgar import get_company_facts
+from execution import telemetry
+
+ANNUAL_FORMS = ('10-K', '10-K/A', '20-F', '40-F')
+ANNUAL_MIN_DAYS = 350
+ANNUAL_MAX_DAYS = 380
+INDEX_CACHE_SIZE = 256  # Companies kept in memory
+
+
+def is_annual(fact: Dict) -> bool:
+    """Whether a fact is a full fiscal-year value (or a year-end instant) from an annual report."""
+    if not fact.get('form', '').startswith(ANNUAL_FORMS):
+        return False
+    if 'start' not in fact:
+        return True  # Instant (balance sheet) value
+    days = (date.fromisoformat(fact['end']) - date.fromisoformat(fact['start'])).days
+    return ANNUAL_MIN_DAYS <= days <= ANNUAL_MAX_DAYS
+
+
+class _Codes:
+    """Process-wide small-integer codes for a low-cardinality string field (forms, fiscal periods)."""
+
+    def __init__(self, dtype):
+        self.dtype = dtype
+        self._codes: Dict[str, int] = {'': 0}
+        self._values: List[str] = ['']
+        self._lock = threading.Lock()
+
+    def encode(self, values: Iterable[Optional[str]]) -> np.ndarray:
+        codes = self._codes
+        values = [value or '' for value in values]
+        for value in set(values) - codes.keys():
+            with self._lock:
+                if value not in codes:
+                    codes[value] = len(self._values)
+                    self._values.append(value)
+        return np.array([codes[value] for value in values], dtype=self.dtype)
+
+    def decode(self, code: int) -> Optional[str]:
+        return self._values[code] or None
+
+    def matching(self, predicate: Callable[[str], bool]) -> np.ndarray:
+        return np.array([code for code, value in enumerate(list(self._values)) if predicate(value)], dtype=self.dtype)
+
+
+FORMS = _Codes(np.int16)
+FISCAL_PERIODS = _Codes(np.int8)
+
+NO_DATE = np.iinfo(np.int32).min  # start of an instant (balance sheet) fact
+_EPOCH = date(1970, 1, 1)
+
+
+def _days(values: List[Optional[str]]) -> np.ndarray:
+    """ISO dates (None allowed) as int32 days since 1970-01-01, NO_DATE for None."""
+    parsed = np.array(values, dtype='datetime64[D]')
+    return np.where(np.isnat(parsed), NO_DATE, parsed.astype(np.int64)).astype(np.int32)
+
+
+def _day(iso: str) -> int:
+    return (date.fromisoformat(iso) - _EPOCH).days
+
+
+def _iso(day: int) -> str:
+    return (_EPOCH + timedelta(days=day)).isoformat()
+
+
+class FactSeries:
+    """
+    Facts for one concept and unit, sorted by filing date.
+
+    Stored as columns rather than one dict per fact: dates as int32 days,
+    values as float64, fiscal year as int16, form and fiscal period as small
+    codes shared by all series, and accession numbers as indexes into a tuple
+    of interned strings (one filing reports many facts). A cached index holds
+    about 60 bytes per fact, including series objects and accession strings,
+    instead of about 700 for the parsed JSON; see scripts/bench-fact-memory.py.
+    Facts are rebuilt as dicts (without 'frame') when returned.
+    """
+
+    COLUMNS = ('filed', 'end', 'start', 'val', 'fy', 'fp', 'form', 'accn')
+    __slots__ = COLUMNS + ('accessions', 'best')
+
+    def __init__(self, facts: Iterable[Dict] = ()):
+        facts = sorted((f for f in facts if 'filed' in f and 'end' in f), key=itemgetter('filed'))
+        self.filed = _days([f['filed'] for f in facts])
+        self.end = _days([f['end'] for f in facts])
+        self.start = _days([f.get('start') for f in facts])
+        self.val = np.array([f.get('val') for f in facts], dtype=np.float64)
+        self.fy = np.array([f.get('fy') or 0 for f in facts], dtype=np.int16)
+        self.fp = FISCAL_PERIODS.encode(f.get('fp') for f in facts)
+        self.form = FORMS.encode(f.get('form') for f in facts)
+        accessions: Dict[str, int] = {}
+        self.accn = np.array([accessions.setdefault(f.get('accn', ''), len(accessions)) for f in facts], dtype=np.int32)
+        self.accessions = tuple(sys.intern(accn) for accn in accessions)
+        self._index_best()
+
+    def _index_best(self) -> None:
+        # best[i]: index of the fact with the latest period end among facts[:i + 1],
+        # preferring the later filing when periods tie (restatements)
+        n = len(self.end)
+        key = self.end.astype(np.int64) * max(n, 1) + np.arange(n)
+        self.best = (np.maximum.accumulate(key) % max(n, 1)).astype(np.int32) if n else np.zeros(0, dtype=np.int32)
+
+    def __len__(self) -> int:
+        return len(self.filed)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by this series (arrays plus accession strings)."""
+        return self._column_bytes() + sum(sys.getsizeof(accn) for accn in self.accessions)
+
+    def _column_bytes(self) -> int:
+        return sum(getattr(self, name).nbytes for name in self.COLUMNS + ('best',)) + sys.getsizeof(self.accessions)
+
+    def fact(self, i: int) -> Dict:
+        """Fact i (in filing order) as a SEC-style dict."""
+        fact = {
+            'end': _iso(int(self.end[i])),
+            'val': float(self.val[i]),
+            'accn': self.accessions[self.accn[i]],
+            'fy': int(self.fy[i]) or None,
+            'fp': FISCAL_PERIODS.decode(self.fp[i]),
+            'form': FORMS.decode(self.form[i]),
+            'filed': _iso(int(self.filed[i])),
+        }
+        if self.start[i] != NO_DATE:
+            fact['start'] = _iso(int(self.start[i]))
+        return fact
+
+    def _known(self, as_of: Optional[str]) -> int:
+        """Number of facts filed on or before as_of."""
+        return len(self) if as_of is None else int(np.searchsorted(self.filed, _day(as_of), side='right'))
+
+    def latest(self, as_of: Optional[str] = None) -> Optional[Dict]:
+        """Most recent-period fact filed on or before as_of (ISO date), or overall if None."""
+        i = self._known(as_of)
+        return self.fact(int(self.best[i - 1])) if i > 0 else None
+
+    def history(self, as_of: Optional[str] = None) -> List[Tuple[str, float]]:
+        """(period end, value) pairs known on as_of, oldest first, using the latest filing of each period."""
+        i = self._known(as_of)
+        ends, last = np.unique(self.end[:i][::-1], return_index=True)
+        return [(_iso(end), value) for end, value in zip(ends.tolist(), self.val[i - 1 - last].tolist())]
+
+    def annual(self) -> 'FactSeries':
+        """Subset of full fiscal-year values (and year-end instants) from annual reports; see is_annual."""
+        days = self.end - self.start
+        mask = np.isin(self.form, FORMS.matching(lambda form: form.startswith(ANNUAL_FORMS))) & (
+            (self.start == NO_DATE) | ((days >= ANNUAL_MIN_DAYS) & (days <= ANNUAL_MAX_DAYS))
+        )
+        subset = FactSeries.__new__(FactSeries)
+        for name in self.COLUMNS:
+            setattr(subset, name, getattr(self, name)[mask])
+        subset.accessions = self.accessions
+        subset._index_best()
+        return subset
+
+
+class PointInTimeIndex:
+    """Point-in-time view over one company's companyfacts."""
+
+    def __init__(self, companyfacts: Dict):
+        self.cik = companyfacts.get('cik')
+        self.entity_name = companyfacts.get('entityName')
+        self._facts = companyfacts.get('facts', {})
+        self._series: Dict[Tuple[str, str, bool], FactSeries] = {}
+
+    def series(self, concept: str, unit: str = 'USD', annual: bool = False) -> FactSeries:
+        """
+        FactSeries for a concept ('NetIncomeLoss' or 'dei:EntityCommonStockSharesOutstanding'),
+        built on first use.
+        """
+        key = (concept, unit, annual)
+        series = self._series.get(key)
+        if series is None:
+            if annual:
+                series = self.series(concept, unit).annual()
+            else:
+                taxonomy, _, name = concept.rpartition(':')
+                series = FactSeries(self._facts.get(taxonomy or 'us-gaap', {}).get(name, {}).get('units', {}).get(unit, []))
+            self._series[key] = series
+        return series
+
+    def compact(self) -> 'PointInTimeIndex':
+        """Convert every concept and unit now and drop the raw JSON (for indexes kept in memory)."""
+        for taxonomy, concepts in self._facts.items():
+            prefix = '' if taxonomy == 'us-gaap' else f'{taxonomy}:'
+            for name, concept in concepts.items():
+                for unit in concept.get('units', {}):
+                    self.series(prefix + name, unit)
+        self._facts = {}
+        return self
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the converted series (shared accession strings counted once)."""
+        accessions = {id(accn): accn for series in self._series.values() for accn in series.accessions}
+        return sum(series._column_bytes() for series in self._series.values()) + sum(map(sys.getsizeof, accessions.values()))
+
+    def latest(self, concept: str, as_of: Optional[str] = None, unit: str = 'USD', annual: bool = False) -> Optional[Dict]:
+        """Latest fact for a concept that was public on as_of (ISO date)."""
+        return self.series(concept, unit, annual).latest(as_of)
+
+    def value(self, concepts: List[str], as_of: Optional[str] = None, unit: str = 'USD', annual: bool = False) -> Optional[float]:
+        """Value of the first concept in the list with a fact public on as_of."""
+        for concept in concepts:
+            fact = self.latest(concept, as_of, unit, annual)
+            if fact is not None:
+                return fact['val']
+        return None
+
+    def history(self, concepts: List[str], as_of: Optional[str] = None, unit: str = 'USD', annual: bool = True) -> List[Tuple[str, float]]:
+        """Annual (period end, value) history known on as_of for the first concept that has any."""
+        for concept in concepts:
+            history = self.series(concept, unit, annual).history(as_of)
+            if history:
+                return history
+        return []
+
+
+_indexes: Dict[str, PointInTimeIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_point_in_time_index(symbol: str) -> Optional[PointInTimeIndex]:
+    """Cached PointInTimeIndex for a ticker, fetching companyfacts from SEC on first use."""
+    symbol = symbol.upper()
+    with _indexes_lock:
+        index = _indexes.get(symbol)
+    if index is not None:
+        telemetry.cache_result('point_in_time', 'hit')
+        return index
+
+    telemetry.cache_result('point_in_time', 'miss')
+    companyfacts = get_company_facts(symbol)
+    if companyfacts is None:
+        return None
+    index = PointInTimeIndex(companyfacts).compact()
+    with _indexes_lock:
+        if len(_indexes) >= INDEX_CACHE_SIZE:
+            _indexes.pop(next(iter(_indexes)))  # Oldest first
+        _indexes[symbol] = index
+    return index
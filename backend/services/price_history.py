@@ -0,0 +1,303 @@
+"""
+Price History Store
+
+Daily bars per ticker with the Rule #1 tools (see indicators.py) kept
+alongside the prices. New bars are merged into the series and only the rows
+from the first changed date on are recomputed, seeded with the EMA state of
+the bar before, so appending today's bar costs a few dozen rows of work rather
+than the whole history.
+
+Bars arrive through PriceIngestor, which parses CSV or JSON lines chunk by
+chunk so large uploads never have to be held in memory. Series are persisted
+to PRICE_HISTORY_DIR and loaded on first use.
+"""
+
+import os
+import re
+import csv
+import json
+import threading
+import numpy as np
+from typing import Dict, Iterable, List, Optional
+
+from backend.services.indicators import EMA_FIELDS, INDICATOR_FIELDS, LOOKBACK, compute_indicators, tools_signal
+
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+PRICE_HISTORY_DIR = os.getenv('PRICE_HISTORY_DIR', os.path.join(project_root, '.tmp', 'price_history'))
+
+PRICE_FIELDS = ['high', 'low', 'close']
+INGEST_BATCH_BARS = 5000  # Bars buffered per ticker before merging
+# Tickers become file names, so anything else (e.g. '../x') is rejected
+SYMBOL_PATTERN = re.compile(r'^[A-Z0-9][A-Z0-9.\-]{0,9}$')
+
+
+def normalize_symbol(symbol: str) -> str:
+    """Upper-cased ticker; raises ValueError unless it matches SYMBOL_PATTERN."""
+    normalized = (symbol or '').strip().upper()
+    if not SYMBOL_PATTERN.match(normalized):
+        raise ValueError(f'Invalid ticker symbol {symbol!r}')
+    return normalized
+
+
+class PriceSeries:
+    """Bars and indicators for one ticker, in date order, with room to append."""
+
+    def __init__(self, capacity: int = 256):
+        self.n = 0
+        self.dates = np.empty(capacity, dtype='datetime64[D]')
+        self.columns = {field: np.full(capacity, np.nan) for field in PRICE_FIELDS + INDICATOR_FIELDS}
+        self.rows_computed = 0
+
+    def __len__(self) -> int:
+        return self.n
+
+    def _reserve(self, size: int) -> None:
+        capacity = len(self.dates)
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        dates = np.empty(capacity, dtype='datetime64[D]')
+        dates[:self.n] = self.dates[:self.n]
+        self.dates = dates
+        for field, column in self.columns.items():
+            grown = np.full(capacity, np.nan)
+            grown[:self.n] = column[:self.n]
+            self.columns[field] = grown
+
+    def merge(self, dates: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> int:
+        """
+        Merge bars (any order; a bar for an existing date replaces it) and
+        recompute indicators from the earliest changed date.
+
+        Returns:
+            Index of the first recomputed row
+        """
+        dates = np.asarray(dates, dtype='datetime64[D]')
+        if len(dates) == 0:
+            return self.n
+        start = int(np.searchsorted(self.dates[:self.n], dates.min()))
+
+        # Existing tail from start, then the new bars; the last bar for a date wins
+        tail_dates = np.concatenate([self.dates[start:self.n], dates])
+        tail = {
+            'high': np.concatenate([self.columns['high'][start:self.n], high]),
+            'low': np.concatenate([self.columns['low'][start:self.n], low]),
+            'close': np.concatenate([self.columns['close'][start:self.n], close]),
+        }
+        reversed_unique, first = np.unique(tail_dates[::-1], return_index=True)
+        keep = len(tail_dates) - 1 - first
+
+        n = start + len(keep)
+        self._reserve(n)
+        self.dates[start:n] = reversed_unique
+        for field in PRICE_FIELDS:
+            self.columns[field][start:n] = tail[field][keep]
+        self.n = n
+        self._recompute_from(start)
+        return start
+
+    def _recompute_from(self, start: int) -> None:
+        """Recompute indicator rows start..n, seeded from the EMA state at start - 1."""
+        begin = max(start - LOOKBACK, 0)
+        c = self.columns
+        seed = {field: c[field][begin - 1] for field in EMA_FIELDS} if begin > 0 else None
+        values = compute_indicators(c['close'][begin:self.n], c['high'][begin:self.n], c['low'][begin:self.n], seed)
+        for field in INDICATOR_FIELDS:
+            # Rows before start may have truncated rolling windows in this slice
+            c[field][start:self.n] = values[field][start - begin:]
+        self.rows_computed += self.n - begin
+
+    def _row(self, i: int) -> Dict:
+        row = {'date': str(self.dates[i])}
+        for field in PRICE_FIELDS + INDICATOR_FIELDS:
+            value = float(self.columns[field][i])
+            row[field] = value if np.isfinite(value) else None
+        c = self.columns
+        row['signal'] = str(tools_signal(c['close'][i], c['macdHist'][i], c['stochK'][i], c['stochD'][i], c['sma10'][i]))
+        return row
+
+    def latest(self) -> Optional[Dict]:
+        return self._row(self.n - 1) if self.n else None
+
+    def tail(self, limit: int) -> List[Dict]:
+        return [self._row(i) for i in range(max(self.n - limit, 0), self.n)]
+
+
+class PriceHistoryStore:
+    """Disk-backed PriceSeries per ticker, loaded lazily."""
+
+    def __init__(self, store_dir: str = PRICE_HISTORY_DIR):
+        self.store_dir = store_dir
+        self._lock = threading.Lock()
+        self._series: Dict[str, PriceSeries] = {}
+
+    def _path(self, symbol: str) -> str:
+        return os.path.join(self.store_dir, f'{normalize_symbol(symbol)}.json')
+
+    def _load(self, symbol: str) -> Optional[PriceSeries]:
+        series = self._series.get(symbol)
+        if series is not None:
+            return series
+        try:
+            with open(self._path(symbol), 'r') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            print(f'Warning: Could not read price history for {symbol}: {e}')
+            return None
+
+        series = PriceSeries()
+        series.merge(
+            np.array(data['dates'], dtype='datetime64[D]'),
+            *(np.array(data[field], dtype=np.float64) for field in PRICE_FIELDS)
+        )
+        self._series[symbol] = series
+        return series
+
+    def _save(self, symbol: str, series: PriceSeries) -> None:
+        n = series.n
+        data = {'dates': series.dates[:n].astype(str).tolist()}
+        for field in PRICE_FIELDS:
+            data[field] = [None if np.isnan(v) else v for v in series.columns[field][:n].tolist()]
+        os.makedirs(self.store_dir, exist_ok=True)
+        path = self._path(symbol)
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+    def get(self, symbol: str) -> Optional[PriceSeries]:
+        """Series for symbol, or None if unknown (or not a valid ticker)."""
+        try:
+            symbol = normalize_symbol(symbol)
+        except ValueError:
+            return None
+        with self._lock:
+            return self._load(symbol)
+
+    def append(self, symbol: str, bars: List[Dict], save: bool = True) -> int:
+        """
+        Merge bars ({'date', 'close', optional 'high'/'low'}) into a ticker's history.
+
+        Returns:
+            Number of indicator rows recomputed
+
+        Raises:
+            ValueError: if symbol is not a valid ticker
+        """
+        symbol = normalize_symbol(symbol)
+        dates = np.array([bar['date'][:10] for bar in bars], dtype='datetime64[D]')
+        close = np.array([_float(bar.get('close')) for bar in bars])
+        high = np.array([_float(bar.get('high') or bar.get('close')) for bar in bars])
+        low = np.array([_float(bar.get('low') or bar.get('close')) for bar in bars])
+
+        with self._lock:
+            series = self._load(symbol)
+            if series is None:
+                series = PriceSeries()
+                self._series[symbol] = series
+            before = series.rows_computed
+            series.merge(dates, high, low, close)
+            if save:
+                self._save(symbol, series)
+            return series.rows_computed - before
+
+    def save(self, symbols: Iterable[str]) -> None:
+        with self._lock:
+            for symbol in symbols:
+                series = self._series.get(symbol.upper())
+                if series is not None:
+                    self._save(symbol.upper(), series)
+
+    def latest(self, symbols: Iterable[str]) -> List[Dict]:
+        """Latest bar, indicators and tools signal for each known ticker."""
+        results = []
+        with self._lock:
+            for symbol in symbols:
+                try:
+                    symbol = normalize_symbol(symbol)
+                except ValueError:
+                    continue
+                series = self._load(symbol)
+                if series is not None and series.n:
+                    results.append({'symbol': symbol, **series.latest()})
+        return results
+
+    def ingestor(self, fmt: str = 'csv', symbol: Optional[str] = None) -> 'PriceIngestor':
+        return PriceIngestor(self, fmt, symbol)
+
+
+def _float(value) -> float:
+    return float(value) if value not in (None, '') else np.nan
+
+
+class PriceIngestor:
+    """
+    Incremental CSV / JSON-lines parser feeding a PriceHistoryStore.
+
+    CSV needs a header with date and close (plus optional symbol, high, low);
+    JSON lines are one bar object per line. Without a symbol column every bar
+    goes to the ticker given here. A bar with an invalid ticker fails the
+    ingest with ValueError.
+    """
+
+    def __init__(self, store: PriceHistoryStore, fmt: str = 'csv', symbol: Optional[str] = None):
+        if fmt not in ('csv', 'jsonl'):
+            raise ValueError(f'Unsupported price format {fmt}; use csv or jsonl')
+        self.store = store
+        self.fmt = fmt
+        self.symbol = normalize_symbol(symbol) if symbol else None
+        self._partial = ''
+        self._header: Optional[List[str]] = None
+        self._buffers: Dict[str, List[Dict]] = {}
+        self._touched = set()
+        self.bars = 0
+        self.rows_computed = 0
+
+    def feed(self, chunk: str) -> None:
+        """Parse every complete line in chunk; a trailing partial line waits for the next chunk."""
+        lines = (self._partial + chunk).split('\n')
+        self._partial = lines.pop()
+        self._parse(lines)
+
+    def _parse(self, lines: List[str]) -> None:
+        lines = [line.strip() for line in lines if line.strip()]
+        if self.fmt == 'jsonl':
+            bars = [json.loads(line) for line in lines]
+        else:
+            if self._header is None and lines:
+                self._header = [name.strip().lower() for name in lines.pop(0).split(',')]
+                if 'date' not in self._header or 'close' not in self._header:
+                    raise ValueError('CSV header must include date and close')
+            bars = [dict(zip(self._header, row)) for row in csv.reader(lines)]
+
+        for bar in bars:
+            bar = {key.lower(): value for key, value in bar.items()}
+            symbol = bar.get('symbol') or self.symbol
+            if not symbol:
+                raise ValueError('Bars need a symbol column or an ingest symbol')
+            symbol = normalize_symbol(symbol)
+            buffer = self._buffers.setdefault(symbol, [])
+            buffer.append(bar)
+            self.bars += 1
+            if len(buffer) >= INGEST_BATCH_BARS:
+                self._flush(symbol)
+
+    def _flush(self, symbol: str) -> None:
+        bars = self._buffers.pop(symbol, [])
+        if bars:
+            self.rows_computed += self.store.append(symbol, bars, save=False)
+            self._touched.add(symbol)
+
+    def close(self) -> Dict:
+        """Parse any remaining input, merge buffered bars and persist every touched ticker."""
+        if self._partial:
+            self._parse([self._partial])
+            self._partial = ''
+        for symbol in list(self._buffers):
+            self._flush(symbol)
+        self.store.save(self._touched)
+        return {'bars': self.bars, 'tickers': sorted(self._touched), 'rowsComputed': self.rows_computed}
@@ -0,0 +1,162 @@
+"""
+Quote Service
+
+Micro-batched, cached stock quotes for all visitors.
+
+Quote requests arriving within QUOTE_BATCH_WINDOW_MS of each other are
+collected into one multi-symbol FMP call (up to QUOTE_BATCH_MAX symbols), and
+each caller gets its own symbols back. Quotes are cached for
+QUOTE_CACHE_TTL_SECONDS, and a symbol already being fetched is not requested
+again, so a watchlist view or many visitors looking at the same tickers cost
+one upstream call per batch window instead of one per symbol per visitor.
+Fetched prices also update tickers already in the screener index.
+
+Everything runs on the event loop; no locks are needed.
+"""
+
+import os
+import time
+import asyncio
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional
+
+from backend.services import fmp
+from backend.services.screener import get_screener_index
+from execution import telemetry
+
+QUOTE_CACHE_TTL_SECONDS = float(os.getenv('QUOTE_CACHE_TTL_SECONDS', 15))
+QUOTE_BATCH_WINDOW_MS = float(os.getenv('QUOTE_BATCH_WINDOW_MS', 5))
+QUOTE_BATCH_MAX = int(os.getenv('QUOTE_BATCH_MAX', 50))  # Symbols per upstream call
+QUOTE_BATCH_PATH = os.getenv('QUOTE_BATCH_PATH', '/batch-quote')  # FMP multi-symbol endpoint (?symbols=A,B)
+
+QUOTE_LOOKUPS = telemetry.REGISTRY.counter(
+    'quote_lookups_total',
+    'Quote lookups by how they were served (cache, joined an in-flight fetch, fetched)',
+    ['result']
+)
+QUOTE_UPSTREAM_CALLS = telemetry.REGISTRY.counter('quote_upstream_calls_total', 'Multi-symbol quote calls to FMP')
+QUOTE_BATCH_SIZE = telemetry.REGISTRY.histogram(
+    'quote_batch_size',
+    'Symbols per upstream quote call',
+    buckets=(1, 2, 5, 10, 20, 50, 100)
+)
+
+
+async def fetch_fmp_quotes(symbols: List[str]) -> Dict[str, Dict]:
+    """Quotes for symbols from one FMP call, keyed by upper-case symbol (unknown symbols are absent)."""
+    data = await fmp.get_json(QUOTE_BATCH_PATH, 'fmp.quote', symbols=','.join(symbols))
+    quotes = data if isinstance(data, list) else [data]
+    quotes = {quote['symbol'].upper(): quote for quote in quotes if isinstance(quote, dict) and quote.get('symbol')}
+    get_screener_index().update_prices({
+        symbol: quote['price'] for symbol, quote in quotes.items()
+        if isinstance(quote.get('price'), (int, float)) and quote['price'] > 0
+    })
+    return quotes
+
+
+class QuoteBatcher:
+    """
+    Args:
+        fetch_batch: async fetch(symbols) -> {symbol: quote}
+        ttl_seconds: How long quotes (and "no such symbol" answers) are served from cache
+        window_seconds: How long to collect requests before calling upstream
+        max_batch: Symbols per upstream call; a full batch is sent without waiting
+    """
+
+    def __init__(
+        self,
+        fetch_batch: Callable[[List[str]], Awaitable[Dict[str, Dict]]] = fetch_fmp_quotes,
+        ttl_seconds: float = QUOTE_CACHE_TTL_SECONDS,
+        window_seconds: float = QUOTE_BATCH_WINDOW_MS / 1000,
+        max_batch: int = QUOTE_BATCH_MAX
+    ):
+        self.fetch_batch = fetch_batch
+        self.ttl_seconds = ttl_seconds
+        self.window_seconds = window_seconds
+        self.max_batch = max_batch
+        self._cache: Dict[str, tuple] = {}  # symbol -> (quote or None, fetched_at)
+        self._in_flight: Dict[str, asyncio.Future] = {}  # Queued or being fetched
+        self._pending: List[str] = []  # Collected for the next batch
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+    def _cached(self, symbol: str) -> Optional[tuple]:
+        entry = self._cache.get(symbol)
+        if entry is not None and time.monotonic() - entry[1] < self.ttl_seconds:
+            return entry
+        return None
+
+    async def get_many(self, symbols: Iterable[str]) -> Dict[str, Optional[Dict]]:
+        """Quote (or None for unknown symbols) per requested symbol; raises fmp.FMPError if upstream fails."""
+        results = {}
+        waiting = {}
+        loop = asyncio.get_running_loop()
+        for symbol in dict.fromkeys(s.strip().upper() for s in symbols if s.strip()):
+            entry = self._cached(symbol)
+            if entry is not None:
+                QUOTE_LOOKUPS.inc(result='cache')
+                results[symbol] = entry[0]
+            elif symbol in self._in_flight:
+                QUOTE_LOOKUPS.inc(result='joined')
+                waiting[symbol] = self._in_flight[symbol]
+            else:
+                QUOTE_LOOKUPS.inc(result='fetched')
+                waiting[symbol] = self._in_flight[symbol] = loop.create_future()
+                self._pending.append(symbol)
+
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._pending and self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window_seconds, self._flush)
+
+        for symbol, future in waiting.items():
+            # Shielded: a caller that disconnects must not cancel others' shared result
+            results[symbol] = await asyncio.shield(future)
+        return results
+
+    async def get(self, symbol: str) -> Optional[Dict]:
+        return (await self.get_many([symbol])).get(symbol.strip().upper())
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending = self._pending, []
+        for i in range(0, len(pending), self.max_batch):
+            asyncio.ensure_future(self._fetch(pending[i:i + self.max_batch]))
+
+    async def _fetch(self, symbols: List[str]) -> None:
+        QUOTE_UPSTREAM_CALLS.inc()
+        QUOTE_BATCH_SIZE.observe(len(symbols))
+        try:
+            quotes = await self.fetch_batch(symbols)
+        except Exception as e:
+            for symbol in symbols:
+                future = self._in_flight.pop(symbol)
+                if not future.done():
+                    future.set_exception(e)
+                future.exception()  # Mark retrieved; nobody may be waiting any more
+            return
+        now = time.monotonic()
+        for symbol in symbols:
+            quote = quotes.get(symbol)
+            self._cache[symbol] = (quote, now)
+            future = self._in_flight.pop(symbol)
+            if not future.done():
+                future.set_result(quote)
+        self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries once the cache has grown (bounded by symbols seen per TTL)."""
+        if len(self._cache) > 10 * self.max_batch:
+            self._cache = {s: entry for s, entry in self._cache.items() if now - entry[1] < self.ttl_seconds}
+
+    def stats(self) -> Dict:
+        return {
+            'cachedSymbols': len(self._cache),
+            'inFlight': len(self._in_flight),
+            'ttlSeconds': self.ttl_seconds,
+            'batchWindowMs': self.window_seconds * 1000,
+            'maxBatch': self.max_batch,
+        }
+
+
+quote_batcher = QuoteBatcher()
@@ -0,0 +1,199 @@
+"""
+Research Result Store
+
+Persistent, ticker-keyed store for Scuttlebutt research results.
+
+Raw `run_scuttlebutt_research` outputs are written to disk as JSON so they
+survive restarts and are shared by every visitor. Entries older than the
+freshness TTL are still served, but reported as stale so the caller can
+refresh them in the background (stale-while-revalidate).
+"""
+
+import os
+import json
+import time
+import threading
+from typing import Callable, Dict, Optional, Tuple
+
+from execution import telemetry
+
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+RESEARCH_STORE_DIR = os.getenv('RESEARCH_STORE_DIR', os.path.join(project_root, '.tmp', 'research_store'))
+RESEARCH_STORE_TTL_SECONDS = int(os.getenv('RESEARCH_STORE_TTL_SECONDS', 24 * 60 * 60))  # 24 hours
+
+
+class ResearchStore:
+    """Disk-backed research store with an in-memory read-through layer."""
+
+    def __init__(self, store_dir: str = RESEARCH_STORE_DIR, ttl_seconds: int = RESEARCH_STORE_TTL_SECONDS):
+        self.store_dir = store_dir
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict] = {}
+        self._mtimes: Dict[str, float] = {}  # Key -> mtime of the file the in-memory entry came from
+        self._refreshing = set()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes_completed = 0
+        self.refreshes_failed = 0
+
+    @staticmethod
+    def normalize_key(key: str) -> str:
+        """Normalize a ticker (or company name) into a store key."""
+        return key.strip().upper()
+
+    def _path(self, key: str) -> str:
+        safe_key = key.replace(' ', '_').replace('/', '_')
+        return os.path.join(self.store_dir, f'{safe_key}.json')
+
+    def _load(self, key: str) -> Optional[Dict]:
+        """
+        Load an entry from memory, re-reading the file when it is newer.
+
+        Other worker processes share the store directory, so a file written by
+        another worker's refresh replaces this worker's older in-memory copy.
+        """
+        entry = self._entries.get(key)
+        path = self._path(key)
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            return entry
+        if entry is not None and mtime <= self._mtimes.get(key, 0.0):
+            return entry
+
+        try:
+            with open(path, 'r') as f:
+                loaded = json.load(f)
+        except FileNotFoundError:
+            return entry
+        except (OSError, json.JSONDecodeError) as e:
+            print(f'Warning: Could not read research store entry for {key}: {e}')
+            return entry
+
+        self._mtimes[key] = mtime
+        if entry is None or loaded.get('storedAt', 0) >= entry.get('storedAt', 0):
+            self._entries[key] = entry = loaded
+        return entry
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the stored entry for a key without touching hit statistics."""
+        key = self.normalize_key(key)
+        with self._lock:
+            return self._load(key)
+
+    def peek(self, key: str) -> Optional[Dict]:
+        """
+        Entry already in memory, without touching disk or taking the lock (safe
+        on the event loop). May be out of date or missing when another worker
+        wrote the file; use get() for an authoritative answer.
+        """
+        return self._entries.get(self.normalize_key(key))
+
+    def age_seconds(self, entry: Dict) -> float:
+        """Age of an entry in seconds."""
+        return max(time.time() - entry.get('storedAt', 0), 0.0)
+
+    def is_stale(self, entry: Dict) -> bool:
+        """Whether an entry is older than the freshness TTL."""
+        return self.age_seconds(entry) > self.ttl_seconds
+
+    def lookup(self, key: str, accept: Optional[Callable[[Dict], bool]] = None) -> Tuple[Optional[Dict], str]:
+        """
+        Look up an entry and record the outcome.
+
+        Args:
+            key: Ticker (or company name)
+            accept: Optional predicate on the entry; a rejected entry counts as a miss
+
+        Returns:
+            Tuple of (entry or None, status) where status is 'fresh', 'stale' or 'miss'
+        """
+        key = self.normalize_key(key)
+        with self._lock:
+            entry = self._load(key)
+            if entry is not None and accept is not None and not accept(entry):
+                entry = None
+            if entry is None:
+                self.misses += 1
+                telemetry.cache_result('research_store', 'miss')
+                return None, 'miss'
+            if self.is_stale(entry):
+                self.stale_hits += 1
+                telemetry.cache_result('research_store', 'stale')
+                return entry, 'stale'
+            self.hits += 1
+            telemetry.cache_result('research_store', 'hit')
+            return entry, 'fresh'
+
+    def put(self, key: str, result: Dict) -> Dict:
+        """Persist a research result, replacing any previous entry."""
+        key = self.normalize_key(key)
+        entry = {
+            'key': key,
+            'storedAt': time.time(),
+            'result': result,
+        }
+
+        os.makedirs(self.store_dir, exist_ok=True)
+        path = self._path(key)
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(entry, f, default=str)
+        os.replace(tmp_path, path)  # Atomic so readers never see a partial file
+        mtime = os.stat(path).st_mtime
+
+        with self._lock:
+            self._entries[key] = entry
+            self._mtimes[key] = mtime
+        return entry
+
+    def begin_refresh(self, key: str) -> bool:
+        """Claim a background refresh for a key. Returns False if one is already running."""
+        key = self.normalize_key(key)
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def end_refresh(self, key: str, success: bool) -> None:
+        """Release a refresh claimed with begin_refresh."""
+        key = self.normalize_key(key)
+        with self._lock:
+            self._refreshing.discard(key)
+            if success:
+                self.refreshes_completed += 1
+            else:
+                self.refreshes_failed += 1
+
+    def _all_entries(self) -> Dict[str, Dict]:
+        """Load every entry on disk into memory."""
+        if os.path.isdir(self.store_dir):
+            for filename in os.listdir(self.store_dir):
+                if filename.endswith('.json'):
+                    self._load(filename[:-len('.json')])
+        return self._entries
+
+    def stats(self) -> Dict:
+        """Hit rate, result ages and refresh counters."""
+        with self._lock:
+            entries = self._all_entries()
+            ages = [self.age_seconds(entry) for entry in entries.values()]
+            lookups = self.hits + self.stale_hits + self.misses
+            return {
+                'entries': len(entries),
+                'staleEntries': sum(1 for age in ages if age > self.ttl_seconds),
+                'ttlSeconds': self.ttl_seconds,
+                'hits': self.hits,
+                'staleHits': self.stale_hits,
+                'misses': self.misses,
+                'hitRate': (self.hits + self.stale_hits) / lookups if lookups else 0.0,
+                'maxAgeSeconds': max(ages) if ages else None,
+                'meanAgeSeconds': sum(ages) / len(ages) if ages else None,
+                'refreshesInFlight': len(self._refreshing),
+                'refreshesCompleted': self.refreshes_completed,
+                'refreshesFailed': self.refreshes_failed,
+            }
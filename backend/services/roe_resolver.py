@@ -0,0 +1,225 @@
+"""
+ROE Resolver
+
+Gets a company's ROE from several sources (SEC EDGAR, FMP, Yahoo Finance)
+without waiting on the slowest or a missing one.
+
+Sources are tried in order of expected time to a valid answer, learned from
+their recent latency and success rate, with unreliable sources (success rate
+below 1/2) last. The best source starts first; if it
+has not answered within ROE_HEDGE_SECONDS (or as soon as it fails), the next
+one starts alongside it, and so on. The first valid value wins. With
+consensus=True all sources are queried at once and the median of the valid
+values is returned.
+
+Every source call is recorded, including calls still running after a winner
+was returned, so a slow source keeps paying for its real latency. Base URLs
+are configurable so the sources can be pointed at local stand-in servers
+(see scripts/loadtest-app.py).
+"""
+
+import os
+import math
+import time
+import threading
+import statistics
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional
+
+from backend.services.fmp import FMP_API_KEY, FMP_BASE_URL
+from backend.services.sec_edgar import get_sec_roe
+from execution import telemetry
+
+YAHOO_BASE_URL = os.getenv('YAHOO_BASE_URL', 'https://query1.finance.yahoo.com')
+
+ROE_SOURCE_TIMEOUT = float(os.getenv('ROE_SOURCE_TIMEOUT', 8))  # Seconds to wait for any valid answer
+ROE_HEDGE_SECONDS = float(os.getenv('ROE_HEDGE_SECONDS', 0.5))  # Start the next source after this long (0 = all at once)
+ROE_CONSENSUS = os.getenv('ROE_CONSENSUS', 'false').lower() == 'true'
+
+# Values outside this range (percent) are treated as bad data
+ROE_PLAUSIBLE_RANGE = (-1000.0, 1000.0)
+
+SOURCE_CALLS = telemetry.REGISTRY.counter('roe_source_calls_total', 'ROE source calls by outcome (ok, empty, error)', ['source', 'outcome'])
+
+YAHOO_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'application/json',
+}
+
+
+def fetch_fmp_roe(symbol: str) -> Optional[float]:
+    """ROE (%) from FMP key-metrics-ttm (returnOnEquityTTM is a fraction)."""
+    import requests
+
+    response = requests.get(
+        f'{FMP_BASE_URL}/key-metrics-ttm',
+        params={'symbol': symbol, 'apikey': FMP_API_KEY},
+        timeout=ROE_SOURCE_TIMEOUT
+    )
+    response.raise_for_status()
+    data = response.json()
+    metrics = data[0] if isinstance(data, list) and data else data
+    value = metrics.get('returnOnEquityTTM') if isinstance(metrics, dict) else None
+    return value * 100 if value is not None else None
+
+
+def fetch_yahoo_roe(symbol: str) -> Optional[float]:
+    """ROE (%) from Yahoo quoteSummary financialData (returnOnEquity.raw is a fraction)."""
+    import requests
+
+    response = requests.get(
+        f'{YAHOO_BASE_URL}/v10/finance/quoteSummary/{symbol}',
+        params={'modules': 'financialData'},
+        headers=YAHOO_HEADERS,
+        timeout=ROE_SOURCE_TIMEOUT
+    )
+    response.raise_for_status()
+    result = response.json().get('quoteSummary', {}).get('result') or [{}]
+    value = result[0].get('financialData', {}).get('returnOnEquity', {}).get('raw')
+    return value * 100 if value is not None else None
+
+
+class SourceStats:
+    """Recent latency and success rate of one source (updated from worker threads)."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.successes = 0
+        self.mean_seconds: Optional[float] = None  # Exponentially weighted, over all calls
+
+    def record(self, seconds: float, success: bool) -> None:
+        self.calls += 1
+        self.successes += success
+        self.mean_seconds = seconds if self.mean_seconds is None else 0.8 * self.mean_seconds + 0.2 * seconds
+
+    def success_rate(self) -> float:
+        """Smoothed towards 1/2, so one early failure does not bury a source."""
+        return (self.successes + 1) / (self.calls + 2)
+
+    def expected_seconds(self) -> float:
+        """Expected time to a valid answer if this source is tried first (untried sources rank first)."""
+        if self.mean_seconds is None:
+            return 0.0
+        return self.mean_seconds / self.success_rate()
+
+    def rank_key(self) -> tuple:
+        """Reliable sources (success rate at least 1/2) first, then by expected time."""
+        return (self.success_rate() < 0.5, self.expected_seconds())
+
+    def to_dict(self) -> Dict:
+        return {
+            'calls': self.calls,
+            'successRate': round(self.success_rate(), 3),
+            'meanSeconds': round(self.mean_seconds, 3) if self.mean_seconds is not None else None,
+            'expectedSeconds': round(self.expected_seconds(), 3),
+        }
+
+
+class ROEResolver:
+    """
+    Args:
+        sources: name -> fetch(symbol) returning ROE in percent or None; the
+            order breaks ties between sources with equal expected time
+        timeout: Seconds to wait for a valid answer
+        hedge_seconds: Delay before starting the next source while earlier ones run
+        max_workers: Threads shared by all resolutions
+    """
+
+    def __init__(
+        self,
+        sources: Dict[str, Callable[[str], Optional[float]]],
+        timeout: float = ROE_SOURCE_TIMEOUT,
+        hedge_seconds: float = ROE_HEDGE_SECONDS,
+        max_workers: int = 16
+    ):
+        self.sources = dict(sources)
+        self.timeout = timeout
+        self.hedge_seconds = hedge_seconds
+        self.stats = {name: SourceStats(name) for name in self.sources}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='roe-source')
+
+    def ranked_sources(self) -> List[str]:
+        with self._lock:
+            return sorted(self.sources, key=lambda name: self.stats[name].rank_key())
+
+    def _call(self, name: str, symbol: str) -> Dict:
+        start = time.perf_counter()
+        roe, error = None, None
+        try:
+            with telemetry.span(f'roe.{name}', symbol=symbol):
+                roe = self.sources[name](symbol)
+        except Exception as e:
+            error = str(e)
+        seconds = time.perf_counter() - start
+
+        valid = roe is not None and math.isfinite(roe) and ROE_PLAUSIBLE_RANGE[0] <= roe <= ROE_PLAUSIBLE_RANGE[1]
+        with self._lock:
+            self.stats[name].record(seconds, valid)
+        SOURCE_CALLS.inc(source=name, outcome='ok' if valid else 'error' if error else 'empty')
+        outcome = {'roe': roe if valid else None, 'seconds': round(seconds, 3)}
+        if error:
+            outcome['error'] = error
+        elif not valid:
+            outcome['error'] = 'no value' if roe is None else f'implausible value {roe}'
+        return outcome
+
+    def resolve(self, symbol: str, consensus: bool = ROE_CONSENSUS) -> Dict:
+        """
+        ROE for symbol.
+
+        Returns:
+            {'roe': percent or None, 'source': winning source name (or 'consensus'),
+             'sources': per-source outcomes of the calls that finished in time}
+        """
+        queue = self.ranked_sources()
+        pending = {}
+        outcomes = {}
+        deadline = time.monotonic() + self.timeout
+
+        def start_next():
+            name = queue.pop(0)
+            pending[self._executor.submit(self._call, name, symbol)] = name
+
+        start_next()
+        while consensus and queue:
+            start_next()
+
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            hedge = self.hedge_seconds if queue else remaining
+            done, _ = wait(pending, timeout=min(hedge, remaining), return_when=FIRST_COMPLETED)
+            for future in done:
+                name = pending.pop(future)
+                outcomes[name] = future.result()
+                if not consensus and outcomes[name]['roe'] is not None:
+                    return {'roe': outcomes[name]['roe'], 'source': name, 'sources': outcomes}
+            # Nothing valid yet: either the hedge delay passed or a source failed
+            if queue:
+                start_next()
+
+        for name in pending.values():
+            outcomes[name] = {'roe': None, 'error': f'no answer within {self.timeout:g} s'}
+        values = [outcome['roe'] for outcome in outcomes.values() if outcome['roe'] is not None]
+        if consensus and values:
+            return {'roe': statistics.median(values), 'source': 'consensus', 'sources': outcomes}
+        return {'roe': None, 'source': None, 'sources': outcomes}
+
+    def stats_dict(self) -> Dict:
+        with self._lock:
+            ranked = sorted(self.sources, key=lambda name: self.stats[name].rank_key())
+            return {name: dict(self.stats[name].to_dict(), rank=ranked.index(name) + 1) for name in self.sources}
+
+
+def _default_sources() -> Dict[str, Callable[[str], Optional[float]]]:
+    sources = {'sec': get_sec_roe}  # FMP is skipped without a key
+    if FMP_API_KEY:
+        sources['fmp'] = fetch_fmp_roe
+    sources['yahoo'] = fetch_yahoo_roe
+    return sources
+
+
+roe_resolver = ROEResolver(_default_sources())
@@ -0,0 +1,288 @@
+"""
+Rule #1 Screener Service
+
+Precomputed, column-oriented index of valuation and quality metrics for every
+known ticker, answering filtered and ranked queries without per-ticker
+FMP/SEC calls.
+
+Fundamentals and prices are upserted as they change: every /fundamentals fetch
+adds or updates its ticker, and every quote fetch updates the price of tickers
+already in the index (the admin POST routes can load data in bulk). Only the
+touched rows are revalued, and each sort order is rebuilt lazily the next time
+it is queried. The index is persisted to SCREENER_INDEX_PATH so it survives
+restarts; changes from fetches are saved every SCREENER_SAVE_INTERVAL seconds.
+"""
+
+import os
+import json
+import time
+import asyncio
+import threading
+import numpy as np
+from typing import Dict, Iterable, List, Optional
+
+from backend.services.file_lock import file_lock
+from backend.services.valuation import determine_signal, mos_price, sticker_price
+
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SCREENER_INDEX_PATH = os.getenv('SCREENER_INDEX_PATH', os.path.join(project_root, '.tmp', 'screener_index.json'))
+SCREENER_SAVE_INTERVAL = float(os.getenv('SCREENER_SAVE_INTERVAL', 60))  # Seconds between saves of fetched updates
+
+# Inputs that can be upserted
+INPUT_FIELDS = ['eps', 'growthRate', 'currentPrice', 'roe']
+# Derived from the inputs on every upsert
+DERIVED_FIELDS = ['stickerPrice', 'mosPrice', 'discountToMos']
+SORT_FIELDS = INPUT_FIELDS + DERIVED_FIELDS
+
+
+class ScreenerIndex:
+    """Column arrays indexed by row, with a symbol -> row map and cached sort orders."""
+
+    def __init__(self, capacity: int = 1024):
+        self._lock = threading.Lock()
+        self._rows: Dict[str, int] = {}
+        self._symbols: List[str] = []
+        self._columns = {field: np.full(capacity, np.nan) for field in SORT_FIELDS + ['updatedAt']}
+        self._orders: Dict[str, np.ndarray] = {}  # Field -> descending row order, dropped when dirty
+        self._dirty = False  # Rows changed since the last save
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def _grow(self) -> None:
+        for field, column in self._columns.items():
+            grown = np.full(len(column) * 2, np.nan)
+            grown[:len(column)] = column
+            self._columns[field] = grown
+
+    def _row(self, symbol: str) -> int:
+        row = self._rows.get(symbol)
+        if row is None:
+            if len(self._symbols) == len(self._columns['eps']):
+                self._grow()
+            row = len(self._symbols)
+            self._rows[symbol] = row
+            self._symbols.append(symbol)
+        return row
+
+    def _revalue(self, rows: np.ndarray) -> None:
+        """Recompute derived fields for the given rows only."""
+        c = self._columns
+        sticker = sticker_price(c['eps'][rows], c['growthRate'][rows])
+        mos = mos_price(sticker)
+        c['stickerPrice'][rows] = sticker
+        c['mosPrice'][rows] = mos
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Positive when trading below the MOS price
+            discount = (mos - c['currentPrice'][rows]) / mos * 100
+        c['discountToMos'][rows] = np.where(mos > 0, discount, np.nan)
+
+    def upsert(self, records: Iterable[Dict]) -> int:
+        """
+        Insert or update tickers. Each record has a 'symbol' and any of INPUT_FIELDS;
+        fields that are absent keep their current value.
+
+        Returns:
+            Number of records applied
+        """
+        with self._lock:
+            rows = []
+            now = time.time()
+            for record in records:
+                row = self._row(record['symbol'].upper())
+                for field in INPUT_FIELDS:
+                    value = record.get(field)
+                    if value is not None:
+                        self._columns[field][row] = value
+                self._columns['updatedAt'][row] = now
+                rows.append(row)
+
+            if rows:
+                self._revalue(np.array(rows))
+                self._orders.clear()
+                self._dirty = True
+            return len(rows)
+
+    def update_prices(self, prices: Dict[str, float]) -> int:
+        """Update current prices for known tickers. Unknown symbols are ignored."""
+        with self._lock:
+            known = [{'symbol': symbol, 'currentPrice': price} for symbol, price in prices.items() if symbol.upper() in self._rows]
+        return self.upsert(known)
+
+    def _order(self, field: str) -> np.ndarray:
+        """Rows sorted by field, descending, NaN last (built on demand, cached until the next upsert)."""
+        order = self._orders.get(field)
+        if order is None:
+            values = self._columns[field][:len(self._symbols)]
+            order = np.argsort(-values, kind='stable')
+            self._orders[field] = order
+        return order
+
+    def query(
+        self,
+        below_mos: bool = False,
+        min_roe: Optional[float] = None,
+        min_growth: Optional[float] = None,
+        min_discount: Optional[float] = None,
+        max_price: Optional[float] = None,
+        sort_by: str = 'discountToMos',
+        descending: bool = True,
+        limit: int = 50
+    ) -> Dict:
+        """
+        Filter and rank the universe.
+
+        Returns:
+            Dictionary with 'total' matches and the top 'results' rows
+        """
+        if sort_by not in SORT_FIELDS:
+            raise ValueError(f'Cannot sort by {sort_by}; choose one of {", ".join(SORT_FIELDS)}')
+
+        with self._lock:
+            n = len(self._symbols)
+            c = {field: column[:n] for field, column in self._columns.items()}
+
+            mask = np.ones(n, dtype=bool)
+            with np.errstate(invalid='ignore'):
+                if below_mos:
+                    mask &= c['currentPrice'] <= c['mosPrice']
+                if min_roe is not None:
+                    mask &= c['roe'] >= min_roe
+                if min_growth is not None:
+                    mask &= c['growthRate'] >= min_growth
+                if min_discount is not None:
+                    mask &= c['discountToMos'] >= min_discount
+                if max_price is not None:
+                    mask &= c['currentPrice'] <= max_price
+
+            order = self._order(sort_by)
+            if not descending:
+                # Reverse the non-NaN part so missing values still sort last
+                valid = ~np.isnan(c[sort_by][order])
+                order = np.concatenate([order[valid][::-1], order[~valid]])
+            selected = order[mask[order]]
+
+            rows = selected[:limit]
+            signals = determine_signal(c['currentPrice'][rows], c['stickerPrice'][rows], c['mosPrice'][rows])
+            results = []
+            for row, signal in zip(rows.tolist(), signals.tolist()):
+                result = {'symbol': self._symbols[row]}
+                for field in SORT_FIELDS:
+                    value = float(c[field][row])
+                    result[field] = value if np.isfinite(value) else None
+                result['signal'] = signal if result['currentPrice'] is not None else None
+                result['updatedAt'] = float(c['updatedAt'][row])
+                results.append(result)
+
+            return {'total': int(mask.sum()), 'results': results}
+
+    def stats(self) -> Dict:
+        with self._lock:
+            n = len(self._symbols)
+            return {
+                'tickers': n,
+                'withPrice': int(np.count_nonzero(~np.isnan(self._columns['currentPrice'][:n]))),
+                'withValuation': int(np.count_nonzero(np.isfinite(self._columns['mosPrice'][:n]))),
+                'cachedSortOrders': sorted(self._orders),
+            }
+
+    def merge(self, data: Dict) -> int:
+        """
+        Apply rows from persisted data that are newer (by updatedAt) than ours,
+        keeping their updatedAt. Returns the number of rows applied.
+        """
+        columns = data.get('columns', {})
+        symbols = data.get('symbols', [])
+        updated_at = columns.get('updatedAt') or [None] * len(symbols)
+        with self._lock:
+            newer = []
+            for i, symbol in enumerate(symbols):
+                row = self._rows.get(symbol)
+                theirs = updated_at[i]
+                if row is None or (theirs is not None and not self._columns['updatedAt'][row] >= theirs):
+                    newer.append(i)
+        self.upsert([
+            {'symbol': symbols[i], **{field: columns.get(field, [])[i] for field in INPUT_FIELDS}}
+            for i in newer
+        ])
+        with self._lock:
+            for i in newer:
+                self._columns['updatedAt'][self._rows[symbols[i]]] = np.nan if updated_at[i] is None else updated_at[i]
+        return len(newer)
+
+    @staticmethod
+    def _read(path: str) -> Dict:
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, json.JSONDecodeError) as e:
+            print(f'Warning: Could not load screener index: {e}')
+            return {}
+
+    def save(self, path: str = SCREENER_INDEX_PATH) -> None:
+        """
+        Persist inputs to JSON (derived fields are recomputed on load).
+
+        Worker processes share the file: under a file lock, rows another
+        worker saved more recently are merged in first so its updates are kept.
+        """
+        with file_lock(path):
+            self.merge(self._read(path))
+            with self._lock:
+                n = len(self._symbols)
+                self._dirty = False
+                data = {
+                    'symbols': list(self._symbols),
+                    'columns': {
+                        field: [None if np.isnan(v) else v for v in self._columns[field][:n].tolist()]
+                        for field in INPUT_FIELDS + ['updatedAt']
+                    },
+                }
+            tmp_path = f'{path}.{os.getpid()}.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+
+    def save_if_changed(self, path: str = SCREENER_INDEX_PATH) -> bool:
+        """Save if rows changed since the last save; returns whether it saved."""
+        if not self._dirty:
+            return False
+        self.save(path)
+        return True
+
+    @classmethod
+    def load(cls, path: str = SCREENER_INDEX_PATH) -> 'ScreenerIndex':
+        """Load a persisted index, or return an empty one."""
+        index = cls()
+        index.merge(index._read(path))
+        index._dirty = False
+        return index
+
+
+_screener_index: Optional[ScreenerIndex] = None
+_screener_index_lock = threading.Lock()
+
+
+def get_screener_index() -> ScreenerIndex:
+    """Shared index, restored from disk on first use (or during warm_up)."""
+    global _screener_index
+    if _screener_index is None:
+        with _screener_index_lock:
+            if _screener_index is None:
+                _screener_index = ScreenerIndex.load()
+    return _screener_index
+
+
+async def save_screener_index_periodically(interval: float = SCREENER_SAVE_INTERVAL) -> None:
+    """Every interval seconds, save the shared index in a thread if fetches changed it."""
+    loop = asyncio.get_running_loop()
+    while True:
+        await asyncio.sleep(interval)
+        if _screener_index is not None:
+            try:
+                await loop.run_in_executor(None, _screener_index.save_if_changed)
+            except OSError as e:
+                print(f'Warning: Could not save screener index: {e}')
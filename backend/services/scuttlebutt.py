@@ -2,96 +2,265 @@
 Scuttlebutt Service
 
 Service layer that calls Python execution scripts for Scuttlebutt research.
+Results are persisted in the research store and served stale-while-revalidate.
 """
 
 import os
 import sys
-import json
-import subprocess
-from typing import Dict, Optional
+import threading
+from typing import Dict, List, Optional
 from datetime import datetime
 
-# Add project root and execution directory to path
+from backend.services.research_store import ResearchStore
+from execution import telemetry
+from execution.fisher_criteria import qualitative_criteria
+from execution.research_pool import ResearchWorkerPool
+
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
 execution_dir = os.path.join(project_root, 'execution')
-sys.path.insert(0, project_root)
-sys.path.insert(0, execution_dir)
 
-try:
-    from execution.run_scuttlebutt_company import run_scuttlebutt_research
-except ImportError:
-    try:
-        # Try direct import if execution is in path
-        from run_scuttlebutt_company import run_scuttlebutt_research
-    except ImportError:
-        # Fallback: use subprocess if import fails
-        run_scuttlebutt_research = None
+# Started lazily on first use (only needed when the direct import failed)
+research_pool = ResearchWorkerPool()
+
+_research_runner = None
+_research_runner_loaded = False
+_research_runner_lock = threading.Lock()
+
+# Shared research result store (persists results across restarts and visitors)
+research_store = ResearchStore()
+
+
+def get_research_runner():
+    """
+    run_scuttlebutt_research, imported on first use, or None to use the worker pool.
+    
+    The orchestrator pulls in the Tavily and LLM provider modules, so it is not
+    imported until research is actually requested (or during warm_up).
+    """
+    global _research_runner, _research_runner_loaded
+    if _research_runner_loaded:
+        return _research_runner
+    with _research_runner_lock:
+        if not _research_runner_loaded:
+            # Execution scripts import their siblings by bare module name
+            for path in (project_root, execution_dir):
+                if path not in sys.path:
+                    sys.path.insert(0, path)
+            try:
+                from execution.run_scuttlebutt_company import run_scuttlebutt_research
+            except ImportError:
+                try:
+                    # Try direct import if execution is in path
+                    from run_scuttlebutt_company import run_scuttlebutt_research
+                except ImportError:
+                    # Fallback: run in pre-warmed worker processes if import fails here
+                    run_scuttlebutt_research = None
+            _research_runner = run_scuttlebutt_research
+            _research_runner_loaded = True
+    return _research_runner
+
+
+def _run_research(
+    company_name: str,
+    ticker: Optional[str] = None,
+    max_results_per_bucket: int = 5,
+    previous_result: Optional[Dict] = None,
+    criteria: Optional[List[int]] = None
+) -> Dict:
+    """
+    Run the Scuttlebutt pipeline and return the raw orchestrator result.
+    
+    With previous_result the run is incremental: unchanged stakeholder buckets
+    and the criteria that depend only on them are carried over. With criteria
+    only the buckets and LLM ratings those criteria need are produced.
+    """
+    # Try direct import first (faster)
+    run_scuttlebutt_research = get_research_runner()
+    if run_scuttlebutt_research:
+        with telemetry.span('research.run', mode='direct', incremental=previous_result is not None):
+            return run_scuttlebutt_research(
+                company_name=company_name,
+                ticker=ticker,
+                max_results_per_bucket=max_results_per_bucket,
+                previous_result=previous_result,
+                criteria=criteria
+            )
+
+    # Fallback: run in a pooled worker process (its stages are traced in the worker)
+    with telemetry.span('research.run', mode='pool', incremental=previous_result is not None):
+        return research_pool.run(
+            company_name=company_name,
+            ticker=ticker,
+            max_results_per_bucket=max_results_per_bucket,
+            previous_result=previous_result,
+            criteria=criteria
+        )
+
+
+def _covers(entry: Dict, criteria: Optional[List[int]]) -> bool:
+    """Whether a stored entry has ratings for all requested criteria (None means all qualitative criteria)."""
+    stored_criteria = entry['result'].get('criteria')
+    if not stored_criteria:
+        return True
+    return criteria is not None and set(criteria) <= set(stored_criteria)
+
+
+def _merge_targeted(stored: Dict, result: Dict) -> Dict:
+    """
+    Fold a criterion-targeted result into a stored targeted result.
+
+    The merged result covers the union of both criteria sets; the new run's
+    ratings and stakeholder buckets replace the stored ones they overlap.
+    """
+    criteria = sorted(set(stored['criteria']) | set(result['criteria']))
+    refreshed_ids = set(result['criteria'])
+    stored_ratings = stored.get('analysis', {}).get('ratings', []) or stored.get('ratings', [])
+    ratings = [r for r in stored_ratings if r.get('criterionId') not in refreshed_ids]
+    ratings.extend(result.get('analysis', {}).get('ratings', []))
+    ratings.sort(key=lambda r: r.get('criterionId', 0))
+    return dict(
+        result,
+        criteria=criteria,
+        signals=dict(stored.get('signals', {}), **result.get('signals', {})),
+        analysis=dict(result.get('analysis', {}), ratings=ratings)
+    )
+
+
+def has_stored_result(store_key: str, criteria: Optional[List[int]] = None) -> bool:
+    """
+    Whether research_company would answer from the store instead of running research.
+    
+    Answered from memory only (see ResearchStore.peek), so it is cheap enough to
+    call on the event loop; a False for an entry not loaded yet is harmless.
+    """
+    entry = research_store.peek(store_key)
+    return entry is not None and _covers(entry, qualitative_criteria(criteria))
+
+
+def _format_result(
+    result: Dict,
+    company_name: str,
+    ticker: Optional[str],
+    cache_status: str,
+    result_age_seconds: float
+) -> Dict:
+    """Map a raw orchestrator result to the API response format."""
+    analysis = result.get('analysis', {})
+    ratings = analysis.get('ratings', [])
+    # OpenRouter returns ratings directly, Ollama returns in analysis
+    if not ratings and 'ratings' in result:
+        ratings = result['ratings']
+    model_used = result.get('modelUsed', 'openrouter-gpt-4o-mini')
+    
+    # Format response to match GeminiResearchResponse structure
+    return {
+        'symbol': ticker or company_name,
+        'ratings': ratings,
+        'researchDate': result.get('researchDate') or datetime.now().isoformat(),
+        'modelUsed': model_used,
+        'cacheStatus': cache_status,
+        'resultAgeSeconds': result_age_seconds,
+    }
+
+
+def _refresh_in_background(
+    store_key: str,
+    company_name: str,
+    ticker: Optional[str],
+    max_results_per_bucket: int
+) -> None:
+    """
+    Refresh a stale entry on a daemon thread (one refresh per key at a time).
+    
+    The refresh is incremental against the stored result, so only changed
+    stakeholder buckets and their dependent criteria are redone.
+    """
+    if not research_store.begin_refresh(store_key):
+        return
+    
+    entry = research_store.get(store_key)
+    previous_result = entry['result'] if entry else None
+
+    def refresh():
+        success = False
+        try:
+            # Runs after the request has returned, so it is a trace of its own
+            with telemetry.span('research.refresh', key=store_key):
+                result = _run_research(company_name, ticker, max_results_per_bucket, previous_result)
+            incremental = result.get('incremental')
+            if incremental:
+                print(
+                    f'Refreshed {store_key}: changed buckets {incremental["changedBuckets"]}, '
+                    f'{incremental["queriesSkipped"]} queries and {incremental["criteriaSkipped"]} criteria skipped',
+                    file=sys.stderr
+                )
+            research_store.put(store_key, result)
+            success = True
+        except Exception as e:
+            print(f'Background research refresh failed for {store_key}: {e}', file=sys.stderr)
+        finally:
+            research_store.end_refresh(store_key, success)
+
+    threading.Thread(target=refresh, name=f'research-refresh-{store_key}', daemon=True).start()
 
 
 def research_company(
     company_name: str,
     ticker: Optional[str] = None,
-    max_results_per_bucket: int = 5
+    max_results_per_bucket: int = 5,
+    use_store: bool = True,
+    criteria: Optional[List[int]] = None
 ) -> Dict:
     """
     Run Scuttlebutt research for a company.
     
+    Results are served from the research store when available. Stale results
+    are returned immediately while a background refresh replaces them.
+    
     Args:
         company_name: Company name (e.g., "Apple Inc.")
         ticker: Optional stock ticker (e.g., "AAPL")
         max_results_per_bucket: Maximum Tavily results per stakeholder bucket
+        use_store: Serve from and write to the research store (default: True)
+        criteria: Optional criterion IDs to research (default: all qualitative
+            criteria; 1, 5 and 10 are dropped). A stored result covering them is
+            reused; otherwise only their work is done and merged into a fresh
+            stored targeted result.
     
     Returns:
-        Complete research result dictionary with analysis mapped to Fisher's 15 criteria
+        Complete research result dictionary with analysis mapped to Fisher's qualitative criteria
+    
+    Raises:
+        ValueError: if criteria were given but none of them is qualitative
     """
+    store_key = ticker or company_name
+    criteria = qualitative_criteria(criteria)
     try:
-        # Try direct import first (faster)
-        if run_scuttlebutt_research:
-            result = run_scuttlebutt_research(
-                company_name=company_name,
-                ticker=ticker,
-                max_results_per_bucket=max_results_per_bucket
-            )
-        else:
-            # Fallback: use subprocess
-            script_path = os.path.join(project_root, 'execution', 'run_scuttlebutt_company.py')
-            cmd = [
-                sys.executable,
-                script_path,
-                company_name,
-            ]
-            if ticker:
-                cmd.extend(['--ticker', ticker])
-            cmd.extend(['--max-results', str(max_results_per_bucket)])
-            
-            process = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 minute timeout
-            )
+        with telemetry.span('research.company', key=store_key, criteria=criteria) as company_span:
+            if use_store:
+                entry, status = research_store.lookup(store_key, accept=lambda e: _covers(e, criteria))
+                company_span.set(cacheStatus=status)
+                if entry is not None:
+                    if status == 'stale':
+                        _refresh_in_background(store_key, company_name, ticker, max_results_per_bucket)
+                    return _format_result(
+                        entry['result'],
+                        company_name,
+                        ticker,
+                        status,
+                        research_store.age_seconds(entry)
+                    )
             
-            if process.returncode != 0:
-                raise Exception(f'Script failed: {process.stderr}')
-            
-            # Parse JSON from stdout
-            result = json.loads(process.stdout)
-        
-        # Map to API response format
-        analysis = result.get('analysis', {})
-        ratings = analysis.get('ratings', [])
-        # OpenRouter returns ratings directly, Ollama returns in analysis
-        if not ratings and 'ratings' in result:
-            ratings = result['ratings']
-        model_used = result.get('modelUsed', 'openrouter-gpt-4o-mini')
-        
-        # Format response to match GeminiResearchResponse structure
-        return {
-            'symbol': ticker or company_name,
-            'ratings': ratings,
-            'researchDate': datetime.now().isoformat(),
-            'modelUsed': model_used,
-        }
+            result = _run_research(company_name, ticker, max_results_per_bucket, criteria=criteria)
+            if use_store:
+                stored = research_store.get(store_key)
+                # A fresh targeted entry for other criteria is extended rather than replaced
+                # (a stale one is not, or its old ratings would be stored as fresh)
+                if criteria is not None and stored is not None and not research_store.is_stale(stored):
+                    research_store.put(store_key, _merge_targeted(stored['result'], result))
+                else:
+                    research_store.put(store_key, result)
+            return _format_result(result, company_name, ticker, 'miss', 0.0)
         
     except Exception as e:
         raise Exception(f'Scuttlebutt research failed: {str(e)}')
@@ -5,15 +5,20 @@ Fetches financial data from SEC EDGAR to calculate ROE.
 Uses companyconcept API to get Net Income and Shareholders' Equity.
 """
 
-import requests
 import json
 import os
 from typing import Optional
 
-SEC_BASE_URL = "https://data.sec.gov"
+from execution import telemetry
+
+SEC_BASE_URL = os.getenv("SEC_BASE_URL", "https://data.sec.gov")
 SEC_USER_AGENT = os.getenv("SEC_USER_AGENT", "Rule1Calculator contact@example.com")  # Update with your contact
 
 
+class SECRequestError(Exception):
+    """A request to SEC EDGAR failed (connection, HTTP status or invalid JSON)."""
+
+
 def load_cik_mapping() -> dict:
     """Load CIK mapping from JSON file."""
     try:
@@ -48,13 +53,7 @@ def get_cik_from_symbol(symbol: str) -> str:
     # Fallback: fetch from SEC API (for new IPOs, less common stocks)
     try:
         print(f"CIK not in cache for {symbol}, fetching from SEC...")
-        response = requests.get(
-            f"{SEC_BASE_URL}/files/company_tickers.json",
-            headers={"User-Agent": SEC_USER_AGENT},
-            timeout=10
-        )
-        response.raise_for_status()
-        tickers = response.json()
+        tickers = _get_json(f"{SEC_BASE_URL}/files/company_tickers.json", "sec.tickers", {"User-Agent": SEC_USER_AGENT}, 10)
         
         # SEC returns dict with numeric keys, values are {cik_str, ticker, title}
         for entry in tickers.values():
@@ -63,7 +62,7 @@ def get_cik_from_symbol(symbol: str) -> str:
                 print(f"Found CIK for {symbol}: {cik}")
                 return cik
                 
-    except requests.exceptions.RequestException as e:
+    except SECRequestError as e:
         print(f"Failed to fetch CIK from SEC API: {e}")
     except Exception as e:
         print(f"Error processing SEC ticker data: {e}")
@@ -71,17 +70,25 @@ def get_cik_from_symbol(symbol: str) -> str:
     raise ValueError(f"CIK not found for symbol {symbol}")
 
 
-def extract_latest_value(concept_data: dict, preferred_unit: str = "USD") -> Optional[float]:
+def extract_latest_value(concept_data: dict, preferred_unit: str = "USD", as_of: Optional[str] = None) -> Optional[float]:
     """
     Extract the latest value from SEC companyconcept data.
     
     SEC returns data in units (USD, shares, etc.) with arrays of values.
     We want the most recent value in the preferred unit.
+    
+    With as_of (ISO date), only facts filed on or before that date are
+    considered. For repeated historical lookups use point_in_time.FactSeries.
     """
     if not concept_data or "units" not in concept_data:
         return None
     
     units = concept_data["units"]
+    if as_of is not None:
+        units = {
+            unit_name: [v for v in values if v.get("filed", "") <= as_of]
+            for unit_name, values in units.items()
+        }
     
     # Try preferred unit first (usually USD)
     if preferred_unit in units:
@@ -112,6 +119,45 @@ def extract_latest_value(concept_data: dict, preferred_unit: str = "USD") -> Opt
     return None
 
 
+def _get_json(url: str, stage: str, headers: dict, timeout: int):
+    """
+    GET a SEC endpoint, timed as telemetry stage `stage`.
+    
+    requests is imported on first use so importing the app stays fast.
+    """
+    import requests
+    
+    with telemetry.span(stage):
+        try:
+            response = requests.get(url, headers=headers, timeout=timeout)
+            response.raise_for_status()
+            return response.json()
+        except requests.exceptions.RequestException as e:
+            raise SECRequestError(str(e)) from e
+
+
+def get_company_facts(symbol: str) -> Optional[dict]:
+    """
+    Get every XBRL fact a company has reported (SEC companyfacts API).
+    
+    Returns the raw companyfacts JSON, or None if unavailable.
+    """
+    try:
+        cik = get_cik_from_symbol(symbol)
+        return _get_json(
+            f"{SEC_BASE_URL}/api/xbrl/companyfacts/CIK{cik}.json",
+            "sec.companyfacts",
+            {"User-Agent": SEC_USER_AGENT, "Accept": "application/json"},
+            30
+        )
+    except ValueError as e:
+        print(f"CIK lookup error: {e}")
+        return None
+    except SECRequestError as e:
+        print(f"Failed to fetch company facts for {symbol}: {e}")
+        return None
+
+
 def get_sec_roe(symbol: str) -> Optional[float]:
     """
     Get ROE from SEC EDGAR data.
@@ -135,12 +181,10 @@ def get_sec_roe(symbol: str) -> Optional[float]:
         net_income_url = f"{SEC_BASE_URL}/api/xbrl/companyconcept/CIK{cik}/us-gaap/NetIncomeLoss.json"
         
         try:
-            net_income_response = requests.get(net_income_url, headers=headers, timeout=10)
-            net_income_response.raise_for_status()
-            net_income_data = net_income_response.json()
+            net_income_data = _get_json(net_income_url, "sec.concept", headers, 10)
             net_income = extract_latest_value(net_income_data, "USD")
             print(f"Net Income: {net_income}")
-        except requests.exceptions.RequestException as e:
+        except SECRequestError as e:
             print(f"Failed to fetch Net Income: {e}")
             return None
         
@@ -149,12 +193,10 @@ def get_sec_roe(symbol: str) -> Optional[float]:
         equity_url = f"{SEC_BASE_URL}/api/xbrl/companyconcept/CIK{cik}/us-gaap/StockholdersEquity.json"
         
         try:
-            equity_response = requests.get(equity_url, headers=headers, timeout=10)
-            equity_response.raise_for_status()
-            equity_data = equity_response.json()
+            equity_data = _get_json(equity_url, "sec.concept", headers, 10)
             equity = extract_latest_value(equity_data, "USD")
             print(f"Shareholders' Equity: {equity}")
-        except requests.exceptions.RequestException as e:
+        except SECRequestError as e:
             print(f"Failed to fetch Shareholders' Equity: {e}")
             return None
         
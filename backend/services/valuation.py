@@ -0,0 +1,103 @@
+"""
+Rule #1 Valuation Service
+
+Vectorized Sticker Price / MOS price / signal calculations.
+
+Mirrors calculateStickerPrice, calculateMOSPrice and determineSignal in
+src/utils/calculations.ts exactly, but evaluates whole arrays of stocks and
+scenarios in one NumPy pass instead of one stock at a time.
+"""
+
+import numpy as np
+from typing import Dict, Optional
+
+DEFAULT_YEARS = 10
+DEFAULT_MARR = 0.15  # Minimum Acceptable Rate of Return
+MIN_FUTURE_PE = 8
+MAX_FUTURE_PE = 25
+MOS_DISCOUNT = 0.5  # MOS Price = Sticker Price x 0.5
+
+SIGNAL_BUY = 'BUY'
+SIGNAL_WAIT = 'WAIT'
+
+
+def default_growth_rate(*rates: Optional[float]) -> Optional[float]:
+    """Lowest positive growth rate (%) given, as calculateDefaultGrowthRate; None if there is none."""
+    valid = [rate for rate in rates if rate is not None and rate > 0]
+    return min(valid) if valid else None
+
+
+def sticker_price(eps, growth_rate, years=DEFAULT_YEARS, marr=DEFAULT_MARR, future_pe=None) -> np.ndarray:
+    """
+    Sticker Price = Future EPS x Future PE / (1 + MARR)^Years
+
+    All arguments broadcast against each other.
+
+    Args:
+        eps: Current EPS
+        growth_rate: Growth rate as a percentage (e.g. 12 for 12%)
+        years: Projection horizon in years
+        marr: Minimum acceptable rate of return as a decimal (e.g. 0.15)
+        future_pe: Optional explicit future PE (default: 2 x growth rate, clamped to [8, 25])
+    """
+    eps = np.asarray(eps, dtype=np.float64)
+    growth_rate = np.asarray(growth_rate, dtype=np.float64)
+    years = np.asarray(years, dtype=np.float64)
+    marr = np.asarray(marr, dtype=np.float64)
+
+    # Negative bases with fractional years are NaN, as with Math.pow in the TS version
+    with np.errstate(invalid='ignore', over='ignore'):
+        future_eps = eps * np.power(1 + growth_rate / 100, years)
+        if future_pe is None:
+            # Future PE = 2 x growth rate, clamped to [8, 25]
+            future_pe = np.minimum(np.maximum(2 * growth_rate, MIN_FUTURE_PE), MAX_FUTURE_PE)
+        price = future_eps * future_pe / np.power(1 + marr, years)
+    return np.maximum(price, 0)
+
+
+def mos_price(sticker) -> np.ndarray:
+    """Margin of Safety price (50% of Sticker Price)."""
+    return np.asarray(sticker, dtype=np.float64) * MOS_DISCOUNT
+
+
+def determine_signal(current_price, sticker, mos) -> np.ndarray:
+    """'BUY' at or below the MOS price, otherwise 'WAIT' (also when overvalued)."""
+    with np.errstate(invalid='ignore'):
+        at_or_below_mos = np.asarray(current_price, dtype=np.float64) <= np.asarray(mos, dtype=np.float64)
+    return np.where(at_or_below_mos, SIGNAL_BUY, SIGNAL_WAIT)
+
+
+def evaluate_universe(
+    eps,
+    growth_rate,
+    current_price,
+    scenario_growth_rate,
+    scenario_marr,
+    scenario_years
+) -> Dict[str, np.ndarray]:
+    """
+    Evaluate every stock under every scenario.
+
+    Args:
+        eps, growth_rate, current_price: Per-stock arrays of length N
+        scenario_growth_rate: Per-scenario growth override of length S (NaN = use the stock's own rate)
+        scenario_marr, scenario_years: Per-scenario arrays of length S
+
+    Returns:
+        Dictionary of (N, S) arrays: growthRate, stickerPrice, mosPrice, signal
+    """
+    eps = np.asarray(eps, dtype=np.float64)[:, None]
+    current_price = np.asarray(current_price, dtype=np.float64)[:, None]
+    stock_growth = np.asarray(growth_rate, dtype=np.float64)[:, None]
+    scenario_growth = np.asarray(scenario_growth_rate, dtype=np.float64)[None, :]
+
+    growth = np.where(np.isnan(scenario_growth), stock_growth, scenario_growth)
+    sticker = sticker_price(eps, growth, np.asarray(scenario_years)[None, :], np.asarray(scenario_marr)[None, :])
+    mos = mos_price(sticker)
+
+    return {
+        'growthRate': growth,
+        'stickerPrice': sticker,
+        'mosPrice': mos,
+        'signal': determine_signal(current_price, sticker, mos),
+    }
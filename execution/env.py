@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Environment Loading
+
+Loads .env once per process tree. Every entry point and execution script
+calls load_env() before reading configuration; after the first call it is a
+dict lookup. Child processes (research pool workers, batch subprocesses)
+inherit the loaded variables along with the marker, so they skip the file.
+
+Execution scripts import this module as `env` and the backend as
+`execution.env`; both names resolve to the same module (see bottom).
+"""
+
+import os
+import sys
+
+LOADED_MARKER = '_FISHER_DOTENV_LOADED'
+
+
+def load_env() -> None:
+    """Load .env into os.environ (existing variables win), at most once."""
+    if os.environ.get(LOADED_MARKER):
+        return
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass
+    os.environ[LOADED_MARKER] = '1'
+
+
+# One module under both import names (see execution/telemetry.py)
+sys.modules.setdefault('env', sys.modules[__name__])
+sys.modules.setdefault('execution.env', sys.modules[__name__])
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Fisher Criteria Definitions
+
+Philip Fisher's 15 criteria and the stakeholder buckets (see
+tavily_scuttlebutt.STAKEHOLDER_QUERIES) whose signals each criterion is rated from.
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+CRITERIA_NAMES = {
+    1: 'Products/Services with Market Potential',
+    2: "Management's Determination for Growth",
+    3: 'R&D Effectiveness',
+    4: 'Sales Organization',
+    5: 'Profit Margin',
+    6: 'Maintaining/Improving Profit Margins',
+    7: 'Labor and Personnel Relations',
+    8: 'Executive Relations',
+    9: 'Management Depth',
+    10: 'Cost Analysis and Accounting Controls',
+    11: 'Industry-Specific Competitive Advantages',
+    12: 'Long-Range Profit Outlook',
+    13: 'Future Equity Financing',
+    14: 'Management Communication',
+    15: 'Management Integrity',
+}
+
+ALL_CRITERIA = sorted(CRITERIA_NAMES)
+
+# Criteria the LLM rates from stakeholder signals. 1, 5 and 10 (market potential,
+# profit margin, cost controls) are rated from fundamentals instead, so scuttlebutt
+# runs - full, targeted or incremental - never ask for them.
+QUALITATIVE_CRITERIA = [c for c in ALL_CRITERIA if c not in (1, 5, 10)]
+
+# Stakeholder buckets each criterion depends on. Mirrors "Mapping Stakeholder
+# Signals to Fisher Criteria" in directives/scuttlebutt_company.md.
+CRITERION_BUCKETS = {
+    1: ['customers', 'competitors'],
+    2: ['innovation'],
+    3: ['innovation'],
+    4: ['customers'],
+    5: ['competitors', 'suppliers'],
+    6: ['competitors', 'suppliers'],
+    7: ['customers', 'employees'],
+    8: ['employees', 'suppliers'],
+    9: ['employees', 'risks'],
+    10: ['suppliers', 'risks'],
+    11: ['competitors', 'innovation'],
+    12: ['suppliers'],
+    13: ['risks'],
+    14: ['risks'],
+    15: ['risks'],
+}
+
+
+def buckets_for_criteria(criteria: Iterable[int]) -> List[str]:
+    """Stakeholder buckets needed to rate the given criteria."""
+    buckets = set()
+    for criterion_id in criteria:
+        buckets.update(CRITERION_BUCKETS.get(criterion_id, []))
+    return sorted(buckets)
+
+
+def criteria_for_buckets(buckets: Iterable[str]) -> List[int]:
+    """Qualitative criteria whose rating depends on any of the given buckets."""
+    buckets = set(buckets)
+    return [
+        criterion_id for criterion_id in QUALITATIVE_CRITERIA
+        if buckets.intersection(CRITERION_BUCKETS[criterion_id])
+    ]
+
+
+def qualitative_criteria(criteria: Optional[Iterable[int]]) -> Optional[List[int]]:
+    """
+    Requested criteria restricted to QUALITATIVE_CRITERIA, sorted and deduplicated.
+
+    Returns:
+        None when no criteria were requested (all qualitative criteria)
+
+    Raises:
+        ValueError: if criteria were requested but none of them is qualitative
+    """
+    if not criteria:
+        return None
+    requested = sorted(set(criteria))
+    scoped = [c for c in requested if c in QUALITATIVE_CRITERIA]
+    if not scoped:
+        raise ValueError(f'No qualitative criteria requested (got {requested}; '
+                         f'choose from {", ".join(map(str, QUALITATIVE_CRITERIA))})')
+    return scoped
+
+
+def describe_criteria(criteria: Iterable[int]) -> str:
+    """Human-readable criteria list for prompts, e.g. '3 (R&D Effectiveness), 7 (...)'."""
+    return ', '.join(f'{criterion_id} ({CRITERIA_NAMES[criterion_id]})' for criterion_id in sorted(criteria))
+
+
+def filter_signals(signals: Dict, criteria: Iterable[int]) -> Dict:
+    """Keep only the stakeholder buckets the given criteria depend on."""
+    needed = set(buckets_for_criteria(criteria))
+    return {bucket: items for bucket, items in signals.items() if bucket in needed}
@@ -11,21 +11,27 @@ import sys
 import json
 import argparse
 from typing import Dict, List, Optional
-from dotenv import load_dotenv
 import requests
 import re
 
+import telemetry
+from env import load_env
+from fisher_criteria import QUALITATIVE_CRITERIA, describe_criteria
+
 # Load environment variables
-load_dotenv()
+load_env()
 
 OLLAMA_BASE_URL = os.getenv('OLLAMA_BASE_URL', 'http://localhost:11434')
 OLLAMA_MODEL = os.getenv('OLLAMA_MODEL', 'llama3.2')
 OLLAMA_API_URL = f'{OLLAMA_BASE_URL}/api/chat'
 
+# Optional shared RateLimiter (see rate_limit.py), installed by batch runs
+rate_limiter = None
+
 
-def build_system_prompt() -> str:
+def build_system_prompt(criteria: Optional[List[int]] = None) -> str:
     """Build system prompt encoding Fisher's Scuttlebutt methodology."""
-    return """You are an equity analyst applying Philip Fisher's Scuttlebutt method.
+    prompt = """You are an equity analyst applying Philip Fisher's Scuttlebutt method.
 
 You will receive web-derived "virtual scuttlebutt" about a company from customers, employees, competitors, suppliers, and industry observers.
 
@@ -69,6 +75,10 @@ Output ONLY valid JSON matching this exact structure:
 }
 
 Return ONLY the JSON object, no markdown, no code blocks, no explanation."""
+    
+    prompt += f'\n\nRate ONLY these criteria and return exactly one rating for each: {describe_criteria(criteria or QUALITATIVE_CRITERIA)}.'
+    
+    return prompt
 
 
 def build_user_prompt(company_name: str, ticker: Optional[str], signals: Dict) -> str:
@@ -101,22 +111,26 @@ def build_user_prompt(company_name: str, ticker: Optional[str], signals: Dict) -
 
 def call_ollama(system_prompt: str, user_prompt: str) -> str:
     """Call Ollama API and return response."""
+    if rate_limiter:
+        rate_limiter.acquire()
+    
     try:
-        response = requests.post(
-            OLLAMA_API_URL,
-            json={
-                'model': OLLAMA_MODEL,
-                'messages': [
-                    {'role': 'system', 'content': system_prompt},
-                    {'role': 'user', 'content': user_prompt}
-                ],
-                'stream': False,
-                'format': 'json',
-            },
-            timeout=120  # Ollama can be slow
-        )
-        response.raise_for_status()
-        data = response.json()
+        with telemetry.span('ollama.chat'):
+            response = requests.post(
+                OLLAMA_API_URL,
+                json={
+                    'model': OLLAMA_MODEL,
+                    'messages': [
+                        {'role': 'system', 'content': system_prompt},
+                        {'role': 'user', 'content': user_prompt}
+                    ],
+                    'stream': False,
+                    'format': 'json',
+                },
+                timeout=120  # Ollama can be slow
+            )
+            response.raise_for_status()
+            data = response.json()
         
         # Extract message content
         message = data.get('message', {})
@@ -161,7 +175,12 @@ def parse_ollama_response(response_text: str) -> List[Dict]:
     raise ValueError(f'Could not parse valid JSON from Ollama response: {response_text[:500]}')
 
 
-def analyze_signals(signals: Dict, company_name: str, ticker: Optional[str] = None) -> Dict:
+def analyze_signals(
+    signals: Dict,
+    company_name: str,
+    ticker: Optional[str] = None,
+    criteria: Optional[List[int]] = None
+) -> Dict:
     """
     Analyze stakeholder signals using Ollama.
     
@@ -169,6 +188,7 @@ def analyze_signals(signals: Dict, company_name: str, ticker: Optional[str] = No
         signals: Dictionary with signals organized by stakeholder type
         company_name: Company name
         ticker: Optional stock ticker
+        criteria: Optional criterion IDs to rate (default: QUALITATIVE_CRITERIA)
     
     Returns:
         Dictionary with analysis mapped to Fisher's 15 criteria
@@ -176,8 +196,10 @@ def analyze_signals(signals: Dict, company_name: str, ticker: Optional[str] = No
     print(f'Analyzing signals for {company_name}...', file=sys.stderr)
     
     # Build prompts
-    system_prompt = build_system_prompt()
-    user_prompt = build_user_prompt(company_name, ticker, signals)
+    with telemetry.span('ollama.prompt') as prompt_span:
+        system_prompt = build_system_prompt(criteria)
+        user_prompt = build_user_prompt(company_name, ticker, signals)
+        prompt_span.set(chars=len(system_prompt) + len(user_prompt))
     
     # Call Ollama
     print(f'Calling Ollama ({OLLAMA_MODEL})...', file=sys.stderr)
@@ -185,12 +207,17 @@ def analyze_signals(signals: Dict, company_name: str, ticker: Optional[str] = No
     
     # Parse response
     print('Parsing Ollama response...', file=sys.stderr)
-    ratings = parse_ollama_response(response_text)
+    with telemetry.span('ollama.parse'):
+        ratings = parse_ollama_response(response_text)
     
     # Validate structure
     if not isinstance(ratings, list):
         raise ValueError('Invalid response: ratings must be a list')
     
+    # Drop ratings for criteria that were not asked for
+    criteria = criteria or QUALITATIVE_CRITERIA
+    ratings = [r for r in ratings if r.get('criterionId') in criteria]
+    
     # Validate each rating has required fields
     for rating in ratings:
         required_fields = ['criterionId', 'rating', 'justification', 'keyFindings', 'sources', 'confidence']
@@ -12,17 +12,27 @@ import sys
 import requests
 from typing import Dict, List, Any
 
+import telemetry
+from env import load_env
+from fisher_criteria import QUALITATIVE_CRITERIA, describe_criteria
+
+load_env()
+
 # OpenRouter API configuration
 OPENROUTER_API_KEY = os.getenv('OPENROUTER_API_KEY')
-OPENROUTER_API_URL = 'https://openrouter.ai/api/v1/chat/completions'
+OPENROUTER_API_URL = os.getenv('OPENROUTER_API_URL', 'https://openrouter.ai/api/v1/chat/completions')
 OPENROUTER_MODEL = os.getenv('OPENROUTER_MODEL', 'openai/gpt-4o-mini')  # Cheap and good
 
+# Optional shared RateLimiter (see rate_limit.py), installed by batch runs
+rate_limiter = None
+
 def analyze_signals_with_openrouter(signals_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Analyze stakeholder signals using OpenRouter API.
     
     Args:
         signals_data: Dictionary with stakeholder signals from Tavily
+            (optional 'criteria' restricts the analysis to those criterion IDs)
     
     Returns:
         Dictionary with Fisher criteria ratings (compatible with Ollama format)
@@ -31,13 +41,17 @@ def analyze_signals_with_openrouter(signals_data: Dict[str, Any]) -> Dict[str, A
         raise ValueError('OPENROUTER_API_KEY environment variable not set. Please set it in your environment variables.')
     
     # Build prompt from signals
-    prompt = build_analysis_prompt(signals_data)
+    with telemetry.span('openrouter.prompt') as prompt_span:
+        prompt = build_analysis_prompt(signals_data)
+        prompt_span.set(chars=len(prompt))
     
     # Call OpenRouter API
     response = call_openrouter(prompt)
     
     # Parse response
-    ratings = parse_openrouter_response(response, signals_data)
+    with telemetry.span('openrouter.parse') as parse_span:
+        ratings = parse_openrouter_response(response, signals_data)
+        parse_span.set(ratings=len(ratings))
     
     return {
         'ratings': ratings,
@@ -51,6 +65,12 @@ def build_analysis_prompt(signals_data: Dict[str, Any]) -> str:
     # Extract stakeholder signals
     signals_text = json.dumps(signals_data.get('signals', {}), indent=2)
     
+    criteria = signals_data.get('criteria')
+    if criteria:
+        focus = f'Evaluate ONLY these criteria and return exactly one rating for each: {describe_criteria(criteria)}.'
+    else:
+        focus = f'Focus on criteria {", ".join(map(str, QUALITATIVE_CRITERIA))} (qualitative criteria).'
+    
     prompt = f"""You are a professional investment analyst using Philip Fisher's "Scuttlebutt" methodology.
 
 Analyze the following stakeholder signals for {signals_data.get('companyName', 'the company')} ({signals_data.get('ticker', 'N/A')}):
@@ -78,7 +98,7 @@ Return your analysis as a JSON object with this structure:
   ]
 }}
 
-Focus on criteria 2, 3, 4, 6, 7, 8, 9, 11, 12, 13, 14, 15 (qualitative criteria).
+{focus}
 Be thorough and objective in your analysis."""
     
     return prompt
@@ -103,15 +123,19 @@ def call_openrouter(prompt: str) -> Dict[str, Any]:
         'temperature': 0.7,
     }
     
+    if rate_limiter:
+        rate_limiter.acquire()
+    
     try:
-        response = requests.post(
-            OPENROUTER_API_URL,
-            headers=headers,
-            json=payload,
-            timeout=120  # 2 minute timeout
-        )
-        response.raise_for_status()
-        return response.json()
+        with telemetry.span('openrouter.chat'):
+            response = requests.post(
+                OPENROUTER_API_URL,
+                headers=headers,
+                json=payload,
+                timeout=120  # 2 minute timeout
+            )
+            response.raise_for_status()
+            return response.json()
     except requests.exceptions.RequestException as e:
         raise Exception(f'OpenRouter API error: {e}')
 
@@ -128,6 +152,10 @@ def parse_openrouter_response(response: Dict[str, Any], signals_data: Dict[str,
         # Extract ratings
         ratings = result.get('ratings', [])
         
+        # Drop ratings for criteria that were not asked for
+        criteria = signals_data.get('criteria') or QUALITATIVE_CRITERIA
+        ratings = [r for r in ratings if r.get('criterionId') in criteria]
+        
         # Add sources from signals
         for rating in ratings:
             if 'sources' not in rating:
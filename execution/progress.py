@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Research Progress Events
+
+Lets a caller observe a research run as it happens (e.g. to stream it to a
+browser) without threading a callback through every pipeline function:
+
+    with progress.listen(lambda event, data: ...):
+        run_scuttlebutt_research(...)
+
+Pipeline code calls progress.emit('bucket_completed', bucket=..., results=...);
+without a listener in the current context that is a single ContextVar lookup.
+The listener is per context, so concurrent runs on other threads (background
+refreshes, other requests) are not reported to it. Runs in research pool
+worker processes are not reported either.
+
+Events:
+    bucket_started    bucket, queries
+    bucket_completed  bucket, results (, changed for incremental refreshes)
+    analysis_started  provider, criteria (IDs being rated)
+    rating            one criterion rating, as parsed from the LLM response
+    analysis_completed  ratings (count)
+
+Execution scripts import this module as `progress` and the backend as
+`execution.progress`; both names resolve to the same module (see bottom).
+"""
+
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Optional
+
+Listener = Callable[[str, dict], None]
+
+_listener: ContextVar[Optional[Listener]] = ContextVar('research_progress_listener', default=None)
+
+
+def emit(event: str, **data) -> None:
+    """Report a progress event to the current listener, if any. Listener errors are printed, not raised."""
+    listener = _listener.get()
+    if listener is None:
+        return
+    try:
+        listener(event, data)
+    except Exception as e:
+        print(f'Warning: progress listener failed on {event}: {e}', file=sys.stderr)
+
+
+@contextmanager
+def listen(listener: Listener):
+    """Send progress events emitted in this context to listener(event, data)."""
+    token = _listener.set(listener)
+    try:
+        yield
+    finally:
+        _listener.reset(token)
+
+
+# One module under both import names (see execution/telemetry.py)
+sys.modules.setdefault('progress', sys.modules[__name__])
+sys.modules.setdefault('execution.progress', sys.modules[__name__])
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Rate Limiting for Upstream APIs
+
+Thread-safe token bucket shared by every caller of an upstream (Tavily, LLM).
+The execution modules check an optional module-level `rate_limiter` before each
+request; batch runs install one so concurrent companies stay under quota.
+"""
+
+import time
+import threading
+
+
+class RateLimiter:
+    """Token bucket allowing `rate` requests per second with bursts of up to `burst`."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError('rate must be positive')
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Block until a request may be made. Returns the time spent waiting in seconds."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Scuttlebutt Research Worker Pool
+
+Persistent pool of pre-initialized worker processes that run
+run_scuttlebutt_research in-process.
+
+Replaces spawning `python run_scuttlebutt_company.py` per request: each worker
+pays interpreter startup, dotenv loading and module imports once, then serves
+many tasks. Arguments and results are passed as Python objects over a pipe
+instead of round-tripping through stdout JSON. Tasks have a per-task timeout
+(the worker is killed and replaced on expiry) and workers are recycled after
+a fixed number of tasks to bound memory growth.
+"""
+
+import os
+import sys
+import time
+import queue
+import threading
+import importlib
+import multiprocessing
+from typing import Any, Dict, Optional
+
+execution_dir = os.path.dirname(os.path.abspath(__file__))
+
+RESEARCH_POOL_SIZE = int(os.getenv('RESEARCH_POOL_SIZE', 2))
+RESEARCH_POOL_MAX_TASKS = int(os.getenv('RESEARCH_POOL_MAX_TASKS', 50))  # Recycle workers after this many tasks
+RESEARCH_POOL_TASK_TIMEOUT = float(os.getenv('RESEARCH_POOL_TASK_TIMEOUT', 300))  # 5 minutes
+
+DEFAULT_TARGET = 'run_scuttlebutt_company:run_scuttlebutt_research'
+
+
+class WorkerTaskError(Exception):
+    """A task raised inside a worker. error_type is the original exception class name."""
+
+    def __init__(self, message: str, error_type: str = 'Exception'):
+        super().__init__(message)
+        self.error_type = error_type
+
+
+def _worker_main(conn, target: str) -> None:
+    """Worker process entry point: initialize once, then serve tasks until told to stop."""
+    sys.path.insert(0, execution_dir)
+    from env import load_env
+    load_env()  # A no-op when the parent already loaded .env (the variables are inherited)
+
+    try:
+        module_name, func_name = target.split(':')
+        func = getattr(importlib.import_module(module_name), func_name)
+    except Exception as e:
+        conn.send({'ok': False, 'error': f'Worker failed to load {target}: {e}', 'errorType': type(e).__name__})
+        return
+
+    conn.send({'ok': True, 'ready': os.getpid()})
+
+    while True:
+        try:
+            kwargs = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            return
+        if kwargs is None:
+            return
+
+        try:
+            conn.send({'ok': True, 'result': func(**kwargs)})
+        except Exception as e:
+            conn.send({'ok': False, 'error': str(e), 'errorType': type(e).__name__})
+
+
+class _Worker:
+    """One worker process and the parent end of its pipe."""
+
+    def __init__(self, context, target: str):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn, target), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.tasks_done = 0
+
+        try:
+            ready = self.conn.recv()  # Blocks until imports and dotenv loading are done
+        except EOFError:
+            self.process.join()
+            raise WorkerTaskError(f'Worker exited during startup (exit code {self.process.exitcode})', 'EOFError')
+        if not ready.get('ok'):
+            self.process.join()
+            raise WorkerTaskError(ready['error'], ready['errorType'])
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(timeout=1)
+        self.kill()
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout=5)
+        self.conn.close()
+
+
+class ResearchWorkerPool:
+    """Fixed-size pool of pre-warmed research workers."""
+
+    def __init__(
+        self,
+        size: int = RESEARCH_POOL_SIZE,
+        max_tasks_per_worker: int = RESEARCH_POOL_MAX_TASKS,
+        task_timeout: float = RESEARCH_POOL_TASK_TIMEOUT,
+        target: str = DEFAULT_TARGET
+    ):
+        self.size = max(size, 1)
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.task_timeout = task_timeout
+        self.target = target
+        # Spawn gives each worker a clean interpreter, independent of server threads/state
+        self._context = multiprocessing.get_context('spawn')
+        self._idle = queue.Queue()
+        self._start_lock = threading.Lock()
+        self._started = False
+        self.tasks_completed = 0
+        self.tasks_failed = 0
+        self.timeouts = 0
+        self.workers_recycled = 0
+
+    def start(self) -> None:
+        """Spawn and initialize all workers. Called lazily by run() if not called up front."""
+        with self._start_lock:
+            if self._started:
+                return
+            for _ in range(self.size):
+                self._idle.put(_Worker(self._context, self.target))
+            self._started = True
+
+    def _replace(self, worker: _Worker, graceful: bool) -> None:
+        """Retire a worker and add a fresh one to the pool without blocking the caller."""
+        def replace():
+            if graceful:
+                worker.stop()
+            else:
+                worker.kill()
+            try:
+                self._idle.put(_Worker(self._context, self.target))
+            except Exception as e:
+                print(f'Research pool: failed to start replacement worker: {e}', file=sys.stderr)
+        threading.Thread(target=replace, name='research-pool-replace', daemon=True).start()
+
+    def run(self, timeout: Optional[float] = None, **kwargs) -> Any:
+        """
+        Run the target with keyword arguments in a worker and return its result.
+
+        Args:
+            timeout: Per-task timeout in seconds, including the wait for an idle
+                worker (default: pool task_timeout)
+            **kwargs: Keyword arguments for the target (e.g. company_name, ticker)
+
+        Raises:
+            TimeoutError: No worker became idle, or the task did not finish, within
+                the timeout (a worker running the task is killed and replaced)
+            WorkerTaskError: The task raised, or the worker died
+        """
+        self.start()
+        timeout = self.task_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+
+        try:
+            worker = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            self.timeouts += 1
+            self.tasks_failed += 1
+            raise TimeoutError(f'No research worker became idle within {timeout:g}s')
+        try:
+            worker.conn.send(kwargs)
+            remaining = max(deadline - time.monotonic(), 0)
+            message = worker.conn.recv() if worker.conn.poll(remaining) else None
+        except (EOFError, OSError) as e:
+            self.tasks_failed += 1
+            self._replace(worker, graceful=False)
+            raise WorkerTaskError(f'Research worker died: {e}', type(e).__name__)
+
+        if message is None:
+            self.timeouts += 1
+            self.tasks_failed += 1
+            self._replace(worker, graceful=False)
+            raise TimeoutError(f'Research task timed out after {timeout:g}s')
+
+        worker.tasks_done += 1
+        if worker.tasks_done >= self.max_tasks_per_worker:
+            self.workers_recycled += 1
+            self._replace(worker, graceful=True)
+        else:
+            self._idle.put(worker)
+
+        if not message['ok']:
+            self.tasks_failed += 1
+            raise WorkerTaskError(message['error'], message['errorType'])
+        self.tasks_completed += 1
+        return message['result']
+
+    def shutdown(self) -> None:
+        """Stop all idle workers."""
+        with self._start_lock:
+            while True:
+                try:
+                    self._idle.get_nowait().stop()
+                except queue.Empty:
+                    break
+            self._started = False
+
+    def stats(self) -> Dict:
+        return {
+            'size': self.size,
+            'idleWorkers': self._idle.qsize(),
+            'tasksCompleted': self.tasks_completed,
+            'tasksFailed': self.tasks_failed,
+            'timeouts': self.timeouts,
+            'workersRecycled': self.workers_recycled,
+        }
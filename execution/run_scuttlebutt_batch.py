@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Scuttlebutt Batch Research
+
+Runs Scuttlebutt research for a whole watchlist concurrently.
+
+- Reads tickers from a file, one per line: `AAPL` or `AAPL,Apple Inc.` (# comments allowed)
+- Researches several companies at once under global Tavily/LLM rate limits
+- Appends one JSON line per company to the output file as soon as it finishes
+- The output file doubles as the checkpoint: re-running the same command skips
+  companies that already succeeded and retries the ones that failed
+- Prints throughput and ETA as companies complete
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Dict, List, Set, Tuple
+
+# Add execution directory to path for imports
+execution_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, execution_dir)
+
+import tavily_scuttlebutt
+import run_scuttlebutt_company
+from rate_limit import RateLimiter
+
+if run_scuttlebutt_company.USE_OPENROUTER:
+    import openrouter_scuttlebutt_analysis as llm_client
+else:
+    import ollama_scuttlebutt_analysis as llm_client
+
+
+def read_watchlist(path: str) -> List[Tuple[str, str]]:
+    """Read (ticker, company_name) pairs. Company name defaults to the ticker."""
+    companies = []
+    seen = set()
+    with open(path, 'r') as f:
+        for line in f:
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+            ticker, _, company_name = line.partition(',')
+            ticker = ticker.strip().upper()
+            if ticker in seen:
+                continue
+            seen.add(ticker)
+            companies.append((ticker, company_name.strip() or ticker))
+    return companies
+
+
+def read_completed(path: str) -> Set[str]:
+    """Tickers that already have a successful record in the output file."""
+    completed = set()
+    if not os.path.exists(path):
+        return completed
+    with open(path, 'r') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # Partial line from an interrupted write
+            if record.get('status') == 'ok':
+                completed.add(record.get('ticker'))
+    return completed
+
+
+def format_duration(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f'{hours}h{minutes:02d}m' if hours else f'{minutes}m{seconds:02d}s'
+
+
+def research_one(ticker: str, company_name: str, max_results: int) -> Dict:
+    """
+    Research one company and wrap the outcome in an output record.
+    
+    Searches run in strict mode, so a Tavily outage or exhausted quota is
+    recorded as an error (retried on resume) rather than as an 'ok' result
+    with empty stakeholder buckets.
+    """
+    start = time.monotonic()
+    try:
+        result = run_scuttlebutt_company.run_scuttlebutt_research(
+            company_name=company_name,
+            ticker=ticker,
+            max_results_per_bucket=max_results,
+            strict=True
+        )
+        record = {'ticker': ticker, 'company': company_name, 'status': 'ok', 'result': result}
+    except Exception as e:
+        record = {'ticker': ticker, 'company': company_name, 'status': 'error', 'error': str(e)}
+    record['elapsedSeconds'] = round(time.monotonic() - start, 2)
+    record['finishedAt'] = datetime.now().isoformat()
+    return record
+
+
+def run_batch(
+    companies: List[Tuple[str, str]],
+    output_path: str,
+    concurrency: int = 4,
+    max_results: int = 5
+) -> Dict:
+    """
+    Research companies concurrently, streaming records to output_path.
+
+    Returns:
+        Summary with counts of succeeded/failed companies and elapsed time
+    """
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+    write_lock = threading.Lock()
+    total = len(companies)
+    done = 0
+    failed = 0
+    start = time.monotonic()
+
+    def record_done(output, record: Dict) -> None:
+        nonlocal done, failed
+        with write_lock:
+            output.write(json.dumps(record, default=str) + '\n')
+            output.flush()
+            os.fsync(output.fileno())  # Checkpoint survives a crash right after this
+
+        done += 1
+        if record['status'] != 'ok':
+            failed += 1
+        elapsed = time.monotonic() - start
+        rate = done / elapsed
+        eta = (total - done) / rate if rate else 0
+        status = 'ok' if record['status'] == 'ok' else f'FAILED: {record["error"][:80]}'
+        print(
+            f'[{done}/{total}] {record["ticker"]} {status} ({record["elapsedSeconds"]:.1f}s) | '
+            f'{rate * 60:.1f} companies/min | ETA {format_duration(eta)}',
+            file=sys.stderr
+        )
+
+    with open(output_path, 'a') as output, ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [
+            executor.submit(research_one, ticker, company_name, max_results)
+            for ticker, company_name in companies
+        ]
+        recorded = set()
+        try:
+            for future in as_completed(futures):
+                record_done(output, future.result())
+                recorded.add(future)
+        except KeyboardInterrupt:
+            # Drop queued companies but keep the work already in flight
+            in_flight = [future for future in futures if future not in recorded and not future.cancel()]
+            print(f'\nInterrupted: finishing {len(in_flight)} in-flight companies (Ctrl+C again to abort)...', file=sys.stderr)
+            for future in as_completed(in_flight):
+                record_done(output, future.result())
+            print(f'Stopped after {done}/{total}; re-run the same command to resume.', file=sys.stderr)
+            raise
+
+    return {
+        'companies': total,
+        'succeeded': done - failed,
+        'failed': failed,
+        'elapsedSeconds': round(time.monotonic() - start, 2),
+    }
+
+
+def main():
+    """Main entry point for CLI usage."""
+    parser = argparse.ArgumentParser(description='Run Scuttlebutt research for a watchlist of companies')
+    parser.add_argument('tickers_file', help='File with one ticker per line (optionally "TICKER,Company Name")')
+    parser.add_argument('--output', default='.tmp/scuttlebutt_batch.jsonl', help='JSONL output/checkpoint file (default: .tmp/scuttlebutt_batch.jsonl)')
+    parser.add_argument('--concurrency', type=int, default=4, help='Companies researched at once (default: 4)')
+    parser.add_argument('--max-results', type=int, default=5, help='Max results per stakeholder bucket (default: 5)')
+    parser.add_argument('--tavily-rate', type=float, default=2.0, help='Max Tavily requests per second across all companies (default: 2)')
+    parser.add_argument('--llm-rate', type=float, default=20.0, help='Max LLM requests per minute across all companies (default: 20)')
+
+    args = parser.parse_args()
+
+    # Global limits shared by every worker thread
+    tavily_scuttlebutt.rate_limiter = RateLimiter(args.tavily_rate, burst=max(int(args.tavily_rate), 1))
+    llm_client.rate_limiter = RateLimiter(args.llm_rate / 60)
+
+    companies = read_watchlist(args.tickers_file)
+    completed = read_completed(args.output)
+    pending = [(ticker, name) for ticker, name in companies if ticker not in completed]
+
+    if completed:
+        print(f'Resuming: {len(companies) - len(pending)} of {len(companies)} companies already done', file=sys.stderr)
+    if not pending:
+        print('Nothing to do.', file=sys.stderr)
+        return
+
+    try:
+        summary = run_batch(pending, args.output, args.concurrency, args.max_results)
+    except KeyboardInterrupt:
+        sys.exit(130)
+
+    print(
+        f'Finished {summary["companies"]} companies in {format_duration(summary["elapsedSeconds"])}: '
+        f'{summary["succeeded"]} ok, {summary["failed"]} failed. Results in {args.output}',
+        file=sys.stderr
+    )
+    if summary['failed']:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
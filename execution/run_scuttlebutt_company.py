@@ -10,13 +10,18 @@ import sys
 import json
 import argparse
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 # Add execution directory to path for imports
 execution_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, execution_dir)
 
-from tavily_scuttlebutt import aggregate_stakeholder_signals
+import progress
+import telemetry
+from tavily_scuttlebutt import aggregate_stakeholder_signals, refresh_stakeholder_signals
+from fisher_criteria import (
+    QUALITATIVE_CRITERIA, buckets_for_criteria, criteria_for_buckets, filter_signals, qualitative_criteria
+)
 
 # Use OpenRouter instead of Ollama (no VPS needed!)
 try:
@@ -28,44 +33,19 @@ except ImportError:
     USE_OPENROUTER = False
 
 
-def run_scuttlebutt_research(
+def analyze_stakeholder_signals(
+    signals: dict,
     company_name: str,
     ticker: Optional[str] = None,
-    max_results_per_bucket: int = 5,
-    output_dir: str = '.tmp'
+    criteria: Optional[List[int]] = None
 ) -> dict:
     """
-    Run complete Scuttlebutt research for a company.
+    Analyze signals with OpenRouter (or Ollama fallback), optionally for a subset of criteria.
     
-    Args:
-        company_name: Company name (e.g., "Apple Inc.")
-        ticker: Optional stock ticker (e.g., "AAPL")
-        max_results_per_bucket: Maximum Tavily results per stakeholder bucket
-        output_dir: Directory for temporary files
-    
-    Returns:
-        Complete research result dictionary
+    Reports analysis_started, one rating event per criterion and analysis_completed
+    to any progress listener.
     """
-    # Step 1: Aggregate Tavily signals
-    print(f'Step 1: Aggregating Tavily signals for {company_name}...', file=sys.stderr)
-    signals = aggregate_stakeholder_signals(
-        company_name=company_name,
-        ticker=ticker,
-        max_results_per_bucket=max_results_per_bucket
-    )
-    
-    # Prepare signals data structure
-    signals_data = {
-        'company': company_name,
-        'ticker': ticker,
-        'inputs': {
-            'company_name': company_name,
-            'ticker': ticker,
-        },
-        'signals': signals,
-    }
-    
-    # Step 2: Analyze signals with OpenRouter (or Ollama fallback)
+    progress.emit('analysis_started', provider='openrouter' if USE_OPENROUTER else 'ollama', criteria=criteria)
     if USE_OPENROUTER:
         print(f'Step 2: Analyzing signals with OpenRouter...', file=sys.stderr)
         # Create analysis input (preserve original signals_data for result)
@@ -75,28 +55,182 @@ def run_scuttlebutt_research(
             'ticker': ticker,
             'researchDate': datetime.now().isoformat()
         }
+        if criteria:
+            analysis_input['criteria'] = criteria
         analysis_result = analyze_signals_with_openrouter(analysis_input)
     else:
         print(f'Step 2: Analyzing signals with Ollama...', file=sys.stderr)
         analysis_result = analyze_signals(
             signals=signals,
             company_name=company_name,
-            ticker=ticker
+            ticker=ticker,
+            criteria=criteria
+        )
+    
+    ratings = get_result_ratings({'analysis': analysis_result})
+    for rating in ratings:
+        progress.emit('rating', rating=rating)
+    progress.emit('analysis_completed', ratings=len(ratings))
+    return analysis_result
+
+
+def get_result_ratings(result: dict) -> List[dict]:
+    """Ratings from a research result (OpenRouter and Ollama both nest them under 'analysis')."""
+    ratings = result.get('analysis', {}).get('ratings', [])
+    if not ratings and 'ratings' in result:
+        ratings = result['ratings']
+    return ratings
+
+
+def run_scuttlebutt_research(
+    company_name: str,
+    ticker: Optional[str] = None,
+    max_results_per_bucket: int = 5,
+    output_dir: str = '.tmp',
+    previous_result: Optional[dict] = None,
+    criteria: Optional[List[int]] = None,
+    strict: bool = False
+) -> dict:
+    """
+    Run complete Scuttlebutt research for a company.
+    
+    Args:
+        company_name: Company name (e.g., "Apple Inc.")
+        ticker: Optional stock ticker (e.g., "AAPL")
+        max_results_per_bucket: Maximum Tavily results per stakeholder bucket
+        output_dir: Directory for temporary files
+        previous_result: Optional earlier result for this company. When given, only
+            changed stakeholder buckets are re-searched and only the criteria that
+            depend on them are re-analyzed (see run_incremental_research).
+        criteria: Optional criterion IDs to research. Only the stakeholder buckets
+            they depend on are searched and only they are sent to the LLM.
+            Non-qualitative IDs (1, 5, 10) are dropped; see QUALITATIVE_CRITERIA.
+        strict: Fail with TavilySearchError when a Tavily query fails instead
+            of analyzing the buckets without its results (incremental runs
+            are always strict)
+    
+    Returns:
+        Complete research result dictionary
+    
+    Raises:
+        ValueError: if criteria were given but none of them is qualitative
+        TavilySearchError: A Tavily query failed (strict only)
+    """
+    if previous_result is not None:
+        return run_incremental_research(company_name, previous_result, ticker, max_results_per_bucket)
+    
+    criteria = qualitative_criteria(criteria)
+    
+    # Step 1: Aggregate Tavily signals
+    print(f'Step 1: Aggregating Tavily signals for {company_name}...', file=sys.stderr)
+    with telemetry.span('research.signals'):
+        signals = aggregate_stakeholder_signals(
+            company_name=company_name,
+            ticker=ticker,
+            max_results_per_bucket=max_results_per_bucket,
+            buckets=buckets_for_criteria(criteria) if criteria else None,
+            strict=strict
         )
     
+    # Step 2: Analyze signals with OpenRouter (or Ollama fallback)
+    with telemetry.span('research.analysis', provider='openrouter' if USE_OPENROUTER else 'ollama'):
+        analysis_result = analyze_stakeholder_signals(signals, company_name, ticker, criteria=criteria or QUALITATIVE_CRITERIA)
+    
     # Step 3: Combine results
+    with telemetry.span('research.build'):
+        return build_result(company_name, ticker, signals, analysis_result, criteria)
+
+
+def run_incremental_research(
+    company_name: str,
+    previous_result: dict,
+    ticker: Optional[str] = None,
+    max_results_per_bucket: int = 5
+) -> dict:
+    """
+    Refresh an earlier research result, redoing only the work whose inputs changed.
+    
+    Stakeholder buckets are diffed against the stored signals by URL set. Only
+    criteria depending on a changed bucket are sent to the LLM; all other ratings
+    are carried over from previous_result. A criterion-targeted previous result
+    stays targeted to the same criteria.
+    
+    Returns:
+        Complete research result dictionary with an 'incremental' report
+    """
+    criteria = qualitative_criteria(previous_result.get('criteria'))
+    scope = criteria or QUALITATIVE_CRITERIA
+    
+    print(f'Step 1: Refreshing Tavily signals for {company_name}...', file=sys.stderr)
+    with telemetry.span('research.signals', incremental=True) as signals_span:
+        refresh = refresh_stakeholder_signals(
+            company_name=company_name,
+            previous_signals=previous_result.get('signals', {}),
+            ticker=ticker,
+            max_results_per_bucket=max_results_per_bucket,
+            buckets=buckets_for_criteria(criteria) if criteria else None
+        )
+        signals_span.set(changedBuckets=refresh['changedBuckets'], queriesSkipped=refresh['queriesSkipped'])
+    signals = refresh['signals']
+    changed_buckets = refresh['changedBuckets']
+    
+    previous_analysis = previous_result.get('analysis', {})
+    criteria_to_refresh = [c for c in criteria_for_buckets(changed_buckets) if c in scope]
+    
+    if criteria_to_refresh:
+        with telemetry.span('research.analysis', provider='openrouter' if USE_OPENROUTER else 'ollama', criteria=criteria_to_refresh):
+            new_analysis = analyze_stakeholder_signals(
+                filter_signals(signals, criteria_to_refresh),
+                company_name,
+                ticker,
+                criteria=criteria_to_refresh
+            )
+        refreshed_ids = set(criteria_to_refresh)
+        ratings = [
+            r for r in get_result_ratings(previous_result)
+            if r.get('criterionId') in scope and r.get('criterionId') not in refreshed_ids
+        ]
+        ratings.extend(new_analysis.get('ratings', []))
+        ratings.sort(key=lambda r: r.get('criterionId', 0))
+        analysis_result = dict(new_analysis, ratings=ratings)
+    else:
+        print('Step 2: No stakeholder buckets changed, reusing previous analysis', file=sys.stderr)
+        ratings = [r for r in get_result_ratings(previous_result) if r.get('criterionId') in scope]
+        analysis_result = dict(previous_analysis, ratings=ratings)
+    
+    result = build_result(company_name, ticker, signals, analysis_result, criteria)
+    result['incremental'] = {
+        'changedBuckets': changed_buckets,
+        'queriesRun': refresh['queriesRun'],
+        'queriesSkipped': refresh['queriesSkipped'],
+        'criteriaRefreshed': criteria_to_refresh,
+        'criteriaSkipped': len(scope) - len(criteria_to_refresh),
+    }
+    return result
+
+
+def build_result(
+    company_name: str,
+    ticker: Optional[str],
+    signals: dict,
+    analysis_result: dict,
+    criteria: Optional[List[int]] = None
+) -> dict:
+    """Combine signals and analysis into the orchestrator result ('criteria' is None for all qualitative criteria)."""
     model_used = analysis_result.get('modelUsed', 'openrouter-gpt-4o-mini' if USE_OPENROUTER else 'ollama-llama3.2')
-    result = {
+    return {
         'company': company_name,
         'ticker': ticker,
-        'inputs': signals_data['inputs'],  # Use original signals_data with 'inputs'
+        'inputs': {
+            'company_name': company_name,
+            'ticker': ticker,
+        },
         'signals': signals,
         'analysis': analysis_result,
         'researchDate': datetime.now().isoformat(),
         'modelUsed': model_used,
+        'criteria': criteria,
     }
-    
-    return result
 
 
 def main():
@@ -106,16 +240,25 @@ def main():
     parser.add_argument('--ticker', help='Stock ticker symbol (e.g., "AAPL")')
     parser.add_argument('--max-results', type=int, default=5, help='Max results per stakeholder bucket (default: 5)')
     parser.add_argument('--output', help='Output file path (default: stdout or .tmp/scuttlebutt_<company>.json)')
+    parser.add_argument('--criteria', help='Comma-separated criterion IDs to research (default: all qualitative criteria), e.g. "3,7"')
+    parser.add_argument('--previous', help='Earlier result JSON to refresh incrementally (only changed buckets/criteria are redone)')
     parser.add_argument('--out-format', choices=['json', 'markdown'], default='json', help='Output format (default: json)')
     
     args = parser.parse_args()
     
     try:
+        previous_result = None
+        if args.previous:
+            with open(args.previous, 'r') as f:
+                previous_result = json.load(f)
+        
         # Run research
         result = run_scuttlebutt_research(
             company_name=args.company_name,
             ticker=args.ticker,
-            max_results_per_bucket=args.max_results
+            max_results_per_bucket=args.max_results,
+            previous_result=previous_result,
+            criteria=[int(c) for c in args.criteria.split(',')] if args.criteria else None
         )
         
         # Format output
@@ -11,14 +11,20 @@ import sys
 import json
 import argparse
 from typing import Dict, List, Optional
-from dotenv import load_dotenv
 import requests
 
+import progress
+import telemetry
+from env import load_env
+
 # Load environment variables
-load_dotenv()
+load_env()
 
 TAVILY_API_KEY = os.getenv('TAVILY_API_KEY')
-TAVILY_API_URL = 'https://api.tavily.com/search'
+TAVILY_API_URL = os.getenv('TAVILY_API_URL', 'https://api.tavily.com/search')
+
+# Optional shared RateLimiter (see rate_limit.py), installed by batch runs
+rate_limiter = None
 
 # Stakeholder query patterns
 STAKEHOLDER_QUERIES = {
@@ -55,25 +61,38 @@ STAKEHOLDER_QUERIES = {
 }
 
 
-def search_tavily(query: str, max_results: int = 5) -> List[Dict]:
-    """Search Tavily API with a query and return results."""
+class TavilySearchError(Exception):
+    """A Tavily query failed (connection, HTTP status such as an exhausted quota)."""
+
+
+def search_tavily(query: str, max_results: int = 5, strict: bool = False) -> List[Dict]:
+    """
+    Search Tavily API with a query and return results.
+    
+    A failed query returns no results, or raises TavilySearchError with strict=True
+    (for callers that must tell a failure apart from an empty result).
+    """
     if not TAVILY_API_KEY:
         raise ValueError('TAVILY_API_KEY not found in environment variables')
     
+    if rate_limiter:
+        rate_limiter.acquire()
+    
     try:
-        response = requests.post(
-            TAVILY_API_URL,
-            json={
-                'api_key': TAVILY_API_KEY,
-                'query': query,
-                'search_depth': 'advanced',
-                'max_results': max_results,
-            },
-            headers={'Content-Type': 'application/json'},
-            timeout=30
-        )
-        response.raise_for_status()
-        data = response.json()
+        with telemetry.span('tavily.search'):
+            response = requests.post(
+                TAVILY_API_URL,
+                json={
+                    'api_key': TAVILY_API_KEY,
+                    'query': query,
+                    'search_depth': 'advanced',
+                    'max_results': max_results,
+                },
+                headers={'Content-Type': 'application/json'},
+                timeout=30
+            )
+            response.raise_for_status()
+            data = response.json()
         
         # Extract results
         results = data.get('results', [])
@@ -102,10 +121,58 @@ def search_tavily(query: str, max_results: int = 5) -> List[Dict]:
         
     except requests.exceptions.RequestException as e:
         print(f'Error searching Tavily for query "{query}": {e}', file=sys.stderr)
+        if strict:
+            raise TavilySearchError(f'Tavily query "{query}" failed: {e}') from e
         return []
 
 
-def aggregate_stakeholder_signals(company_name: str, ticker: Optional[str] = None, max_results_per_bucket: int = 5) -> Dict:
+def dedupe_results(results: List[Dict]) -> List[Dict]:
+    """Deduplicate results by URL (keep first occurrence), keeping summary entries without a URL."""
+    seen_urls = set()
+    unique_results = []
+    for result in results:
+        url = result.get('source_url', '')
+        if url and url not in seen_urls:
+            seen_urls.add(url)
+            unique_results.append(result)
+        elif not url:  # Keep summary entries (no URL)
+            unique_results.append(result)
+    return unique_results
+
+
+def search_stakeholder_query(
+    company_name: str,
+    stakeholder_type: str,
+    pattern: str,
+    max_results: int = 5,
+    strict: bool = False
+) -> List[Dict]:
+    """Run one stakeholder query pattern and tag its results with the stakeholder type."""
+    query = pattern.format(company=company_name)
+    with telemetry.span('tavily.query', bucket=stakeholder_type, query=query) as query_span:
+        results = search_tavily(query, max_results=max_results, strict=strict)
+        query_span.set(results=len(results))
+    
+    # Tag results with stakeholder type
+    for result in results:
+        result['stakeholder_type'] = stakeholder_type
+        result['tags'] = [stakeholder_type]  # Can add more specific tags later
+    
+    return results
+
+
+def signal_urls(bucket_signals: List[Dict]) -> set:
+    """Set of source URLs in a stakeholder bucket (summary entries have none)."""
+    return {signal.get('source_url') for signal in bucket_signals if signal.get('source_url')}
+
+
+def aggregate_stakeholder_signals(
+    company_name: str,
+    ticker: Optional[str] = None,
+    max_results_per_bucket: int = 5,
+    buckets: Optional[List[str]] = None,
+    strict: bool = False
+) -> Dict:
     """
     Aggregate Tavily searches by stakeholder groups.
     
@@ -113,56 +180,129 @@ def aggregate_stakeholder_signals(company_name: str, ticker: Optional[str] = Non
         company_name: Company name (e.g., "Apple Inc.")
         ticker: Optional stock ticker (e.g., "AAPL")
         max_results_per_bucket: Maximum results per stakeholder bucket
+        buckets: Optional stakeholder types to search (default: all)
+        strict: Raise TavilySearchError when a query fails instead of
+            leaving its results out
     
     Returns:
         Dictionary with signals organized by stakeholder type
+    
+    Raises:
+        TavilySearchError: A query failed (strict only)
     """
-    signals = {
-        'customers': [],
-        'employees': [],
-        'competitors': [],
-        'suppliers': [],
-        'innovation': [],
-        'risks': [],
+    queries = {
+        stakeholder_type: query_patterns
+        for stakeholder_type, query_patterns in STAKEHOLDER_QUERIES.items()
+        if buckets is None or stakeholder_type in buckets
     }
+    signals = {stakeholder_type: [] for stakeholder_type in queries}
     
     # Use ticker if available for more specific searches
     search_term = f'{company_name} ({ticker})' if ticker else company_name
     
     print(f'Aggregating stakeholder signals for {search_term}...', file=sys.stderr)
     
-    for stakeholder_type, query_patterns in STAKEHOLDER_QUERIES.items():
+    for stakeholder_type, query_patterns in queries.items():
         print(f'  Searching {stakeholder_type}...', file=sys.stderr)
+        progress.emit('bucket_started', bucket=stakeholder_type, queries=len(query_patterns))
         
         all_results = []
         for pattern in query_patterns:
-            query = pattern.format(company=company_name)
-            results = search_tavily(query, max_results=max_results_per_bucket)
-            
-            # Tag results with stakeholder type
-            for result in results:
-                result['stakeholder_type'] = stakeholder_type
-                result['tags'] = [stakeholder_type]  # Can add more specific tags later
-            
-            all_results.extend(results)
-        
-        # Deduplicate by URL (keep first occurrence)
-        seen_urls = set()
-        unique_results = []
-        for result in all_results:
-            url = result.get('source_url', '')
-            if url and url not in seen_urls:
-                seen_urls.add(url)
-                unique_results.append(result)
-            elif not url:  # Keep summary entries (no URL)
-                unique_results.append(result)
+            all_results.extend(
+                search_stakeholder_query(company_name, stakeholder_type, pattern, max_results_per_bucket, strict=strict)
+            )
         
         # Limit to max_results_per_bucket
-        signals[stakeholder_type] = unique_results[:max_results_per_bucket]
+        signals[stakeholder_type] = dedupe_results(all_results)[:max_results_per_bucket]
+        progress.emit('bucket_completed', bucket=stakeholder_type, results=len(signals[stakeholder_type]))
     
     return signals
 
 
+def refresh_stakeholder_signals(
+    company_name: str,
+    previous_signals: Dict,
+    ticker: Optional[str] = None,
+    max_results_per_bucket: int = 5,
+    buckets: Optional[List[str]] = None
+) -> Dict:
+    """
+    Refresh stakeholder signals against a previous run, skipping unchanged buckets.
+    
+    Each bucket is probed with its first query pattern. The probe's results were
+    the first entries of the previous bucket, so if every probe URL is already in
+    the stored bucket it is treated as unchanged and its remaining queries are
+    skipped. Otherwise (including a probe with no results) the bucket is re-run
+    in full and diffed by URL set.
+    
+    Queries run in strict mode: if any Tavily query fails (outage, exhausted
+    quota) TavilySearchError is raised instead of passing the missing results
+    off as an unchanged or emptied bucket, so the caller keeps the previous
+    result rather than storing it again as fresh.
+    
+    Args:
+        company_name: Company name (e.g., "Apple Inc.")
+        previous_signals: Signals from a previous aggregate_stakeholder_signals run
+        ticker: Optional stock ticker (e.g., "AAPL")
+        max_results_per_bucket: Maximum results per stakeholder bucket
+        buckets: Optional stakeholder types to refresh (default: all)
+    
+    Returns:
+        Dictionary with 'signals', 'changedBuckets', 'queriesRun' and 'queriesSkipped'
+    
+    Raises:
+        TavilySearchError: A query failed
+    """
+    signals = {}
+    changed_buckets = []
+    queries_run = 0
+    queries_skipped = 0
+    
+    search_term = f'{company_name} ({ticker})' if ticker else company_name
+    print(f'Refreshing stakeholder signals for {search_term}...', file=sys.stderr)
+    
+    for stakeholder_type, query_patterns in STAKEHOLDER_QUERIES.items():
+        if buckets is not None and stakeholder_type not in buckets:
+            continue
+        previous_bucket = previous_signals.get(stakeholder_type) or []
+        previous_urls = signal_urls(previous_bucket)
+        progress.emit('bucket_started', bucket=stakeholder_type, queries=len(query_patterns))
+        
+        probe_results = search_stakeholder_query(
+            company_name, stakeholder_type, query_patterns[0], max_results_per_bucket, strict=True
+        )
+        queries_run += 1
+        probe_urls = signal_urls(probe_results)
+        
+        if probe_urls and probe_urls <= previous_urls:
+            print(f'  {stakeholder_type}: unchanged, skipping {len(query_patterns) - 1} queries', file=sys.stderr)
+            signals[stakeholder_type] = previous_bucket
+            queries_skipped += len(query_patterns) - 1
+            progress.emit('bucket_completed', bucket=stakeholder_type, results=len(previous_bucket), changed=False)
+            continue
+        
+        print(f'  {stakeholder_type}: new results, re-running bucket...', file=sys.stderr)
+        all_results = list(probe_results)
+        for pattern in query_patterns[1:]:
+            all_results.extend(
+                search_stakeholder_query(company_name, stakeholder_type, pattern, max_results_per_bucket, strict=True)
+            )
+            queries_run += 1
+        
+        signals[stakeholder_type] = dedupe_results(all_results)[:max_results_per_bucket]
+        changed = signal_urls(signals[stakeholder_type]) != previous_urls
+        if changed:
+            changed_buckets.append(stakeholder_type)
+        progress.emit('bucket_completed', bucket=stakeholder_type, results=len(signals[stakeholder_type]), changed=changed)
+    
+    return {
+        'signals': signals,
+        'changedBuckets': changed_buckets,
+        'queriesRun': queries_run,
+        'queriesSkipped': queries_skipped,
+    }
+
+
 def main():
     """Main entry point for CLI usage."""
     parser = argparse.ArgumentParser(description='Aggregate Tavily searches by stakeholder groups')
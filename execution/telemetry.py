@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+Telemetry
+
+In-process metrics and tracing for the research pipeline and the API, with
+no dependencies beyond the standard library.
+
+- Counter, Gauge and Histogram with label values, registered in REGISTRY
+- span(name) times a block into the stage_duration_seconds histogram, counts
+  failures in stage_errors_total and records a span in the current trace;
+  finished traces are written to TRACE_EXPORT_PATH as JSON lines
+- render_prometheus() produces the Prometheus text exposition format
+
+Updates are a dict lookup and a short locked section, so instrumentation
+stays on in production. Metrics are per process: work done inside research
+pool workers is not visible to the API process.
+
+Execution scripts import this module as `telemetry` and the backend as
+`execution.telemetry`; both names resolve to the same module (see bottom).
+"""
+
+import os
+import sys
+import json
+import time
+import threading
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Optional JSON-lines file that finished spans are appended to (unset = no export)
+TRACE_EXPORT_PATH = os.getenv('TRACE_EXPORT_PATH', '')
+
+# Seconds; upstream calls range from SEC lookups (~100 ms) to LLM calls (~60 s)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = '') -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return '{' + ','.join(parts) + '}' if parts else ''
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    kind = ''
+
+    def __init__(self, name: str, documentation: str, labels: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, '')) for name in self.label_names)
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.kind}']
+        lines.extend(self.samples())
+        return '\n'.join(lines)
+
+
+class Counter(_Metric):
+    kind = 'counter'
+
+    def __init__(self, name: str, documentation: str, labels: Iterable[str] = ()):
+        super().__init__(name, documentation, labels)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [f'{self.name}{_format_labels(self.label_names, key)} {_format_value(v)}' for key, v in items]
+
+
+class Gauge(Counter):
+    kind = 'gauge'
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labels: Iterable[str] = (), buckets: Iterable[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+        # Label values -> [per-bucket counts (+Inf last), sum]
+        self._values: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        i = bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = [[0] * (len(self.buckets) + 1), 0.0]
+                self._values[key] = entry
+            entry[0][i] += 1
+            entry[1] += value
+
+    def count(self, **labels) -> int:
+        entry = self._values.get(self._key(labels))
+        return sum(entry[0]) if entry else 0
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = [(key, list(counts), total) for key, (counts, total) in self._values.items()]
+        lines = []
+        for key, counts, total in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f'{self.name}_bucket{_format_labels(self.label_names, key, le)} {cumulative}')
+            lines.append(f'{self.name}_sum{_format_labels(self.label_names, key)} {_format_value(total)}')
+            lines.append(f'{self.name}_count{_format_labels(self.label_names, key)} {cumulative}')
+        return lines
+
+
+class Registry:
+    """Named metrics plus collectors that report values computed at scrape time."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], Iterable[_Metric]]] = []
+
+    def _get_or_create(self, cls, name: str, documentation: str, labels: Iterable[str], **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = cls(name, documentation, labels, **kwargs)
+                self._metrics[name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labels: Iterable[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labels)
+
+    def gauge(self, name: str, documentation: str, labels: Iterable[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labels)
+
+    def histogram(self, name: str, documentation: str, labels: Iterable[str] = (), buckets: Iterable[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labels, buckets=buckets)
+
+    def register_collector(self, collector: Callable[[], Iterable[_Metric]]) -> None:
+        """Add a callable returning freshly built metrics on every scrape (e.g. cache counters)."""
+        with self._lock:
+            self._collectors.append(collector)
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors)
+        for collector in collectors:
+            try:
+                metrics.extend(collector())
+            except Exception as e:
+                print(f'Warning: Metrics collector failed: {e}', file=sys.stderr)
+        return '\n'.join(metric.render() for metric in metrics) + '\n'
+
+
+REGISTRY = Registry()
+
+STAGE_DURATION = REGISTRY.histogram(
+    'stage_duration_seconds',
+    'Duration of pipeline stages and upstream calls (tavily.search, openrouter.chat, sec.concept, ...)',
+    ['stage']
+)
+STAGE_ERRORS = REGISTRY.counter('stage_errors_total', 'Pipeline stages and upstream calls that raised', ['stage'])
+STAGE_IN_FLIGHT = REGISTRY.gauge('stage_in_flight', 'Pipeline stages and upstream calls currently running', ['stage'])
+CACHE_REQUESTS = REGISTRY.counter('cache_requests_total', 'Cache lookups by cache and result (hit, stale, miss)', ['cache', 'result'])
+
+
+class Span:
+    """One timed operation in a trace; spans opened inside it become its children."""
+
+    __slots__ = ('trace', 'span_id', 'parent_id', 'name', 'attributes', 'start', 'duration', 'error')
+
+    def __init__(self, trace: '_Trace', name: str, parent_id: Optional[str], attributes: Dict):
+        self.trace = trace
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.name = name
+        self.attributes = attributes
+        self.start = time.time()
+        self.duration: Optional[float] = None
+        self.error: Optional[str] = None
+
+    @property
+    def trace_id(self) -> str:
+        return self.trace.trace_id
+
+    def set(self, **attributes) -> None:
+        """Add attributes, e.g. result counts known only at the end of the block."""
+        self.attributes.update(attributes)
+
+    def to_dict(self) -> Dict:
+        return {
+            'traceId': self.trace_id,
+            'spanId': self.span_id,
+            'parentId': self.parent_id,
+            'name': self.name,
+            'start': self.start,
+            'durationMs': None if self.duration is None else round(self.duration * 1000, 3),
+            'attributes': self.attributes,
+            'error': self.error,
+        }
+
+
+class _Trace:
+    """Finished spans of one trace, exported together when the root span ends."""
+
+    def __init__(self, trace_id: Optional[str]):
+        self.trace_id = trace_id or new_trace_id()
+        self.spans: List[Span] = []
+        self.exported = False
+        self._lock = threading.Lock()
+
+    def finish(self, span: 'Span') -> None:
+        with self._lock:
+            self.spans.append(span)
+            late = self.exported  # e.g. a background thread outliving the request
+        if late:
+            _export([span])
+
+    def close(self) -> None:
+        """Export the trace; spans finishing afterwards are exported one by one."""
+        with self._lock:
+            self.exported = True
+            spans = list(self.spans)
+        _export(spans)
+
+
+class JsonlExporter:
+    """Appends finished spans, one JSON object per line."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def __call__(self, spans: List[Span]) -> None:
+        lines = ''.join(json.dumps(span.to_dict(), default=str) + '\n' for span in spans)
+        directory = os.path.dirname(self.path)
+        with self._lock:
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, 'a') as f:
+                f.write(lines)
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar('telemetry_span', default=None)
+_exporter: Optional[Callable[[List[Span]], None]] = JsonlExporter(TRACE_EXPORT_PATH) if TRACE_EXPORT_PATH else None
+
+
+def new_trace_id() -> str:
+    return os.urandom(16).hex()
+
+
+def set_exporter(exporter: Optional[Callable[[List[Span]], None]]) -> None:
+    """Replace the span exporter (None disables export; spans are still timed)."""
+    global _exporter
+    _exporter = exporter
+
+
+def _export(spans: List[Span]) -> None:
+    if _exporter is None or not spans:
+        return
+    try:
+        _exporter(spans)
+    except Exception as e:
+        print(f'Warning: Could not export {len(spans)} spans: {e}', file=sys.stderr)
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+@contextmanager
+def span(name: str, trace_id: Optional[str] = None, **attributes):
+    """
+    Time a block as stage `name` and record it as a span.
+
+    The span is a child of the span open in the current context (threads and
+    pool workers start their own trace); otherwise it starts a trace, with
+    trace_id if given (e.g. from a request header). Exceptions are counted and
+    re-raised. Yields the Span so attributes can be added.
+    """
+    parent = _current_span.get()
+    trace = parent.trace if parent is not None else _Trace(trace_id)
+    current = Span(trace, name, parent.span_id if parent is not None else None, attributes)
+    token = _current_span.set(current)
+    STAGE_IN_FLIGHT.inc(stage=name)
+    start = time.perf_counter()
+    try:
+        yield current
+    except BaseException as e:
+        current.error = f'{type(e).__name__}: {e}'
+        STAGE_ERRORS.inc(stage=name)
+        raise
+    finally:
+        current.duration = time.perf_counter() - start
+        STAGE_DURATION.observe(current.duration, stage=name)
+        STAGE_IN_FLIGHT.dec(stage=name)
+        _current_span.reset(token)
+        trace.finish(current)
+        if parent is None:
+            trace.close()
+
+
+def timing_summary(root: Span) -> Dict:
+    """
+    Per-span timings of a trace so far, in start order, for attaching to a
+    result; open spans (including root itself) have durationMs None.
+    """
+    with root.trace._lock:
+        spans = sorted(root.trace.spans, key=lambda s: s.start)
+    total = root.duration if root.duration is not None else time.time() - root.start
+    return {
+        'traceId': root.trace_id,
+        'totalMs': round(total * 1000, 3),
+        'spans': [
+            {key: value for key, value in s.to_dict().items() if key != 'traceId'}
+            for s in spans
+        ],
+    }
+
+
+def cache_result(cache: str, result: str) -> None:
+    """Count a cache lookup; result is 'hit', 'stale' or 'miss'."""
+    CACHE_REQUESTS.inc(cache=cache, result=result)
+
+
+def render_prometheus() -> str:
+    """All metrics in Prometheus text format (version 0.0.4)."""
+    return REGISTRY.render()
+
+
+# One module under both import names: execution scripts use `import telemetry`,
+# the backend uses `from execution import telemetry`
+sys.modules.setdefault('telemetry', sys.modules[__name__])
+sys.modules.setdefault('execution.telemetry', sys.modules[__name__])
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Benchmark the vectorized Rule #1 backtest.
+
+Generates a synthetic universe (random-walk prices, quarterly fundamentals),
+writes it in the backtest file layout, then times loading and the backtest
+itself.
+
+Usage: python scripts/bench-backtest.py [--tickers 500] [--years 15]
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import numpy as np
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from backend.services.backtest import TRADING_DAYS_PER_YEAR, load_universe, run_backtest
+
+
+def write_universe(data_dir: str, tickers: int, years: int, seed: int = 42) -> None:
+    """Write synthetic prices/ and fundamentals/ CSVs."""
+    rng = np.random.default_rng(seed)
+    days = np.busday_offset('2010-01-04', np.arange(years * TRADING_DAYS_PER_YEAR), roll='forward')
+    quarters = days[::TRADING_DAYS_PER_YEAR // 4]
+    os.makedirs(os.path.join(data_dir, 'prices'), exist_ok=True)
+    os.makedirs(os.path.join(data_dir, 'fundamentals'), exist_ok=True)
+
+    for i in range(tickers):
+        symbol = f'T{i:04d}'
+        drift = rng.uniform(-0.05, 0.25) / TRADING_DAYS_PER_YEAR
+        price = rng.uniform(10, 200) * np.exp(np.cumsum(rng.normal(drift, 0.02, len(days))))
+        with open(os.path.join(data_dir, 'prices', f'{symbol}.csv'), 'w') as f:
+            f.write('date,close\n')
+            f.writelines(f'{d},{p:.4f}\n' for d, p in zip(days.astype(str), price))
+
+        eps = rng.uniform(0.5, 8) * np.exp(np.cumsum(rng.normal(0.02, 0.05, len(quarters))))
+        growth = np.clip(rng.normal(12, 6, len(quarters)), -10, 40)
+        with open(os.path.join(data_dir, 'fundamentals', f'{symbol}.csv'), 'w') as f:
+            f.write('filed,eps,growthRate\n')
+            f.writelines(f'{d},{e:.4f},{g:.2f}\n' for d, e, g in zip(quarters.astype(str), eps, growth))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark vectorized backtest')
+    parser.add_argument('--tickers', type=int, default=500)
+    parser.add_argument('--years', type=int, default=15)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        start = time.perf_counter()
+        write_universe(data_dir, args.tickers, args.years)
+        print(f'Generated {args.tickers} tickers x {args.years} years in {time.perf_counter() - start:.2f}s')
+
+        start = time.perf_counter()
+        universe = load_universe(data_dir)
+        load_time = time.perf_counter() - start
+
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        result = run_backtest(universe)
+        timings.append(time.perf_counter() - start)
+
+    days, tickers = universe['price'].shape
+    print(f'Loaded {tickers} tickers x {days} days in {load_time:.2f}s')
+    print(f'Backtest: {min(timings) * 1000:.1f}ms ({min(timings) / (days * tickers) * 1e9:.1f} ns per ticker-day)')
+    print(f'\nTrades: {result["trades"]["count"]} (hit rate {result["trades"]["hitRate"]:.1%})')
+    print(f'Strategy: {result["portfolio"]}')
+    print(f'Benchmark: {result["benchmark"]}')
+
+
+if __name__ == '__main__':
+    main()
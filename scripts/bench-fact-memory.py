@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Benchmark memory per XBRL fact: SEC companyfacts JSON vs compact FactSeries.
+
+For each filer, measures with tracemalloc:
+
+    json       the parsed companyfacts JSON (one dict per fact), as returned by
+               sec_edgar.get_company_facts and previously held by cached indexes
+    compact    PointInTimeIndex(...).compact() after the JSON is dropped
+               (numpy columns, coded forms/periods, interned accessions)
+
+plus conversion time and as-of lookup time on the compact index. Filers are
+real companyfacts files (--file, e.g. saved from
+https://data.sec.gov/api/xbrl/companyfacts/CIK0000320193.json), fetched from
+SEC (--symbol, needs network and SEC_USER_AGENT), or synthetic filers shaped
+like real ones (--synthetic: fact counts, ~60 facts per concept, one accession
+per quarterly filing shared by all its facts).
+
+Usage: python scripts/bench-fact-memory.py [--synthetic 5000,30000,90000] [--file AAPL.json] [--symbol MSFT]
+"""
+
+import os
+import sys
+import gc
+import json
+import time
+import random
+import argparse
+import tracemalloc
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from backend.services.point_in_time import PointInTimeIndex
+
+
+def synthetic_companyfacts(n_facts: int, seed: int = 0) -> dict:
+    """companyfacts-shaped JSON with about n_facts facts over 15 years of 10-Q/10-K filings."""
+    rng = random.Random(seed)
+    filings = []
+    for year in range(2010, 2025):
+        for quarter in range(1, 5):
+            annual = quarter == 4
+            filings.append({
+                'accn': f'0000{rng.randint(100000, 999999)}-{year % 100:02d}-{rng.randint(1, 999999):06d}',
+                'fy': year, 'fp': 'FY' if annual else f'Q{quarter}', 'form': '10-K' if annual else '10-Q',
+                'filed': f'{year + annual}-{(quarter * 3 + 1) % 12 + 1:02d}-{rng.randint(1, 28):02d}',
+                'end': f'{year}-{quarter * 3:02d}-{30 if quarter in (2, 3) else 31}',
+            })
+    concepts = {}
+    n_concepts = max(1, n_facts // 60)
+    for c in range(n_concepts):
+        instant = c % 3 == 0
+        facts = []
+        for filing in filings:
+            # Current period plus the comparative prior-year period, as filings report them
+            for years_back in (0, 1):
+                end = f'{int(filing["end"][:4]) - years_back}{filing["end"][4:]}'
+                fact = {'end': end, 'val': rng.randint(-10 ** 9, 10 ** 11), 'accn': filing['accn'], 'fy': filing['fy'],
+                        'fp': filing['fp'], 'form': filing['form'], 'filed': filing['filed']}
+                if not instant:
+                    start_month = 1 if filing['fp'] == 'FY' else int(end[5:7]) - 2
+                    fact['start'] = f'{end[:4]}-{start_month:02d}-01'
+                if years_back == 0 and rng.random() < 0.5:
+                    fact['frame'] = f'CY{end[:4]}Q{(int(end[5:7]) + 2) // 3}' + ('I' if instant else '')
+                facts.append(fact)
+                if len(facts) >= 60:
+                    break
+            if len(facts) >= 60:
+                break
+        unit = 'shares' if c % 17 == 0 else 'USD'
+        concepts[f'SyntheticConcept{c}'] = {
+            'label': f'Synthetic Concept {c}',
+            'description': 'Amount of synthetic concept reported for the period, used for benchmarking. ' * 2,
+            'units': {unit: facts},
+        }
+    return {'cik': 1, 'entityName': f'Synthetic {n_facts}', 'facts': {'us-gaap': concepts}}
+
+
+def count_facts(companyfacts: dict) -> int:
+    return sum(
+        len(facts)
+        for concepts in companyfacts.get('facts', {}).values()
+        for concept in concepts.values()
+        for facts in concept.get('units', {}).values()
+    )
+
+
+def traced(build):
+    """(result, bytes still allocated by build when it returns)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, current
+
+
+def measure(name: str, text: str) -> dict:
+    companyfacts, json_bytes = traced(lambda: json.loads(text))
+    n = count_facts(companyfacts)
+
+    def convert():
+        data = json.loads(text)
+        return PointInTimeIndex(data).compact()  # The JSON is unreferenced once this returns
+
+    index, compact_bytes = traced(convert)
+
+    start = time.perf_counter()
+    PointInTimeIndex(companyfacts).compact()
+    convert_seconds = time.perf_counter() - start
+
+    keys = list(index._series)
+    start = time.perf_counter()
+    lookups = 0
+    for as_of in ('2012-06-30', '2018-06-30', None):
+        for concept, unit, annual in keys:
+            index.series(concept, unit, annual).latest(as_of)
+            lookups += 1
+    lookup_seconds = (time.perf_counter() - start) / max(lookups, 1)
+
+    return {
+        'name': name, 'facts': n, 'jsonBytes': json_bytes, 'compactBytes': compact_bytes,
+        'convertSeconds': convert_seconds, 'lookupSeconds': lookup_seconds,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark memory per XBRL fact')
+    parser.add_argument('--synthetic', default='5000,30000,90000', help='Fact counts of synthetic filers ("" for none)')
+    parser.add_argument('--file', action='append', default=[], help='Saved companyfacts JSON (repeatable)')
+    parser.add_argument('--symbol', action='append', default=[], help='Fetch companyfacts from SEC (repeatable)')
+    args = parser.parse_args()
+
+    filers = [(f'synthetic-{n}', json.dumps(synthetic_companyfacts(int(n)))) for n in args.synthetic.split(',') if n]
+    for path in args.file:
+        with open(path) as f:
+            filers.append((os.path.basename(path), f.read()))
+    for symbol in args.symbol:
+        from backend.services.sec_edgar import get_company_facts
+        companyfacts = get_company_facts(symbol)
+        if companyfacts is None:
+            print(f'Skipping {symbol}: companyfacts unavailable')
+            continue
+        filers.append((symbol.upper(), json.dumps(companyfacts)))
+
+    print(f'{"filer":<20}{"facts":>8}{"json MB":>9}{"B/fact":>8}{"compact MB":>12}{"B/fact":>8}{"ratio":>7}'
+          f'{"convert ms":>12}{"us/fact":>9}{"lookup us":>11}')
+    for name, text in filers:
+        r = measure(name, text)
+        n = max(r['facts'], 1)
+        print(f'{r["name"]:<20}{r["facts"]:>8}{r["jsonBytes"] / 1e6:>9.1f}{r["jsonBytes"] / n:>8.0f}'
+              f'{r["compactBytes"] / 1e6:>12.2f}{r["compactBytes"] / n:>8.0f}{r["jsonBytes"] / max(r["compactBytes"], 1):>6.1f}x'
+              f'{r["convertSeconds"] * 1000:>12.1f}{r["convertSeconds"] * 1e6 / n:>9.2f}{r["lookupSeconds"] * 1e6:>11.1f}')
+    print('\ncompact = everything a cached index retains (arrays, series objects, accession strings, concept keys)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Benchmark the Rule #1 tools engine.
+
+Reports the cost of computing MACD, slow stochastic and SMA10 for a whole
+(days x tickers) matrix at once, and of appending one bar to a stored series
+incrementally vs recomputing its full history.
+
+Usage: python scripts/bench-indicators.py [--tickers 500] [--years 15]
+"""
+
+import os
+import sys
+import time
+import argparse
+import numpy as np
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from backend.services.indicators import compute_indicators
+from backend.services.price_history import PriceSeries
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark technical indicators')
+    parser.add_argument('--tickers', type=int, default=500)
+    parser.add_argument('--years', type=int, default=15)
+    parser.add_argument('--appends', type=int, default=250, help='Bars appended one at a time')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    days = args.years * 252
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, (days, args.tickers)), axis=0))
+    high = close * (1 + rng.uniform(0, 0.02, close.shape))
+    low = close * (1 - rng.uniform(0, 0.02, close.shape))
+
+    start = time.perf_counter()
+    compute_indicators(close, high, low)
+    batch_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(args.tickers):
+        compute_indicators(close[:, i], high[:, i], low[:, i])
+    loop_time = time.perf_counter() - start
+
+    print(f'{args.tickers} tickers x {days} days')
+    print(f'  matrix:        {batch_time * 1000:8.1f}ms')
+    print(f'  ticker loop:   {loop_time * 1000:8.1f}ms ({loop_time / batch_time:.1f}x slower)')
+
+    dates = np.datetime64('2010-01-01') + np.arange(days)
+    history = days - args.appends
+    series = PriceSeries()
+    series.merge(dates[:history], high[:history, 0], low[:history, 0], close[:history, 0])
+    start = time.perf_counter()
+    for i in range(history, days):
+        series.merge(dates[i:i + 1], high[i:i + 1, 0], low[i:i + 1, 0], close[i:i + 1, 0])
+    append_time = (time.perf_counter() - start) / args.appends
+
+    start = time.perf_counter()
+    compute_indicators(close[:, 0], high[:, 0], low[:, 0])
+    full_time = time.perf_counter() - start
+
+    print(f'\nOne ticker, {days} bars')
+    print(f'  append 1 bar:  {append_time * 1e6:8.1f}us')
+    print(f'  full recompute:{full_time * 1e6:8.1f}us ({full_time / append_time:.0f}x slower)')
+
+
+if __name__ == '__main__':
+    main()
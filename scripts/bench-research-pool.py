@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-request overhead: subprocess-per-request vs pre-warmed worker pool.
+
+Both paths carry the same realistic research result back to the caller, so the
+difference is pure dispatch overhead (interpreter startup, dotenv loading,
+module imports and stdout JSON parsing vs a pipe round-trip to a warm worker).
+No Tavily or LLM calls are made.
+
+Usage: python scripts/bench-research-pool.py [--requests 20]
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+execution_dir = os.path.join(project_root, 'execution')
+sys.path.insert(0, execution_dir)
+
+from research_pool import ResearchWorkerPool
+
+
+def sample_result() -> dict:
+    """A research result of realistic size (6 buckets x 5 signals, 15 ratings)."""
+    signals = {
+        bucket: [
+            {
+                'source_url': f'https://example.com/{bucket}/{i}',
+                'snippet': 'Lorem ipsum dolor sit amet, consectetur adipiscing elit. ' * 8,
+                'title': f'{bucket} article {i}',
+                'score': 0.8,
+                'stakeholder_type': bucket,
+                'tags': [bucket],
+            }
+            for i in range(5)
+        ]
+        for bucket in ['customers', 'employees', 'competitors', 'suppliers', 'innovation', 'risks']
+    }
+    ratings = [
+        {
+            'criterionId': criterion_id,
+            'rating': 4,
+            'justification': 'Strong evidence from multiple stakeholder groups. ' * 3,
+            'keyFindings': ['Finding one', 'Finding two', 'Finding three'],
+            'sources': [f'https://example.com/source/{i}' for i in range(10)],
+            'confidence': 'medium',
+        }
+        for criterion_id in range(1, 16)
+    ]
+    return {'company': 'Apple Inc.', 'ticker': 'AAPL', 'signals': signals, 'analysis': {'ratings': ratings}}
+
+
+def bench_subprocess(payload: str, requests: int) -> list:
+    """Old path: new interpreter per request, load dotenv + orchestrator imports, JSON over stdout."""
+    code = (
+        'import sys, json; '
+        f'sys.path.insert(0, {execution_dir!r}); '
+        'from dotenv import load_dotenv; load_dotenv(); '
+        'import run_scuttlebutt_company; '
+        'sys.stdout.write(sys.stdin.read())'
+    )
+    timings = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        process = subprocess.run(
+            [sys.executable, '-c', code],
+            input=payload,
+            capture_output=True,
+            text=True,
+            cwd=project_root
+        )
+        if process.returncode != 0:
+            raise RuntimeError(process.stderr)
+        json.loads(process.stdout)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def bench_pool(payload: str, requests: int) -> list:
+    """New path: warm worker, arguments and result passed over a pipe."""
+    pool = ResearchWorkerPool(size=1, target='json:loads')
+    pool.start()
+    timings = []
+    try:
+        for _ in range(requests):
+            start = time.perf_counter()
+            pool.run(s=payload)
+            timings.append(time.perf_counter() - start)
+    finally:
+        pool.shutdown()
+    return timings
+
+
+def report(label: str, timings: list) -> None:
+    timings_ms = sorted(t * 1000 for t in timings)
+    p95 = timings_ms[int(len(timings_ms) * 0.95) - 1]
+    print(f'{label:<12} median {statistics.median(timings_ms):9.2f} ms   p95 {p95:9.2f} ms')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark research dispatch overhead')
+    parser.add_argument('--requests', type=int, default=20, help='Requests per path (default: 20)')
+    args = parser.parse_args()
+
+    payload = json.dumps(sample_result())
+    print(f'Result payload: {len(payload) / 1024:.1f} KB, {args.requests} requests per path\n')
+
+    subprocess_timings = bench_subprocess(payload, args.requests)
+    pool_timings = bench_pool(payload, args.requests)
+
+    report('subprocess', subprocess_timings)
+    report('pool', pool_timings)
+    saved = statistics.median(subprocess_timings) - statistics.median(pool_timings)
+    print(f'\nPer-request overhead removed: {saved * 1000:.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
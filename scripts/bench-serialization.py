@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Benchmark response serialization paths.
+
+Times the CPU cost of producing one research response (CriterionRating
+records) and one bulk valuation response at 15, 1k and 10k records through a
+real FastAPI app, comparing:
+
+    pydantic   models built per record + response_model validation + default JSON encoder (previous routes)
+    fast       what the routes do now. Valuation: backend.responses.respond with the trusted
+               dicts serialized once (orjson when installed). Research: LLM ratings are always
+               checked, so validate_research_response (model_validate + model_dump) runs first,
+               then respond(strict=False)
+    strict     respond(..., strict=True): one TypeAdapter validation pass, then the fast encoder
+               (valuation with STRICT_RESPONSE_VALIDATION on; research routes never validate twice)
+
+Usage: python scripts/bench-serialization.py [--sizes 15,1000,10000]
+"""
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from fastapi import FastAPI
+
+from backend.responses import orjson, respond
+from backend.routes.fisher import CriterionRating, FisherResearchResponse, validate_research_response
+from backend.routes.valuation import ValuationResponse, ValuationResult
+
+records = {}
+
+
+def build_records(n: int) -> dict:
+    ratings = [
+        {
+            'criterionId': 1 + i % 15,
+            'rating': 1 + i % 5,
+            'justification': f'Justification for record {i} based on stakeholder signals.',
+            'keyFindings': [f'Finding {j}' for j in range(3)],
+            'sources': [f'https://example.com/{i}/{j}' for j in range(3)],
+            'confidence': 'medium',
+        }
+        for i in range(n)
+    ]
+    valuations = [
+        {
+            'symbol': f'T{i}', 'scenario': 0, 'growthRate': 12.5, 'marr': 0.15, 'years': 10.0,
+            'stickerPrice': 123.456 + i, 'mosPrice': 61.728 + i, 'signal': 'WAIT',
+        }
+        for i in range(n)
+    ]
+    return {'ratings': ratings, 'valuations': valuations}
+
+
+def research_payload(n: int) -> dict:
+    return {
+        'symbol': 'BENCH', 'ratings': records[n]['ratings'], 'researchDate': '2024-01-01T00:00:00',
+        'modelUsed': 'bench', 'cacheStatus': 'fresh', 'resultAgeSeconds': 1.0,
+    }
+
+
+app = FastAPI()
+
+
+@app.get('/pydantic/research/{n}', response_model=FisherResearchResponse)
+async def research_pydantic(n: int):
+    payload = research_payload(n)
+    return FisherResearchResponse(**{**payload, 'ratings': [CriterionRating(**r) for r in payload['ratings']]})
+
+
+@app.get('/fast/research/{n}', response_model=FisherResearchResponse)
+async def research_fast(n: int):
+    return respond(validate_research_response(research_payload(n)), FisherResearchResponse, strict=False)
+
+
+@app.get('/strict/research/{n}', response_model=FisherResearchResponse)
+async def research_strict(n: int):
+    return respond(research_payload(n), FisherResearchResponse, strict=True)
+
+
+@app.get('/pydantic/valuation/{n}', response_model=ValuationResponse)
+async def valuation_pydantic(n: int):
+    results = [ValuationResult(**r) for r in records[n]['valuations']]
+    return ValuationResponse(results=results, count=len(results))
+
+
+@app.get('/fast/valuation/{n}', response_model=ValuationResponse)
+async def valuation_fast(n: int):
+    return respond({'results': records[n]['valuations'], 'count': n}, ValuationResponse, strict=False)
+
+
+@app.get('/strict/valuation/{n}', response_model=ValuationResponse)
+async def valuation_strict(n: int):
+    return respond({'results': records[n]['valuations'], 'count': n}, ValuationResponse, strict=True)
+
+
+async def call(path: str) -> int:
+    """Drive the ASGI app directly (no network, no test client threads)."""
+    scope = {
+        'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': 'GET',
+        'scheme': 'http', 'path': path, 'raw_path': path.encode(), 'query_string': b'',
+        'headers': [], 'server': ('bench', 80), 'client': ('bench', 1), 'root_path': '',
+    }
+    size = 0
+
+    async def receive():
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message):
+        nonlocal size
+        if message['type'] == 'http.response.body':
+            size += len(message.get('body', b''))
+
+    await app(scope, receive, send)
+    return size
+
+
+async def measure(path: str, repeat: int) -> tuple:
+    size = await call(path)  # Warm up
+    timings = []
+    for _ in range(repeat):
+        start = time.process_time()
+        await call(path)
+        timings.append(time.process_time() - start)
+    return min(timings), size
+
+
+async def main_async(sizes, repeat):
+    print(f'JSON encoder: {"orjson" if orjson is not None else "json (orjson not installed)"}\n')
+    print(f'{"payload":<12}{"records":>8}{"pydantic":>12}{"fast":>12}{"strict":>12}{"speedup":>10}{"bytes":>12}')
+    for kind in ('research', 'valuation'):
+        for n in sizes:
+            results = {}
+            for path in ('pydantic', 'fast', 'strict'):
+                results[path] = await measure(f'/{path}/{kind}/{n}', repeat)
+            p, f, s = (results[k][0] * 1000 for k in ('pydantic', 'fast', 'strict'))
+            print(f'{kind:<12}{n:>8}{p:>10.2f}ms{f:>10.2f}ms{s:>10.2f}ms{p / f:>9.1f}x{results["fast"][1]:>12}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark response serialization')
+    parser.add_argument('--sizes', default='15,1000,10000')
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(',')]
+    for n in sizes:
+        records[n] = build_records(n)
+    asyncio.run(main_async(sizes, args.repeat))
+
+
+if __name__ == '__main__':
+    main()
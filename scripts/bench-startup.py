@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Benchmark cold start: importing the app, and server launch to first served request.
+
+Each run starts a fresh interpreter. "import" is the time to import
+backend.main; "health" is from launching uvicorn to the first 200 from
+/health; "screener" is the first /screener request after that, which pays for
+loading the persisted index when it is deferred. A screener index of
+--tickers rows is seeded in a temporary directory so the deferred work is
+realistic. --preload sets PRELOAD_APP=true to compare eager startup.
+
+Usage: python scripts/bench-startup.py [--runs 5] [--tickers 5000] [--preload] [--top 10]
+"""
+
+import os
+import sys
+import time
+import socket
+import argparse
+import tempfile
+import statistics
+import subprocess
+import urllib.request
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+
+def seed_screener_index(path: str, tickers: int) -> None:
+    """Persist a screener index with synthetic fundamentals for `tickers` symbols."""
+    import numpy as np
+    from backend.services.screener import ScreenerIndex
+
+    rng = np.random.default_rng(7)
+    index = ScreenerIndex()
+    index.upsert(
+        {
+            'symbol': f'T{i:05d}',
+            'eps': float(rng.uniform(0.5, 10)),
+            'growthRate': float(rng.uniform(2, 25)),
+            'currentPrice': float(rng.uniform(10, 400)),
+            'roe': float(rng.uniform(-5, 40)),
+        }
+        for i in range(tickers)
+    )
+    index.save(path)
+
+
+def child_env(data_dir: str, preload: bool) -> dict:
+    env = dict(os.environ)
+    env['PYTHONPATH'] = project_root + os.pathsep + env.get('PYTHONPATH', '')
+    env['SCREENER_INDEX_PATH'] = os.path.join(data_dir, 'screener_index.json')
+    env['FISHER_SCORES_PATH'] = os.path.join(data_dir, 'fisher_scores.json')
+    env['RESEARCH_STORE_DIR'] = os.path.join(data_dir, 'research_store')
+    env['PRELOAD_APP'] = 'true' if preload else 'false'
+    return env
+
+
+def bench_import(env: dict) -> float:
+    code = 'import time; t = time.perf_counter(); import backend.main; print(time.perf_counter() - t)'
+    process = subprocess.run([sys.executable, '-c', code], env=env, capture_output=True, text=True, cwd=project_root)
+    if process.returncode != 0:
+        raise RuntimeError(process.stderr)
+    return float(process.stdout.strip().splitlines()[-1])
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def get(url: str) -> bool:
+    try:
+        with urllib.request.urlopen(url, timeout=5) as response:
+            response.read()
+            return response.status == 200
+    except OSError:
+        return False
+
+
+def bench_first_request(env: dict) -> tuple:
+    """Seconds from launching uvicorn to the first /health 200, then the first /screener."""
+    port = free_port()
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'uvicorn', 'backend.main:app', '--port', str(port), '--log-level', 'warning'],
+        env=env,
+        cwd=project_root,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    try:
+        while not get(f'http://127.0.0.1:{port}/health'):
+            if server.poll() is not None:
+                raise RuntimeError('uvicorn exited during startup')
+            if time.perf_counter() - start > 60:
+                raise RuntimeError('uvicorn did not start within 60 s')
+            time.sleep(0.005)
+        health = time.perf_counter() - start
+
+        screener_start = time.perf_counter()
+        get(f'http://127.0.0.1:{port}/screener?limit=10')
+        screener = time.perf_counter() - screener_start
+    finally:
+        server.terminate()
+        server.wait()
+    return health, screener
+
+
+def top_imports(env: dict, top: int) -> list:
+    """Slowest modules imported directly by backend.main and its routes (cumulative us)."""
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import backend.main'],
+        env=env, capture_output=True, text=True, cwd=project_root
+    )
+    rows = []
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line.split('|')
+        if cumulative.strip().isdigit() and len(name) - len(name.lstrip()) <= 3:
+            rows.append((int(cumulative), name.strip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def report(label: str, timings: list) -> None:
+    timings_ms = [t * 1000 for t in timings]
+    print(f'{label:<10} median {statistics.median(timings_ms):8.1f} ms   min {min(timings_ms):8.1f} ms')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark app cold start')
+    parser.add_argument('--runs', type=int, default=5, help='Fresh processes per measurement (default: 5)')
+    parser.add_argument('--tickers', type=int, default=5000, help='Screener index rows to seed (default: 5000)')
+    parser.add_argument('--preload', action='store_true', help='Start with PRELOAD_APP=true')
+    parser.add_argument('--top', type=int, default=10, help='Slowest top-level imports to list (default: 10)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        seed_screener_index(os.path.join(data_dir, 'screener_index.json'), args.tickers)
+        env = child_env(data_dir, args.preload)
+        mode = 'preload' if args.preload else 'lazy'
+        print(f'Mode: {mode}, {args.tickers} screener tickers, {args.runs} runs\n')
+
+        report('import', [bench_import(env) for _ in range(args.runs)])
+        first_requests = [bench_first_request(env) for _ in range(args.runs)]
+        report('health', [health for health, _ in first_requests])
+        report('screener', [screener for _, screener in first_requests])
+
+        if args.top:
+            print('\nSlowest top-level imports (cumulative):')
+            for cumulative, name in top_imports(env, args.top):
+                print(f'  {cumulative / 1000:8.1f} ms  {name}')
+
+
+if __name__ == '__main__':
+    main()
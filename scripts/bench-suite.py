@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+Offline microbenchmark suite for hot paths, with baseline regression checks.
+
+Every benchmark runs on synthetic fixtures of realistic size (a 15-year SEC
+companyconcept, six stakeholder buckets of Tavily results, 15 LLM ratings),
+so no network access or API keys are needed.
+
+Each benchmark is calibrated to a loop count taking about --sample-ms, then
+timed for --samples samples (seconds per call). Results are written to
+--output. With a baseline present, each benchmark is compared against it and
+reported as a regression when its median is more than --threshold slower AND
+a one-sided Mann-Whitney U test says the slowdown is significant at --alpha;
+the script then exits with status 1.
+
+Usage:
+    python scripts/bench-suite.py --save-baseline        # on the reference commit
+    python scripts/bench-suite.py                        # later: compare against it
+    python scripts/bench-suite.py --filter parse --samples 30
+"""
+
+import os
+import gc
+import sys
+import json
+import math
+import time
+import random
+import argparse
+import platform
+import statistics
+from datetime import datetime
+from typing import Callable, Dict, List
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+execution_dir = os.path.join(project_root, 'execution')
+sys.path.insert(0, project_root)
+sys.path.insert(0, execution_dir)
+
+from backend.responses import respond
+from backend.routes.fisher import FisherResearchResponse
+from backend.services import sec_edgar
+from ollama_scuttlebutt_analysis import build_user_prompt, parse_ollama_response
+from openrouter_scuttlebutt_analysis import build_analysis_prompt, parse_openrouter_response
+from tavily_scuttlebutt import STAKEHOLDER_QUERIES, dedupe_results
+
+DEFAULT_OUTPUT = os.path.join(project_root, '.tmp', 'bench', 'results.json')
+DEFAULT_BASELINE = os.path.join(project_root, '.tmp', 'bench', 'baseline.json')
+
+BENCHMARKS: Dict[str, Callable[[], Callable[[], object]]] = {}
+
+
+def benchmark(name: str):
+    """Register a factory that builds fixtures and returns the zero-argument call to time."""
+    def register(factory):
+        BENCHMARKS[name] = factory
+        return factory
+    return register
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+
+def companyconcept(years: int = 15, seed: int = 1) -> dict:
+    """NetIncomeLoss-like concept: 10-Q and 10-K facts, each restated in the next two filings."""
+    rng = random.Random(seed)
+    facts = []
+    for year in range(2010, 2010 + years):
+        for quarter, end in enumerate(['03-31', '06-30', '09-30', '12-31'], start=1):
+            form = '10-K' if quarter == 4 else '10-Q'
+            val = rng.randint(10 ** 8, 10 ** 10)
+            for restatement in range(3):
+                facts.append({
+                    'start': f'{year}-01-01' if form == '10-K' else f'{year}-{end[:2]}-01',
+                    'end': f'{year}-{end}',
+                    'val': val + restatement * 1000,
+                    'accn': f'0000320193-{year + restatement}-{quarter:06d}',
+                    'fy': year + restatement,
+                    'fp': 'FY' if form == '10-K' else f'Q{quarter}',
+                    'form': form,
+                    'filed': f'{year + restatement + (1 if quarter == 4 else 0)}-{"02" if quarter == 4 else end[:2]}-15',
+                })
+    rng.shuffle(facts)
+    return {'cik': 320193, 'taxonomy': 'us-gaap', 'tag': 'NetIncomeLoss', 'units': {'USD': facts}}
+
+
+def signals(per_bucket: int = 5) -> dict:
+    """Deduplicated stakeholder signals as stored in a research result."""
+    return {
+        bucket: [
+            {
+                'source_url': f'https://example.com/{bucket}/{i}',
+                'snippet': f'{bucket.capitalize()} commentary {i}: ' + 'Lorem ipsum dolor sit amet, consectetur adipiscing elit. ' * 6,
+                'title': f'{bucket} article {i}',
+                'score': 0.9 - i * 0.05,
+                'stakeholder_type': bucket,
+                'tags': [bucket],
+            }
+            for i in range(per_bucket)
+        ]
+        for bucket in STAKEHOLDER_QUERIES
+    }
+
+
+def raw_bucket_results(queries: int = 3, per_query: int = 5, overlap: float = 0.4, seed: int = 2) -> List[dict]:
+    """Undeduplicated results of one bucket's queries; about `overlap` of URLs repeat."""
+    rng = random.Random(seed)
+    pool = max(int(queries * per_query * (1 - overlap)), 1)
+    results = [{'source_url': '', 'snippet': 'Tavily Summary', 'title': 'Tavily Summary', 'score': 1.0}]
+    for _ in range(queries * per_query):
+        i = rng.randrange(pool)
+        results.append({'source_url': f'https://example.com/article/{i}', 'snippet': 'x' * 400, 'title': f'Article {i}', 'score': 0.5})
+    return results
+
+
+def ratings(n: int = 15) -> List[dict]:
+    return [
+        {
+            'criterionId': i,
+            'rating': 1 + i % 5,
+            'justification': 'Multiple stakeholder groups report consistent evidence for this criterion. ' * 2,
+            'keyFindings': ['Finding one', 'Finding two', 'Finding three'],
+            'sources': [f'https://example.com/source/{i}/{j}' for j in range(3)],
+            'confidence': 'medium',
+        }
+        for i in range(1, n + 1)
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Benchmarks
+
+@benchmark('sec.extract_latest_value')
+def bench_extract_latest_value():
+    concept = companyconcept()
+    return lambda: sec_edgar.extract_latest_value(concept, 'USD')
+
+
+@benchmark('sec.extract_latest_value.as_of')
+def bench_extract_latest_value_as_of():
+    concept = companyconcept()
+    return lambda: sec_edgar.extract_latest_value(concept, 'USD', as_of='2018-06-30')
+
+
+@benchmark('sec.cik_lookup')
+def bench_cik_lookup():
+    symbol = next(iter(sec_edgar.load_cik_mapping()))  # Cached symbols only: no network
+    return lambda: sec_edgar.get_cik_from_symbol(symbol)
+
+
+@benchmark('openrouter.build_analysis_prompt')
+def bench_build_analysis_prompt():
+    data = {'signals': signals(), 'companyName': 'Apple Inc.', 'ticker': 'AAPL', 'researchDate': '2024-01-01'}
+    return lambda: build_analysis_prompt(data)
+
+
+@benchmark('ollama.build_user_prompt')
+def bench_build_user_prompt():
+    data = signals()
+    return lambda: build_user_prompt('Apple Inc.', 'AAPL', data)
+
+
+@benchmark('ollama.parse_response.json')
+def bench_parse_ollama_json():
+    text = json.dumps({'ratings': ratings()})
+    return lambda: parse_ollama_response(text)
+
+
+@benchmark('ollama.parse_response.fenced')
+def bench_parse_ollama_fenced():
+    text = 'Here is my analysis of the company:\n\n```json\n' + json.dumps({'ratings': ratings()}, indent=2) + '\n```\nLet me know if you need more.'
+    return lambda: parse_ollama_response(text)
+
+
+@benchmark('openrouter.parse_response')
+def bench_parse_openrouter():
+    data = {'signals': signals(), 'criteria': list(range(1, 16))}
+    response = {'choices': [{'message': {'content': json.dumps({'ratings': ratings()})}}]}
+    return lambda: parse_openrouter_response(response, data)
+
+
+@benchmark('tavily.dedupe_bucket')
+def bench_dedupe_bucket():
+    results = raw_bucket_results()
+    return lambda: dedupe_results(results)[:5]
+
+
+@benchmark('tavily.dedupe_all_buckets')
+def bench_dedupe_all_buckets():
+    buckets = {bucket: raw_bucket_results(seed=i) for i, bucket in enumerate(STAKEHOLDER_QUERIES)}
+    return lambda: {bucket: dedupe_results(results)[:5] for bucket, results in buckets.items()}
+
+
+@benchmark('route.fisher_research.respond')
+def bench_research_respond():
+    payload = {
+        'symbol': 'AAPL', 'ratings': ratings(), 'researchDate': '2024-01-01T00:00:00',
+        'modelUsed': 'openrouter-openai/gpt-4o-mini', 'cacheStatus': 'fresh', 'resultAgeSeconds': 12.5,
+    }
+    return lambda: respond(payload, FisherResearchResponse).body
+
+
+@benchmark('route.fisher_research.respond_strict')
+def bench_research_respond_strict():
+    payload = {
+        'symbol': 'AAPL', 'ratings': ratings(), 'researchDate': '2024-01-01T00:00:00',
+        'modelUsed': 'openrouter-openai/gpt-4o-mini', 'cacheStatus': 'fresh', 'resultAgeSeconds': 12.5,
+    }
+    return lambda: respond(payload, FisherResearchResponse, strict=True).body
+
+
+@benchmark('route.screener.respond_1k')
+def bench_screener_respond():
+    payload = {
+        'results': [
+            {
+                'symbol': f'T{i:04d}', 'eps': 3.2, 'growthRate': 12.5, 'currentPrice': 120.0 + i, 'roe': 18.0,
+                'stickerPrice': 210.5 + i, 'mosPrice': 105.25 + i, 'discountToMos': -0.12, 'signal': 'WAIT',
+            }
+            for i in range(1000)
+        ],
+        'total': 1000,
+    }
+    return lambda: respond(payload).body
+
+
+# ---------------------------------------------------------------------------
+# Measurement and comparison
+
+def calibrate(func: Callable[[], object], sample_ms: float) -> int:
+    """Loop count whose total run time is at least sample_ms."""
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        if (time.perf_counter() - start) * 1000 >= sample_ms or loops >= 10 ** 7:
+            return loops
+        loops *= 2
+
+
+def measure(func: Callable[[], object], samples: int, sample_ms: float) -> Dict:
+    func()  # Warm caches (regex compilation, TypeAdapter construction, ...)
+    loops = calibrate(func, sample_ms)
+    timings = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(samples):
+            start = time.perf_counter()
+            for _ in range(loops):
+                func()
+            timings.append((time.perf_counter() - start) / loops)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return {'loops': loops, 'samples': timings, 'median': statistics.median(timings)}
+
+
+def mann_whitney_greater(current: List[float], baseline: List[float]) -> float:
+    """
+    One-sided p-value that `current` tends to be larger than `baseline`.
+
+    Normal approximation to the Mann-Whitney U distribution with tie
+    correction and continuity correction (fine for 10+ samples per side).
+    """
+    n1, n2 = len(current), len(baseline)
+    combined = sorted([(v, 0) for v in current] + [(v, 1) for v in baseline])
+    ranks = [0.0] * len(combined)
+    tie_term = 0.0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        t = j - i + 1
+        tie_term += t ** 3 - t
+        i = j + 1
+
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, combined) if group == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return 1 - statistics.NormalDist().cdf(z)
+
+
+def compare(results: Dict, baseline: Dict, threshold: float, alpha: float) -> List[str]:
+    """Print a comparison table and return the names of significant regressions."""
+    regressions = []
+    print(f'\n{"benchmark":<38} {"baseline":>11} {"current":>11} {"change":>8} {"p":>8}')
+    for name, current in results['results'].items():
+        base = baseline['results'].get(name)
+        if base is None:
+            print(f'{name:<38} {"-":>11} {current["median"] * 1e6:9.2f}us {"new":>8}')
+            continue
+        change = current['median'] / base['median'] - 1
+        p = mann_whitney_greater(current['samples'], base['samples'])
+        regressed = change > threshold and p < alpha
+        if regressed:
+            regressions.append(name)
+        flag = '  REGRESSION' if regressed else ''
+        print(f'{name:<38} {base["median"] * 1e6:9.2f}us {current["median"] * 1e6:9.2f}us {change:+7.1%} {p:8.4f}{flag}')
+    return regressions
+
+
+def write_json(path: str, data: Dict) -> None:
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Offline hot-path benchmark suite')
+    parser.add_argument('--filter', default='', help='Only run benchmarks whose name contains this')
+    parser.add_argument('--samples', type=int, default=20, help='Timed samples per benchmark (default: 20)')
+    parser.add_argument('--sample-ms', type=float, default=20, help='Target duration of one sample (default: 20)')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='Where to write this run\'s results')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='Baseline results to compare against')
+    parser.add_argument('--save-baseline', action='store_true', help='Store this run as the new baseline')
+    parser.add_argument('--threshold', type=float, default=0.10, help='Minimum median slowdown to flag (default: 0.10)')
+    parser.add_argument('--alpha', type=float, default=0.01, help='Significance level (default: 0.01)')
+    parser.add_argument('--list', action='store_true', help='List benchmark names and exit')
+    args = parser.parse_args()
+
+    names = [name for name in BENCHMARKS if args.filter in name]
+    if args.list:
+        print('\n'.join(names))
+        return
+
+    results = {
+        'meta': {
+            'date': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'samples': args.samples,
+            'sampleMs': args.sample_ms,
+        },
+        'results': {},
+    }
+    print(f'{len(names)} benchmarks, {args.samples} samples of ~{args.sample_ms:g} ms each\n')
+    for name in names:
+        result = measure(BENCHMARKS[name](), args.samples, args.sample_ms)
+        results['results'][name] = result
+        spread = statistics.stdev(result['samples']) / result['median'] if len(result['samples']) > 1 else 0.0
+        print(f'{name:<38} {result["median"] * 1e6:10.2f} us/call  (+/-{spread:.1%}, {result["loops"]} loops)')
+
+    write_json(args.output, results)
+    print(f'\nResults written to {args.output}')
+
+    if args.save_baseline:
+        write_json(args.baseline, results)
+        print(f'Baseline saved to {args.baseline}')
+        return
+
+    if not os.path.exists(args.baseline):
+        print('No baseline yet; run with --save-baseline to create one.')
+        return
+    with open(args.baseline, 'r') as f:
+        baseline = json.load(f)
+    if baseline.get('meta', {}).get('python') != results['meta']['python']:
+        print(f'Warning: baseline was recorded with Python {baseline["meta"].get("python")}')
+
+    regressions = compare(results, baseline, args.threshold, args.alpha)
+    if regressions:
+        print(f'\n{len(regressions)} significant regression(s): {", ".join(regressions)}')
+        sys.exit(1)
+    print('\nNo significant regressions.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark the vectorized Rule #1 valuation engine.
+
+Checks that backend.services.valuation matches a scalar port of
+src/utils/calculations.ts exactly, then reports per-ticker cost for the
+vectorized path vs a per-stock Python loop, and the cost of one Monte Carlo
+sensitivity run.
+
+Usage: python scripts/bench-valuation.py [--tickers 10000] [--scenarios 9] [--samples 20000]
+"""
+
+import os
+import sys
+import math
+import time
+import argparse
+import numpy as np
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from backend.services.valuation import evaluate_universe
+from backend.services.monte_carlo import simulate
+
+
+def ts_sticker_price(eps: float, growth_rate: float, years: float = 10, marr: float = 0.15) -> float:
+    """Line-for-line port of calculateStickerPrice (calculations.ts)."""
+    growth_decimal = growth_rate / 100
+    try:
+        future_eps = eps * math.pow(1 + growth_decimal, years)
+    except ValueError:
+        return math.nan  # Math.pow of a negative base with fractional exponent
+    future_pe = min(max(2 * growth_rate, 8), 25)
+    sticker = future_eps * future_pe / math.pow(1 + marr, years)
+    return max(sticker, 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark vectorized valuation')
+    parser.add_argument('--tickers', type=int, default=10000)
+    parser.add_argument('--scenarios', type=int, default=9)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--samples', type=int, default=20000, help='Monte Carlo samples per ticker')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    n, s = args.tickers, args.scenarios
+    eps = rng.uniform(-2, 15, n)
+    growth = rng.uniform(-20, 40, n)
+    price = rng.uniform(5, 500, n)
+    scenario_growth = np.where(np.arange(s) == 0, np.nan, rng.uniform(0, 30, s))
+    scenario_marr = rng.choice([0.10, 0.12, 0.15], s)
+    scenario_years = rng.choice([5, 10, 15], s).astype(float)
+
+    def vectorized():
+        return evaluate_universe(eps, growth, price, scenario_growth, scenario_marr, scenario_years)
+
+    def scalar():
+        out = np.empty((n, s))
+        for i in range(n):
+            for j in range(s):
+                g = growth[i] if math.isnan(scenario_growth[j]) else scenario_growth[j]
+                out[i, j] = ts_sticker_price(eps[i], g, scenario_years[j], scenario_marr[j])
+        return out
+
+    values = vectorized()
+    expected = scalar()
+    assert np.allclose(values['stickerPrice'], expected, rtol=1e-12, atol=0, equal_nan=True), 'Mismatch vs TS formula'
+    expected_signal = np.where(price[:, None] <= expected * 0.5, 'BUY', 'WAIT')
+    assert (values['signal'] == expected_signal).all(), 'Signal mismatch vs TS formula'
+    print(f'Matches calculations.ts on {n} tickers x {s} scenarios (incl. PE clamp 8-25)\n')
+
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        vectorized()
+        timings.append(time.perf_counter() - start)
+    vector_time = min(timings)
+
+    start = time.perf_counter()
+    scalar()
+    scalar_time = time.perf_counter() - start
+
+    print(f'{"path":<12}{"total":>12}{"per ticker":>16}{"per valuation":>18}')
+    for label, total in [('vectorized', vector_time), ('scalar loop', scalar_time)]:
+        print(f'{label:<12}{total * 1000:>10.2f}ms{total / n * 1e6:>13.3f} us{total / (n * s) * 1e6:>15.4f} us')
+    print(f'\nSpeedup: {scalar_time / vector_time:.0f}x')
+
+    timings = []
+    for seed in range(args.repeat):
+        start = time.perf_counter()
+        simulate(
+            eps=5.0,
+            growth_rate={'kind': 'triangular', 'low': 5, 'mode': 12, 'high': 20},
+            marr={'kind': 'uniform', 'low': 0.10, 'high': 0.15},
+            future_pe={'kind': 'normal', 'mean': 18, 'std': 3},
+            current_price=40.0,
+            samples=args.samples,
+            seed=seed,
+        )
+        timings.append(time.perf_counter() - start)
+    print(f'\nMonte Carlo: {args.samples} samples + 5x5 sensitivity grid in {min(timings) * 1000:.2f}ms per ticker')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""
+Load test the API against local stub upstreams.
+
+Starts a stub server emulating Tavily, OpenRouter, Ollama, SEC EDGAR, FMP and
+Yahoo Finance with tunable latency and error rates, starts the app under
+uvicorn pointed at it (TAVILY_API_URL, OPENROUTER_API_URL, OLLAMA_BASE_URL,
+SEC_BASE_URL, FMP_BASE_URL, YAHOO_BASE_URL), then drives it with --concurrency clients issuing a weighted mix of requests:
+
+    research  GET /fisher-research/{symbol}, over --research-symbols symbols,
+              so the first request per symbol runs the pipeline and later
+              ones are served from the (temporary) research store
+    roe       GET /fisher-research/roe/{symbol} (SEC, FMP and Yahoo raced, never cached)
+    quote     GET /quotes/{symbol} (micro-batched FMP calls, short-TTL cache)
+    fundamentals  GET /fundamentals/{symbol} (parallel FMP calls plus ROE, cached per symbol)
+    health    GET /health
+
+Each client sends its own X-Forwarded-For, so admission control treats them
+as separate users. Reports throughput, latency percentiles and error rates
+(including 429/503 load shedding) per request kind, the app's event-loop lag
+(event_loop_lag_seconds on /metrics) and mean upstream stage durations. Lag far above the stub latencies means a handler
+is blocking the event loop: every request on that worker waits behind it.
+
+Usage:
+    python scripts/loadtest-app.py --concurrency 20 --duration 30 --mix research=1,roe=3,health=6
+    python scripts/loadtest-app.py --sec-latency 0.5 --error-rate 0.05 --workers 2
+    python scripts/loadtest-app.py --mix roe=1 --sec-latency 2 --fmp-latency 0.3 --yahoo-latency 0.5
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import socket
+import asyncio
+import argparse
+import tempfile
+import subprocess
+from collections import defaultdict
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import httpx
+
+REQUEST_KINDS = ('research', 'roe', 'quote', 'fundamentals', 'health')
+
+
+# ---------------------------------------------------------------------------
+# Stub upstreams
+
+def stub_app(args):
+    """Starlette app answering like the upstream APIs, after a randomized delay."""
+    from starlette.applications import Starlette
+    from starlette.responses import JSONResponse
+    from starlette.routing import Route
+
+    calls = defaultdict(int)
+
+    async def upstream(name: str, latency: float):
+        """Wait ~latency (uniform 0.5x-1.5x); return an error response with probability --error-rate."""
+        calls[name] += 1
+        await asyncio.sleep(latency * random.uniform(0.5, 1.5))
+        if random.random() < args.error_rate:
+            calls[f'{name}.errors'] += 1
+            return JSONResponse({'error': 'stub upstream error'}, status_code=503)
+        return None
+
+    def ratings_content() -> str:
+        return json.dumps({'ratings': [
+            {
+                'criterionId': i,
+                'rating': 1 + i % 5,
+                'justification': f'Stub justification for criterion {i}.',
+                'keyFindings': [f'Stub finding {j}' for j in range(3)],
+                'confidence': 'medium',
+            }
+            for i in range(1, 16)
+        ]})
+
+    async def tavily(request):
+        error = await upstream('tavily', args.tavily_latency)
+        if error:
+            return error
+        body = await request.json()
+        key = abs(hash(body.get('query', ''))) % 10000
+        return JSONResponse({
+            'answer': 'Stub summary of search results.',
+            'results': [
+                {'url': f'https://example.com/{key}/{i}', 'title': f'Result {i}', 'content': 'Stub content. ' * 40, 'score': 0.9 - i * 0.1}
+                for i in range(body.get('max_results', 5))
+            ],
+        })
+
+    async def openrouter(request):
+        return await upstream('openrouter', args.llm_latency) or JSONResponse(
+            {'choices': [{'message': {'role': 'assistant', 'content': ratings_content()}}]}
+        )
+
+    async def ollama(request):
+        return await upstream('ollama', args.llm_latency) or JSONResponse(
+            {'message': {'role': 'assistant', 'content': ratings_content()}, 'done': True}
+        )
+
+    async def sec_concept(request):
+        error = await upstream('sec', args.sec_latency)
+        if error:
+            return error
+        tag = request.path_params['tag']
+        val = 25 * 10 ** 9 if tag.startswith('NetIncome') else 100 * 10 ** 9
+        facts = [
+            {'end': f'{year}-12-31', 'val': val + year, 'form': '10-K', 'fy': year, 'fp': 'FY', 'filed': f'{year + 1}-02-15'}
+            for year in range(2015, 2025)
+        ]
+        return JSONResponse({'cik': request.path_params['cik'], 'taxonomy': 'us-gaap', 'tag': tag, 'units': {'USD': facts}})
+
+    async def sec_tickers(request):
+        return await upstream('sec', args.sec_latency) or JSONResponse({})
+
+    async def fmp_key_metrics(request):
+        return await upstream('fmp', args.fmp_latency) or JSONResponse(
+            [{'symbol': request.query_params.get('symbol'), 'returnOnEquityTTM': 0.25, 'currentRatioTTM': 1.4}]
+        )
+
+    async def fmp_ratios(request):
+        return await upstream('fmp.ratios', args.fmp_latency) or JSONResponse(
+            [{'symbol': request.query_params.get('symbol'), 'netIncomePerShareTTM': 6.1,
+              'priceToEarningsRatioTTM': 28.5, 'debtToEquityRatioTTM': 1.7}]
+        )
+
+    async def fmp_income_statement(request):
+        return await upstream('fmp.income', args.fmp_latency) or JSONResponse([
+            {'date': f'{year}-12-31', 'period': 'FY', 'eps': 4.0 + (year - 2020) * 0.5, 'revenue': 300e9 + (year - 2020) * 20e9}
+            for year in range(2024, 2019, -1)
+        ])
+
+    async def fmp_profile(request):
+        symbol = request.query_params.get('symbol')
+        return await upstream('fmp.profile', args.fmp_latency) or JSONResponse([{'symbol': symbol, 'companyName': f'{symbol} Inc.'}])
+
+    async def fmp_batch_quote(request):
+        error = await upstream('fmp.quote', args.fmp_latency)
+        if error:
+            return error
+        symbols = [s for s in request.query_params.get('symbols', '').split(',') if s]
+        return JSONResponse([{'symbol': s, 'price': 100.0 + len(s), 'change': 0.5, 'volume': 1000000} for s in symbols])
+
+    async def yahoo_quote_summary(request):
+        return await upstream('yahoo', args.yahoo_latency) or JSONResponse(
+            {'quoteSummary': {'result': [{'financialData': {'returnOnEquity': {'raw': 0.25, 'fmt': '25.00%'}}}], 'error': None}}
+        )
+
+    async def stats(request):
+        return JSONResponse(dict(calls))
+
+    return Starlette(routes=[
+        Route('/search', tavily, methods=['POST']),
+        Route('/api/v1/chat/completions', openrouter, methods=['POST']),
+        Route('/api/chat', ollama, methods=['POST']),
+        Route('/api/xbrl/companyconcept/CIK{cik}/us-gaap/{tag}.json', sec_concept),
+        Route('/files/company_tickers.json', sec_tickers),
+        Route('/fmp/key-metrics-ttm', fmp_key_metrics),
+        Route('/fmp/batch-quote', fmp_batch_quote),
+        Route('/fmp/ratios-ttm', fmp_ratios),
+        Route('/fmp/income-statement', fmp_income_statement),
+        Route('/fmp/profile', fmp_profile),
+        Route('/v10/finance/quoteSummary/{symbol}', yahoo_quote_summary),
+        Route('/stats', stats),
+    ])
+
+
+def serve_stubs(args) -> None:
+    import uvicorn
+    uvicorn.run(stub_app(args), host='127.0.0.1', port=args.stub_port, log_level='warning')
+
+
+# ---------------------------------------------------------------------------
+# Processes
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def wait_until_up(url: str, process: subprocess.Popen, timeout: float = 60) -> None:
+    start = time.perf_counter()
+    while True:
+        try:
+            if httpx.get(url, timeout=2).status_code < 500:
+                return
+        except httpx.HTTPError:
+            pass
+        if process.poll() is not None:
+            raise RuntimeError(f'{url}: process exited during startup')
+        if time.perf_counter() - start > timeout:
+            raise RuntimeError(f'{url}: not up within {timeout:.0f} s')
+        time.sleep(0.05)
+
+
+def start_stubs(args) -> subprocess.Popen:
+    command = [
+        sys.executable, os.path.abspath(__file__), '--serve-stubs', '--stub-port', str(args.stub_port),
+        '--tavily-latency', str(args.tavily_latency), '--llm-latency', str(args.llm_latency),
+        '--sec-latency', str(args.sec_latency), '--fmp-latency', str(args.fmp_latency),
+        '--yahoo-latency', str(args.yahoo_latency), '--error-rate', str(args.error_rate),
+    ]
+    return subprocess.Popen(command, cwd=project_root)
+
+
+def start_app(args, data_dir: str) -> subprocess.Popen:
+    stub_url = f'http://127.0.0.1:{args.stub_port}'
+    env = dict(os.environ)
+    env.update({
+        'PYTHONPATH': project_root + os.pathsep + env.get('PYTHONPATH', ''),
+        'TAVILY_API_URL': f'{stub_url}/search',
+        'TAVILY_API_KEY': 'stub',
+        'OPENROUTER_API_URL': f'{stub_url}/api/v1/chat/completions',
+        'OPENROUTER_API_KEY': 'stub',
+        'OLLAMA_BASE_URL': stub_url,
+        'SEC_BASE_URL': stub_url,
+        'FMP_BASE_URL': f'{stub_url}/fmp',
+        'FMP_API_KEY': 'stub',
+        'YAHOO_BASE_URL': stub_url,
+        'RESEARCH_STORE_DIR': os.path.join(data_dir, 'research_store'),
+        'SCREENER_INDEX_PATH': os.path.join(data_dir, 'screener_index.json'),
+        'FISHER_SCORES_PATH': os.path.join(data_dir, 'fisher_scores.json'),
+        'TRACE_EXPORT_PATH': '',
+        'ADMISSION_CLIENT_HEADER': 'x-forwarded-for',  # Each simulated client gets its own address
+    })
+    command = [
+        sys.executable, '-m', 'uvicorn', 'backend.main:app', '--port', str(args.port),
+        '--workers', str(args.workers), '--log-level', 'warning',
+    ]
+    # The app logs every request; keep its output out of the report
+    return subprocess.Popen(command, env=env, cwd=project_root, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+# ---------------------------------------------------------------------------
+# Load generation
+
+def parse_mix(mix: str) -> dict:
+    weights = {}
+    for part in mix.split(','):
+        kind, _, weight = part.partition('=')
+        if kind not in REQUEST_KINDS:
+            raise argparse.ArgumentTypeError(f'unknown request kind {kind!r} (expected one of {", ".join(REQUEST_KINDS)})')
+        weights[kind] = float(weight or 1)
+    return weights
+
+
+def roe_symbols() -> list:
+    """Symbols with a cached CIK, so ROE requests go straight to the companyconcept API."""
+    with open(os.path.join(project_root, 'backend', 'data', 'cik_mapping.json'), 'r') as f:
+        return sorted(json.load(f))
+
+
+async def run_load(client: httpx.AsyncClient, args, weights: dict) -> tuple:
+    """Closed-loop clients; returns (per-kind samples [(latency, status)], measured seconds)."""
+    kinds = list(weights)
+    cik_symbols = roe_symbols()
+    paths = {
+        'research': lambda rng: f'/fisher-research/LT{rng.randrange(args.research_symbols):04d}',
+        'roe': lambda rng: f'/fisher-research/roe/{rng.choice(cik_symbols)}',
+        'quote': lambda rng: f'/quotes/{rng.choice(cik_symbols)}',
+        'fundamentals': lambda rng: f'/fundamentals/{rng.choice(cik_symbols)}',
+        'health': lambda rng: '/health',
+    }
+    samples = defaultdict(list)
+    start = time.perf_counter()
+    measure_from = start + args.warmup
+    deadline = measure_from + args.duration
+
+    async def client_loop(seed: int):
+        rng = random.Random(seed)
+        headers = {'X-Forwarded-For': f'10.0.{seed // 256}.{seed % 256}'}
+        while time.perf_counter() < deadline:
+            kind = rng.choices(kinds, weights=[weights[k] for k in kinds])[0]
+            sent = time.perf_counter()
+            try:
+                response = await client.get(paths[kind](rng), headers=headers)
+                status = response.status_code
+            except httpx.HTTPError as e:
+                status = type(e).__name__
+            if sent >= measure_from:
+                samples[kind].append((time.perf_counter() - sent, status))
+
+    await asyncio.gather(*(client_loop(i) for i in range(args.concurrency)))
+    return samples, time.perf_counter() - measure_from
+
+
+def percentile(sorted_values: list, q: float) -> float:
+    return sorted_values[min(int(len(sorted_values) * q), len(sorted_values) - 1)]
+
+
+def parse_metrics(text: str) -> dict:
+    """Prometheus text -> {(name, labels): value}."""
+    values = {}
+    for line in text.splitlines():
+        if not line or line.startswith('#'):
+            continue
+        series, _, value = line.rpartition(' ')
+        name, _, labels = series.partition('{')
+        values[(name, labels.rstrip('}'))] = float(value)
+    return values
+
+
+def metrics_delta(before: dict, after: dict) -> dict:
+    return {key: value - before.get(key, 0.0) for key, value in after.items()}
+
+
+def report_lag(delta: dict) -> None:
+    count = delta.get(('event_loop_lag_seconds_count', ''), 0)
+    if not count:
+        print('Event-loop lag: no samples (EVENT_LOOP_LAG_INTERVAL=0?)')
+        return
+    buckets = sorted(
+        (float(labels.split('"')[1]), cumulative)
+        for (name, labels), cumulative in delta.items()
+        if name == 'event_loop_lag_seconds_bucket'
+    )
+
+    def upper_bound(q: float) -> str:
+        for bound, cumulative in buckets:
+            if cumulative >= q * count:
+                if bound == float('inf'):
+                    return '> 30 s'
+                return f'<= {bound * 1000:.0f} ms' if bound < 1 else f'<= {bound:g} s'
+        return '?'
+
+    mean = delta[('event_loop_lag_seconds_sum', '')] / count
+    print(f'Event-loop lag ({count:.0f} samples): mean {mean * 1000:.1f} ms, '
+          f'p50 {upper_bound(0.5)}, p99 {upper_bound(0.99)}, max {upper_bound(1.0)}')
+
+
+def report_stages(delta: dict) -> None:
+    stages = []
+    for (name, labels), total in delta.items():
+        if name == 'stage_duration_seconds_sum':
+            count = delta.get(('stage_duration_seconds_count', labels), 0)
+            if count:
+                stages.append((labels.split('"')[1], count, total / count))
+    if stages:
+        print(f'\n{"stage":<22}{"calls":>8}{"mean ms":>10}')
+        for stage, count, mean in sorted(stages):
+            print(f'{stage:<22}{count:>8.0f}{mean * 1000:>10.1f}')
+
+
+async def main_async(args, weights: dict) -> None:
+    async with httpx.AsyncClient(
+        base_url=f'http://127.0.0.1:{args.port}',
+        timeout=args.timeout,
+        limits=httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    ) as client:
+        before = parse_metrics((await client.get('/metrics')).text)
+        samples, elapsed = await run_load(client, args, weights)
+        after = parse_metrics((await client.get('/metrics')).text)
+        stub_calls = httpx.get(f'http://127.0.0.1:{args.stub_port}/stats').json()
+
+    print(f'{args.concurrency} clients, {elapsed:.1f} s measured after {args.warmup:g} s warm-up, {args.workers} worker(s)\n')
+    print(f'{"kind":<13}{"requests":>9}{"req/s":>8}{"errors":>8}{"p50 ms":>10}{"p90 ms":>10}{"p99 ms":>10}{"max ms":>10}')
+    total = 0
+    for kind in REQUEST_KINDS:
+        if kind not in samples:
+            continue
+        latencies = sorted(latency * 1000 for latency, _ in samples[kind])
+        errors = sum(1 for _, status in samples[kind] if not isinstance(status, int) or status >= 400)
+        total += len(latencies)
+        print(f'{kind:<13}{len(latencies):>9}{len(latencies) / elapsed:>8.1f}{errors / len(latencies):>8.1%}'
+              f'{percentile(latencies, 0.5):>10.1f}{percentile(latencies, 0.9):>10.1f}'
+              f'{percentile(latencies, 0.99):>10.1f}{latencies[-1]:>10.1f}')
+    print(f'{"total":<13}{total:>9}{total / elapsed:>8.1f}\n')
+
+    statuses = defaultdict(int)
+    for kind_samples in samples.values():
+        for _, status in kind_samples:
+            statuses[status] += 1
+    print('Statuses: ' + ', '.join(f'{status}: {count}' for status, count in sorted(statuses.items(), key=str)))
+
+    delta = metrics_delta(before, after)
+    if args.workers > 1:
+        print('(metrics below come from whichever worker answered /metrics)')
+    report_lag(delta)
+    report_stages(delta)
+    print('\nStub upstream calls (whole run): ' + ', '.join(f'{name}: {count}' for name, count in sorted(stub_calls.items())))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test the API against stub upstreams')
+    parser.add_argument('--concurrency', type=int, default=10, help='Concurrent clients (default: 10)')
+    parser.add_argument('--duration', type=float, default=20, help='Measured seconds (default: 20)')
+    parser.add_argument('--warmup', type=float, default=3, help='Unmeasured seconds first (default: 3)')
+    parser.add_argument('--mix', type=parse_mix, default='research=1,roe=3,health=6', help='Weighted request mix (default: research=1,roe=3,health=6)')
+    parser.add_argument('--research-symbols', type=int, default=100, help='Distinct research symbols (default: 100)')
+    parser.add_argument('--workers', type=int, default=1, help='uvicorn workers (default: 1)')
+    parser.add_argument('--timeout', type=float, default=120, help='Client timeout in seconds (default: 120)')
+    parser.add_argument('--tavily-latency', type=float, default=0.3, help='Mean Tavily latency in seconds (default: 0.3)')
+    parser.add_argument('--llm-latency', type=float, default=2.0, help='Mean OpenRouter/Ollama latency in seconds (default: 2.0)')
+    parser.add_argument('--sec-latency', type=float, default=0.15, help='Mean SEC EDGAR latency in seconds (default: 0.15)')
+    parser.add_argument('--fmp-latency', type=float, default=0.25, help='Mean FMP latency in seconds (default: 0.25)')
+    parser.add_argument('--yahoo-latency', type=float, default=0.3, help='Mean Yahoo Finance latency in seconds (default: 0.3)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of upstream calls failing with 503 (default: 0)')
+    parser.add_argument('--port', type=int, default=0, help='App port (default: a free port)')
+    parser.add_argument('--stub-port', type=int, default=0, help='Stub upstream port (default: a free port)')
+    parser.add_argument('--serve-stubs', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    args.stub_port = args.stub_port or free_port()
+    if args.serve_stubs:
+        serve_stubs(args)
+        return
+    args.port = args.port or free_port()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        stubs = start_stubs(args)
+        app = None
+        try:
+            wait_until_up(f'http://127.0.0.1:{args.stub_port}/stats', stubs)
+            app = start_app(args, data_dir)
+            wait_until_up(f'http://127.0.0.1:{args.port}/health', app)
+            asyncio.run(main_async(args, args.mix))
+        finally:
+            for process in (app, stubs):
+                if process:
+                    process.terminate()
+                    process.wait()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Load test for HTTP caching and compression.
+
+Replays repeat views of a research result and an ROE-sized payload and
+reports bytes on the wire and latency for: plain 200s, compressed 200s, and
+conditional requests answered with 304.
+
+By default the app runs in-process (httpx ASGI transport) against a temporary
+research store seeded with a synthetic 15-criterion result, so no API keys or
+network are needed. Use --base-url to test a deployed server instead.
+
+Usage: python scripts/loadtest-http-cache.py [--requests 200] [--base-url URL --symbol AAPL]
+"""
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+import tempfile
+import statistics
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import httpx
+
+
+def seed_store(store_dir: str, symbol: str) -> None:
+    """Write a synthetic full research result so requests are served from the store."""
+    from backend.services.research_store import ResearchStore
+    ratings = [
+        {
+            'criterionId': i,
+            'rating': 1 + i % 5,
+            'justification': f'Synthetic justification for criterion {i}. ' * 6,
+            'keyFindings': [f'Finding {j} for criterion {i} from stakeholder interviews' for j in range(4)],
+            'sources': [f'https://example.com/{symbol.lower()}/{i}/{j}' for j in range(5)],
+            'confidence': 'medium',
+        }
+        for i in range(1, 16)
+    ]
+    ResearchStore(store_dir=store_dir).put(symbol, {
+        'symbol': symbol,
+        'ratings': ratings,
+        'researchDate': '2024-01-01T00:00:00',
+        'modelUsed': 'synthetic',
+    })
+
+
+async def run_scenario(client: httpx.AsyncClient, path: str, headers: dict, requests: int) -> dict:
+    sizes = []
+    latencies = []
+    statuses = set()
+    for _ in range(requests):
+        start = time.perf_counter()
+        response = await client.get(path, headers=headers)
+        latencies.append(time.perf_counter() - start)
+        # Bytes on the wire: the body as sent (before httpx decodes it)
+        sizes.append(len(response.content) if 'content-encoding' not in response.headers else int(response.headers['content-length']))
+        statuses.add(response.status_code)
+    return {
+        'status': ','.join(str(s) for s in sorted(statuses)),
+        'bytes': statistics.mean(sizes),
+        'p50': statistics.median(latencies) * 1000,
+        'p95': sorted(latencies)[int(len(latencies) * 0.95) - 1] * 1000,
+    }
+
+
+async def main_async(args):
+    if args.base_url:
+        client = httpx.AsyncClient(base_url=args.base_url, timeout=60)
+    else:
+        from backend.main import app
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url='http://test')
+
+    path = f'/fisher-research/{args.symbol}'
+    async with client:
+        first = await client.get(path, headers={'Accept-Encoding': 'identity'})
+        first.raise_for_status()
+        etag = first.headers.get('etag')
+        print(f'GET {path}: {len(first.content)} bytes, ETag {etag}, Cache-Control {first.headers.get("cache-control")}\n')
+
+        scenarios = [
+            ('full body', {'Accept-Encoding': 'identity'}),
+            ('gzip', {'Accept-Encoding': 'gzip'}),
+            ('br (if available)', {'Accept-Encoding': 'br, gzip'}),
+            ('If-None-Match', {'Accept-Encoding': 'br, gzip', 'If-None-Match': etag}),
+        ]
+        print(f'{"scenario":<20}{"status":>8}{"bytes":>10}{"p50 ms":>10}{"p95 ms":>10}')
+        baseline = None
+        for label, headers in scenarios:
+            result = await run_scenario(client, path, headers, args.requests)
+            baseline = baseline or result['bytes']
+            print(f'{label:<20}{result["status"]:>8}{result["bytes"]:>10.0f}{result["p50"]:>10.2f}{result["p95"]:>10.2f}'
+                  f'   ({1 - result["bytes"] / baseline:.0%} fewer bytes)')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure bandwidth and latency saved by ETags and compression')
+    parser.add_argument('--requests', type=int, default=200, help='Requests per scenario')
+    parser.add_argument('--base-url', help='Test a running server instead of the in-process app')
+    parser.add_argument('--symbol', default='DEMO')
+    args = parser.parse_args()
+
+    if not args.base_url:
+        store_dir = tempfile.mkdtemp(prefix='research_store_')
+        os.environ['RESEARCH_STORE_DIR'] = store_dir
+        seed_store(store_dir, args.symbol)
+
+    asyncio.run(main_async(args))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,6 @@
 import axios from 'axios';
 import { 
+  GeminiCriterionRating,
   GeminiResearchRequest, 
   GeminiResearchResponse
 } from '../types/fisher';
@@ -29,16 +30,13 @@ export const researchFisherCriteria = async (
     console.log(`Researching Fisher criteria for ${request.symbol} using Scuttlebutt...`);
     console.log(`Backend URL: ${SCUTTLEBUTT_API_URL}`);
     
-    const response = await axios.post(
-      `${SCUTTLEBUTT_API_URL}/fisher-research`,
+    // GET so the browser and CDN can revalidate repeat views with ETags (304, no body)
+    const response = await axios.get(
+      `${SCUTTLEBUTT_API_URL}/fisher-research/${encodeURIComponent(request.symbol)}`,
       {
-        symbol: request.symbol,
-        companyName: request.companyName,
-        criteriaToResearch: request.criteriaToResearch, // For compatibility, but we research all
-      },
-      {
-        headers: {
-          'Content-Type': 'application/json',
+        params: {
+          companyName: request.companyName,
+          criteria: request.criteriaToResearch.join(','), // Backend only researches these (empty = all qualitative criteria)
         },
         timeout: 180000, // 3 minute timeout (research can take a while)
       }
@@ -83,6 +81,65 @@ export const researchFisherCriteria = async (
   }
 };
 
+/**
+ * Progress events streamed while research runs (see GET /fisher-research/{symbol}/stream)
+ */
+export type ResearchProgressEvent =
+  | { type: 'started'; symbol: string; criteria: number[]; traceId: string }
+  | { type: 'bucket_started'; bucket: string; queries: number }
+  | { type: 'bucket_completed'; bucket: string; results: number; changed?: boolean }
+  | { type: 'analysis_started'; provider: string; criteria: number[] | null }
+  | { type: 'rating'; rating: GeminiCriterionRating }
+  | { type: 'analysis_completed'; ratings: number };
+
+const PROGRESS_EVENTS = ['started', 'bucket_started', 'bucket_completed', 'analysis_started', 'rating', 'analysis_completed'] as const;
+
+/**
+ * Research Fisher criteria over server-sent events, reporting progress as it happens.
+ *
+ * Ratings arrive one by one before the final result, and the stream's keepalives
+ * stop proxies from dropping the connection during long runs.
+ */
+export const streamFisherResearch = (
+  request: GeminiResearchRequest,
+  onProgress: (event: ResearchProgressEvent) => void
+): Promise<GeminiResearchResponse> => {
+  const params = new URLSearchParams({
+    companyName: request.companyName,
+    criteria: request.criteriaToResearch.join(','),
+  });
+  const url = `${SCUTTLEBUTT_API_URL}/fisher-research/${encodeURIComponent(request.symbol)}/stream?${params}`;
+
+  return new Promise((resolve, reject) => {
+    const source = new EventSource(url);
+
+    PROGRESS_EVENTS.forEach((type) => {
+      source.addEventListener(type, (event) => {
+        onProgress({ type, ...JSON.parse((event as MessageEvent).data) });
+      });
+    });
+
+    source.addEventListener('result', (event) => {
+      source.close();
+      const data = JSON.parse((event as MessageEvent).data);
+      resolve({
+        symbol: data.symbol || request.symbol,
+        ratings: data.ratings || [],
+        researchDate: new Date(data.researchDate || new Date().toISOString()),
+        modelUsed: data.modelUsed || 'ollama-llama3.2',
+      });
+    });
+
+    source.addEventListener('error', (event) => {
+      source.close();
+      // Server-sent 'error' events carry a detail; plain connection errors don't
+      const data = (event as MessageEvent).data;
+      const detail = data ? JSON.parse(data).detail : `Cannot connect to Scuttlebutt backend at ${SCUTTLEBUTT_API_URL}`;
+      reject(new Error(`Backend error: ${detail}`));
+    });
+  });
+};
+
 /**
  * Cache mechanism to avoid redundant API calls
  */
@@ -90,7 +147,8 @@ const CACHE_DURATION_MS = 24 * 60 * 60 * 1000; // 24 hours
 const cache = new Map<string, { data: GeminiResearchResponse; timestamp: number }>();
 
 export const getCachedOrFetchFisherData = async (
-  request: GeminiResearchRequest
+  request: GeminiResearchRequest,
+  onProgress?: (event: ResearchProgressEvent) => void
 ): Promise<GeminiResearchResponse> => {
   const cacheKey = `${request.symbol}-${request.criteriaToResearch.join(',')}`;
   const cached = cache.get(cacheKey);
@@ -100,7 +158,9 @@ export const getCachedOrFetchFisherData = async (
     return cached.data;
   }
   
-  const data = await researchFisherCriteria(request);
+  const data = onProgress && typeof EventSource !== 'undefined'
+    ? await streamFisherResearch(request, onProgress)
+    : await researchFisherCriteria(request);
   cache.set(cacheKey, { data, timestamp: Date.now() });
   
   return data;